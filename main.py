@@ -1,5 +1,58 @@
-from src.run import App
+import argparse
+import time
+from src import settings
+from src.ai.pilot import SKILL_LEVELS
+from src.utils.replay import ReplayReader
+
+def parse_args():
+    """Lê as opções de linha de comando (todas opcionais; sem elas o jogo abre normalmente)."""
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument('--seed', type=int, help="semente fixa para as partidas (reproduzíveis)")
+    parser.add_argument('--record', metavar='ARQUIVO', help="grava a partida atual em um arquivo de replay")
+    parser.add_argument('--replay', metavar='ARQUIVO', help="reproduz um replay gravado")
+    parser.add_argument('--seek', type=int, default=0, metavar='TICK', help="começa a reprodução do replay neste tick")
+    parser.add_argument('--speed', type=float, default=1, metavar='ESCALA', help="velocidade de replays e do piloto automático (ex: 0.5, 4)")
+    parser.add_argument('--headless', action='store_true', help="reproduz o replay sem janela, na velocidade máxima")
+    parser.add_argument('--autopilot', choices=list(SKILL_LEVELS), help="a nave é controlada pelo piloto automático")
+    parser.add_argument('--attract', action='store_true', help="começa no modo demonstração (útil para testes de longa duração)")
+    parser.add_argument('--leak-report', metavar='PREFIXO', help="monitora vazamentos e grava PREFIXO.csv e PREFIXO.txt ao sair")
+    parser.add_argument('--stress', action='store_true', help="começa direto no modo de estresse (benchmark)")
+    parser.add_argument('--asteroid-physics', action='store_true', help="asteroides colidem entre si (e se partem em impactos fortes)")
+    parser.add_argument('--render-scale', type=float, default=settings.RENDER_SCALE, metavar='ESCALA', help="resolução interna do jogo, fração da janela (ex: 0.5)")
+    parser.add_argument('--pipeline', action='store_true', help="simula o próximo quadro em outra thread enquanto desenha o atual")
+    parser.add_argument('--broadcast', type=int, nargs='?', const=settings.SPECTATOR_PORT, metavar='PORTA', help="transmite as partidas para espectadores (python -m src.net.spectator)")
+    parser.add_argument('--gc-log', metavar='ARQUIVO', help="grava em CSV o tempo de cada quadro e as pausas do coletor de lixo")
+    args = parser.parse_args()
+    if not settings.RENDER_SCALE_MIN <= args.render_scale <= 1:
+        parser.error(f"--render-scale deve estar entre {settings.RENDER_SCALE_MIN} e 1")
+    return args
 
 if __name__ == '__main__':
-    game_app = App()
-    game_app.run()
+    args = parse_args()
+    replay = ReplayReader(args.replay) if args.replay else None
+
+    if replay and args.headless:
+        from src.simulation import HeadlessApp, Simulation, init_headless, play_replay_headless
+        from src.utils.asset_loader import load_all_assets
+        init_headless()
+        assets = load_all_assets(load_sounds=False)
+        if args.seek:
+            # Apenas posiciona a simulação no tick pedido e mostra o estado encontrado.
+            sim = Simulation(assets, HeadlessApp(replay.difficulty_key, overrides=replay.overrides), seed=replay.seed)
+            start = time.perf_counter()
+            replay.seek(sim, args.seek)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"Tick: {sim.tick}  Score: {sim.state.score}  Vidas: {sim.state.lives}  "
+                  f"Asteroides: {len(sim.state.asteroids)}  (seek em {elapsed_ms:.1f} ms)")
+        else:
+            result = play_replay_headless(replay, assets)
+            print(f"Ticks: {result['ticks']}  Score: {result['score']}  Vidas: {result['lives']}  "
+                  f"({result['ticks_per_second']:.0f} ticks/s)")
+    else:
+        from src.run import App
+        game_app = App(seed=args.seed, record_path=args.record, replay=replay, replay_start=args.seek,
+                       autopilot=args.autopilot, attract=args.attract, leak_report=args.leak_report, gc_log=args.gc_log,
+                       stress=args.stress, asteroid_physics=args.asteroid_physics, time_scale=args.speed,
+                       render_scale=args.render_scale, pipelined=args.pipeline or settings.PIPELINED_RENDERING,
+                       broadcast_port=args.broadcast)
+        game_app.run()
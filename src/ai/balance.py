@@ -0,0 +1,133 @@
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src import settings
+from src.ai.env import get_headless_assets
+from src.ai.pilot import SKILL_LEVELS, ScriptedPilot
+from src.simulation import HeadlessApp, Simulation
+
+def play_sessions(difficulty_key, overrides, seeds, max_ticks, skill="NORMAL"):
+    """
+    Joga uma partida sem janela por semente, com o piloto automático, e retorna os resultados.
+    Roda dentro dos processos do pool: os assets são carregados uma vez por processo.
+    """
+    assets = get_headless_assets()
+    results = []
+    for seed in seeds:
+        sim = Simulation(assets, HeadlessApp(difficulty_key, overrides=overrides), seed=seed)
+        pilot = ScriptedPilot(skill)
+        while sim.tick < max_ticks and not sim.is_game_over():
+            sim.step(pilot(sim))
+        results.append({"seed": seed, "ticks": sim.tick, "score": sim.state.score,
+                        "game_over": sim.is_game_over(), "deaths": dict(sim.state.deaths)})
+    return results
+
+def run_config(executor, difficulty_key, overrides, seeds, max_ticks, chunk_size, skill="NORMAL"):
+    """Distribui as sementes de uma configuração em lotes pelo pool e junta os resultados."""
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    futures = [executor.submit(play_sessions, difficulty_key, overrides, chunk, max_ticks, skill) for chunk in chunks]
+    return [result for future in futures for result in future.result()]
+
+def summarize(results, elapsed):
+    """Agrega sobrevivência, distribuição de pontuação, mortes por causa e vazão."""
+    ticks = np.array([r["ticks"] for r in results])
+    scores = np.array([r["score"] for r in results])
+    deaths = {cause: sum(r["deaths"][cause] for r in results) for cause in results[0]["deaths"]}
+    total_deaths = sum(deaths.values())
+
+    return {
+        "sessions": len(results),
+        "survival_s": {"mean": float(ticks.mean()) / settings.FPS, "median": float(np.median(ticks)) / settings.FPS},
+        "survived_to_limit": float(np.mean([not r["game_over"] for r in results])),
+        "score": {"mean": float(scores.mean()), "p10": float(np.percentile(scores, 10)),
+                  "p50": float(np.percentile(scores, 50)), "p90": float(np.percentile(scores, 90))},
+        "deaths": deaths,
+        "death_share": {cause: count / total_deaths if total_deaths else 0.0 for cause, count in deaths.items()},
+        "ticks_per_second": float(ticks.sum()) / elapsed if elapsed > 0 else 0.0,
+    }
+
+def format_summary(label, summary):
+    """Formata o resumo de uma configuração como linhas de texto."""
+    survival, score = summary["survival_s"], summary["score"]
+    deaths = "  ".join(f"{cause}: {count} ({summary['death_share'][cause]:.0%})" for cause, count in summary["deaths"].items())
+    return (f"== {label} ({summary['sessions']} sessões) ==\n"
+            f"  Sobrevivência: média {survival['mean']:.1f}s, mediana {survival['median']:.1f}s, "
+            f"{summary['survived_to_limit']:.0%} chegaram ao limite\n"
+            f"  Pontuação: média {score['mean']:.0f}, p10 {score['p10']:.0f}, p50 {score['p50']:.0f}, p90 {score['p90']:.0f}\n"
+            f"  Mortes: {deaths}\n"
+            f"  Vazão: {summary['ticks_per_second']:.0f} ticks/s")
+
+BOOL_VALUES = {"true": True, "1": True, "false": False, "0": False}
+
+def _cast(name, value, default):
+    """Converte 'value' para o tipo de 'default'; booleanos à parte, pois bool("False") é True."""
+    if isinstance(default, bool):
+        if value.lower() not in BOOL_VALUES:
+            raise ValueError(f"Valor inválido para {name}: {value} (use true/false ou 1/0)")
+        return BOOL_VALUES[value.lower()]
+    try:
+        return type(default)(value)
+    except ValueError:
+        raise ValueError(f"Valor inválido para {name}: {value} (esperado {type(default).__name__})") from None
+
+def parse_sweep(specs, difficulty_key):
+    """
+    Converte argumentos 'parametro=v1,v2,...' em uma grade (lista de dicionários de overrides).
+    Os valores são convertidos para o mesmo tipo do valor do preset; parâmetros desconhecidos
+    e valores que não se convertem levantam ValueError.
+    """
+    preset = settings.DIFFICULTY_LEVELS[difficulty_key]
+    axes = []
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        if name not in preset:
+            raise ValueError(f"Parâmetro desconhecido: {name} (opções: {', '.join(preset)})")
+        axes.append([(name, _cast(name, value, preset[name])) for value in values.split(',')])
+    return [dict(combination) for combination in itertools.product(*axes)] if axes else [{}]
+
+def main():
+    """Roda partidas sem janela em paralelo para avaliar (e ajustar) os presets de dificuldade."""
+    parser = argparse.ArgumentParser(description="Balanceamento das dificuldades com partidas automáticas")
+    parser.add_argument('--difficulty', nargs='+', default=list(settings.GAMEPLAY_DIFFICULTIES), choices=settings.GAMEPLAY_DIFFICULTIES)
+    parser.add_argument('--sessions', type=int, default=100, help="partidas por configuração")
+    parser.add_argument('--max-seconds', type=float, default=180, help="duração máxima de cada partida (tempo de jogo)")
+    parser.add_argument('--sweep', nargs='*', default=[], metavar='PARAM=V1,V2', help="varre parâmetros do preset em grade, ex: ufo_spawn_rate=10000,20000")
+    parser.add_argument('--skill', default="NORMAL", choices=list(SKILL_LEVELS), help="habilidade do piloto automático")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=10, help="partidas por tarefa enviada ao pool")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', metavar='ARQUIVO', help="também grava o relatório em JSON")
+    args = parser.parse_args()
+    # Confere a varredura antes de abrir o pool de processos.
+    try:
+        grids = {difficulty_key: parse_sweep(args.sweep, difficulty_key) for difficulty_key in args.difficulty}
+    except ValueError as error:
+        parser.error(str(error))
+
+    max_ticks = int(args.max_seconds * settings.FPS)
+    seeds = list(range(args.seed, args.seed + args.sessions))
+    report = []
+
+    # 'spawn', como no VectorEnv: cada processo inicializa o seu próprio Pygame.
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count(), mp_context=mp.get_context("spawn")) as executor:
+        for difficulty_key in args.difficulty:
+            for overrides in grids[difficulty_key]:
+                start = time.perf_counter()
+                results = run_config(executor, difficulty_key, overrides, seeds, max_ticks, args.chunk_size, args.skill)
+                summary = summarize(results, time.perf_counter() - start)
+
+                label = difficulty_key + "".join(f" {name}={value}" for name, value in overrides.items())
+                print(format_summary(label, summary), flush=True)
+                report.append({"difficulty": difficulty_key, "overrides": overrides, **summary})
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import random
+import time
+import tracemalloc
+from src import settings
+from src.ai.env import get_headless_assets
+from src.simulation import HeadlessApp, Simulation
+from src.utils.input import InputFrame
+from src.utils.sprite_cache import rotation_cache
+
+def random_policy(seed):
+    """Política de teste: um comando aleatório (e reproduzível) por tick."""
+    rng = random.Random(seed)
+    dt = 1000.0 / settings.FPS
+    def policy(sim):
+        bits = rng.getrandbits(4)
+        return InputFrame.from_bits(dt, bits)
+    return policy
+
+class SessionBatch:
+    """
+    Executa N partidas (Simulation) no mesmo processo, avançando todas em lote.
+    Assets e o cache de sprites rotacionados são compartilhados, somente para leitura,
+    então cada sessão a mais custa apenas o seu próprio estado (entidades, RNG, sistemas).
+    Útil para avaliar muitas partidas sem o custo de um processo por sessão.
+    """
+    def __init__(self, num_sessions, difficulty_key="MEDIUM", seed=0, assets=None, policies=None, track_memory=False):
+        self.assets = assets if assets is not None else get_headless_assets()
+        self.difficulty_key = difficulty_key
+
+        # Mede a memória alocada pelas sessões (assets já carregados ficam fora da conta).
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.memory_baseline = tracemalloc.get_traced_memory()[0] if track_memory else 0
+
+        self.sims = [Simulation(self.assets, HeadlessApp(difficulty_key), seed=seed + i) for i in range(num_sessions)]
+        # Uma política por sessão: função (sim) -> InputFrame.
+        self.policies = policies or [random_policy(seed + i) for i in range(num_sessions)]
+        self.finished = [False] * num_sessions
+
+    @property
+    def active(self):
+        """Quantidade de sessões que ainda não chegaram ao fim de jogo."""
+        return self.finished.count(False)
+
+    def step(self):
+        """Avança um tick em todas as sessões ativas. Retorna quantas foram avançadas."""
+        stepped = 0
+        for i, sim in enumerate(self.sims):
+            if self.finished[i]:
+                continue
+            sim.step(self.policies[i](sim))
+            stepped += 1
+            if sim.is_game_over():
+                self.finished[i] = True
+        return stepped
+
+    def run(self, max_ticks):
+        """Avança todas as sessões até o fim de jogo ou até 'max_ticks'. Retorna o total de ticks simulados."""
+        total = 0
+        for _ in range(max_ticks):
+            stepped = self.step()
+            if not stepped:
+                break
+            total += stepped
+        return total
+
+    def memory_per_session(self):
+        """Memória Python média (em bytes) ocupada por sessão, ou None se a medição estiver desligada."""
+        if not self.track_memory:
+            return None
+        current = tracemalloc.get_traced_memory()[0]
+        return (current - self.memory_baseline) / max(1, len(self.sims))
+
+    def results(self):
+        """Resumo de cada sessão: semente, tick, pontuação e vidas."""
+        return [{"seed": sim.state.seed, "tick": sim.tick, "score": sim.state.score, "lives": sim.state.lives}
+                for sim in self.sims]
+
+def main():
+    """Mede a vazão e a memória por sessão de um lote de partidas no mesmo processo."""
+    parser = argparse.ArgumentParser(description="Benchmark de sessões em lote")
+    parser.add_argument('--sessions', type=int, default=100)
+    parser.add_argument('--ticks', type=int, default=600)
+    parser.add_argument('--difficulty', default="MEDIUM")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    get_headless_assets()
+    batch = SessionBatch(args.sessions, args.difficulty, args.seed, track_memory=True)
+    start = time.perf_counter()
+    total = batch.run(args.ticks)
+    elapsed = time.perf_counter() - start
+
+    memory = batch.memory_per_session()
+    scores = [r["score"] for r in batch.results()]
+    print(f"{args.sessions} sessões, {total} ticks em {elapsed:.2f}s: {total / elapsed:.0f} ticks/s")
+    print(f"Memória por sessão: {memory / 1024:.1f} KiB  (cache de sprites: {len(rotation_cache.entries)} entradas)")
+    print(f"Sessões ativas: {batch.active}  Pontuação média: {sum(scores) / len(scores):.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+import numpy as np
+from src import settings
+from src.simulation import HeadlessApp, Simulation, init_headless
+from src.utils.asset_loader import load_all_assets
+from src.utils.input import InputFrame, LEFT, RIGHT, THRUST, SHOOT
+
+_headless_assets = None
+
+def get_headless_assets():
+    """Inicializa o Pygame sem janela e carrega os assets uma única vez por processo."""
+    global _headless_assets
+    if _headless_assets is None:
+        init_headless()
+        _headless_assets = load_all_assets(load_sounds=False)
+    return _headless_assets
+
+class AsteroidsEnv:
+    """
+    Ambiente no estilo Gym em volta de uma Simulation sem janela, para treinar e avaliar bots.
+
+    - Ação: inteiro de 0 a 15, uma máscara de bits com LEFT, RIGHT, THRUST e SHOOT.
+    - Observação: vetor float32 com as features da nave seguidas das entidades mais
+      próximas (asteroides, UFOs e balas inimigas), em coordenadas relativas à nave
+      que consideram o "wrap-around" da tela. Espaços vazios são preenchidos com zeros.
+    - Recompensa: pontos ganhos no passo * score_scale, menos life_penalty por vida perdida.
+    """
+    NUM_ACTIONS = 16
+
+    # Quantidade máxima de entidades de cada tipo incluídas na observação.
+    MAX_ASTEROIDS = 16
+    MAX_UFOS = 2
+    MAX_ENEMY_BULLETS = 8
+
+    SHIP_FEATURES = 7    # x, y, vx, vy, sen(ângulo), cos(ângulo), invulnerável
+    ENTITY_FEATURES = 6  # presente, dx, dy, vx, vy, raio
+    OBS_SIZE = SHIP_FEATURES + (MAX_ASTEROIDS + MAX_UFOS + MAX_ENEMY_BULLETS) * ENTITY_FEATURES
+
+    def __init__(self, difficulty_key="MEDIUM", assets=None, frame_skip=1, max_ticks=None,
+                 score_scale=0.01, life_penalty=10.0):
+        self.difficulty_key = difficulty_key
+        self.assets = assets if assets is not None else get_headless_assets()
+        self.frame_skip = frame_skip  # Ticks simulados por ação
+        self.max_ticks = max_ticks    # Limite de duração do episódio (None = sem limite)
+        self.score_scale = score_scale
+        self.life_penalty = life_penalty
+        self.dt = 1000.0 / settings.FPS
+        self.sim = None
+
+    def reset(self, seed=None):
+        """Inicia um novo episódio. Retorna (observação, info)."""
+        self.sim = Simulation(self.assets, HeadlessApp(self.difficulty_key), seed=seed)
+        return self.observe(), self._info()
+
+    def step(self, action):
+        """Aplica a ação por 'frame_skip' ticks. Retorna (obs, recompensa, terminado, truncado, info)."""
+        state = self.sim.state
+        score_before, lives_before = state.score, state.lives
+        frame = InputFrame(self.dt, bool(action & LEFT), bool(action & RIGHT), bool(action & THRUST), bool(action & SHOOT))
+
+        for _ in range(self.frame_skip):
+            self.sim.step(frame)
+            if self.sim.is_game_over():
+                break
+
+        reward = (state.score - score_before) * self.score_scale - (lives_before - state.lives) * self.life_penalty
+        terminated = self.sim.is_game_over()
+        truncated = not terminated and self.max_ticks is not None and self.sim.tick >= self.max_ticks
+        return self.observe(), reward, terminated, truncated, self._info()
+
+    def observe(self, out=None):
+        """Escreve a observação em 'out' (ou em um novo array) e o retorna."""
+        if out is None:
+            out = np.zeros(self.OBS_SIZE, dtype=np.float32)
+        else:
+            out[:] = 0
+
+        state = self.sim.state
+        ship = state.ship
+        width, height = settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT
+        direction = ship.angle * np.pi / 180.0
+        out[:self.SHIP_FEATURES] = (ship.position.x / width, ship.position.y / height,
+                                    ship.velocity.x / settings.SHIP_MAX_SPEED, ship.velocity.y / settings.SHIP_MAX_SPEED,
+                                    np.sin(direction), np.cos(direction), float(ship.invulnerable))
+
+        offset = self.SHIP_FEATURES
+        for group, limit in ((state.asteroids, self.MAX_ASTEROIDS), (state.ufos, self.MAX_UFOS),
+                             (state.enemy_bullets, self.MAX_ENEMY_BULLETS)):
+            self._write_entities(out, offset, group, limit, ship.position)
+            offset += limit * self.ENTITY_FEATURES
+        return out
+
+    def _write_entities(self, out, offset, group, limit, origin):
+        """Escreve as 'limit' entidades mais próximas do grupo, da mais próxima para a mais distante."""
+        if group is self.sim.state.asteroids:
+            # Os asteroides já estão em arrays: lê direto do AsteroidField.
+            data = self.sim.state.asteroid_field.kinematics().astype(np.float32)
+        elif group is self.sim.state.enemy_bullets:
+            # Projéteis inimigos ficam na sua tabela do EntityStore (sem raio).
+            table = self.sim.state.entities["enemy_bullets"]
+            data = np.column_stack((table["position"], table["velocity"], np.zeros(len(table)))).astype(np.float32)
+        else:
+            data = np.array([(s.position.x, s.position.y, s.velocity.x, s.velocity.y, getattr(s, 'radius', 0))
+                             for s in group], dtype=np.float32)
+        if not len(data):
+            return
+        width, height = settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT
+
+        # Distância no toro: o caminho mais curto pode atravessar a borda da tela.
+        dx = (data[:, 0] - origin.x + width / 2) % width - width / 2
+        dy = (data[:, 1] - origin.y + height / 2) % height - height / 2
+        nearest = np.argsort(dx * dx + dy * dy)[:limit]
+
+        block = out[offset:offset + len(nearest) * self.ENTITY_FEATURES].reshape(-1, self.ENTITY_FEATURES)
+        block[:, 0] = 1.0
+        block[:, 1] = dx[nearest] / width
+        block[:, 2] = dy[nearest] / height
+        block[:, 3] = data[nearest, 2] / settings.ASTEROID_MAX_SPEED
+        block[:, 4] = data[nearest, 3] / settings.ASTEROID_MAX_SPEED
+        block[:, 5] = data[nearest, 4] / settings.ASTEROID_SIZES[3]
+
+    def _info(self):
+        state = self.sim.state
+        return {"tick": self.sim.tick, "score": state.score, "lives": state.lives, "seed": state.seed}
@@ -0,0 +1,66 @@
+import argparse
+import time
+from src import settings
+from src.ai.env import get_headless_assets
+from src.simulation import HeadlessApp, Simulation
+from src.utils.input import InputFrame
+
+# Sessão sem spawns normais nem UFOs: só os asteroides criados pelo benchmark.
+BENCH_OVERRIDES = {"asteroid_physics": True, "immortal": True, "initial_asteroids": 0,
+                   "max_asteroids": 0, "ufo_spawn_rate": 10 ** 9}
+
+def measure(assets, count, size, ticks, seed):
+    """
+    Simula 'ticks' ticks com 'count' asteroides de tamanho 'size' (repostos quando se partem) e
+    retorna o custo médio por tick, em ms, das colisões entre asteroides e do tick inteiro,
+    além da média de asteroides em contato por tick.
+    """
+    sim = Simulation(assets, HeadlessApp("EASY", overrides=BENCH_OVERRIDES), seed=seed)
+    rng = sim.state.rng.spawn
+    field = sim.state.asteroid_field
+    frame = InputFrame(dt=1000.0 / settings.FPS)
+
+    # Substitui a etapa de colisões entre asteroides por uma versão cronometrada.
+    physics_time = 0.0
+    contacts = 0
+
+    def timed_asteroid_collisions():
+        nonlocal physics_time, contacts
+        start = time.perf_counter()
+        slots, delta_v = field.collide(settings.ASTEROID_RESTITUTION)
+        physics_time += time.perf_counter() - start
+        contacts += len(slots)
+        sim.collision._fracture_asteroids(slots, delta_v)
+
+    sim.collision._check_asteroid_collisions = timed_asteroid_collisions
+
+    step_time = 0.0
+    for _ in range(ticks):
+        while len(sim.state.asteroids) < count:
+            sim.spawn._spawn_asteroid(size, (rng.randrange(settings.SCREEN_WIDTH), rng.randrange(settings.SCREEN_HEIGHT)))
+        start = time.perf_counter()
+        sim.step(frame)
+        step_time += time.perf_counter() - start
+
+    return physics_time * 1000 / ticks, step_time * 1000 / ticks, contacts / ticks
+
+def main():
+    """Mede o custo por quadro da física entre asteroides em populações crescentes."""
+    parser = argparse.ArgumentParser(description="Custo por quadro da física entre asteroides")
+    parser.add_argument('--counts', type=int, nargs='+', default=[100, 500, 1000], help="quantidades de asteroides")
+    parser.add_argument('--size', type=int, default=1, choices=sorted(settings.ASTEROID_SIZES),
+                        help="tamanho dos asteroides (mil grandes não cabem na tela)")
+    parser.add_argument('--ticks', type=int, default=300, help="ticks medidos em cada quantidade")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    assets = get_headless_assets()
+    budget = 1000 / settings.FPS
+    print(f"{'asteroides':>10} {'colisões (ms)':>14} {'tick (ms)':>10} {'em contato/tick':>16}")
+    for count in args.counts:
+        physics_ms, step_ms, contacts = measure(assets, count, args.size, args.ticks, args.seed)
+        note = "" if step_ms <= budget else "  (acima do orçamento de um quadro)"
+        print(f"{count:>10} {physics_ms:>14.2f} {step_ms:>10.2f} {contacts:>16.1f}{note}")
+
+if __name__ == '__main__':
+    main()
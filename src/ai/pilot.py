@@ -0,0 +1,123 @@
+import math
+from src import settings
+from src.utils.input import InputFrame, InputSource
+
+# Perfis de habilidade do piloto automático.
+# - reaction_ticks: intervalo entre replanejamentos (escolha de alvo e de esquiva)
+# - aim_tolerance: graus de erro aceitos para atirar
+# - fire_range: distância máxima para atirar
+# - lead: mira à frente do alvo, compensando o tempo de voo da bala
+# - dodge: desvia de balas inimigas que vão passar perto da nave
+SKILL_LEVELS = {
+    "ROOKIE": {"reaction_ticks": 15, "aim_tolerance": 20, "fire_range": 350, "lead": False, "dodge": False},
+    "NORMAL": {"reaction_ticks": 6, "aim_tolerance": 8, "fire_range": 450, "lead": False, "dodge": True},
+    "EXPERT": {"reaction_ticks": 1, "aim_tolerance": 4, "fire_range": 600, "lead": True, "dodge": True},
+}
+
+def wrap_delta(origin, target):
+    """Vetor (dx, dy) de 'origin' até 'target' pelo caminho mais curto, considerando o "wrap-around"."""
+    width, height = settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT
+    dx = (target.x - origin.x + width / 2) % width - width / 2
+    dy = (target.y - origin.y + height / 2) % height - height / 2
+    return dx, dy
+
+def heading_to(dx, dy):
+    """Ângulo da nave (convenção de Ship.angle) que aponta na direção (dx, dy)."""
+    return math.degrees(math.atan2(-dx, -dy)) % 360
+
+def angle_diff(target, current):
+    """Diferença angular com sinal, no intervalo [-180, 180)."""
+    return (target - current + 180) % 360 - 180
+
+class ScriptedPilot:
+    """
+    Piloto automático determinístico, usado para jogar partidas sem intervenção humana.
+    Mira na ameaça mais próxima (asteroide ou UFO) e atira quando está alinhado,
+    desvia de balas inimigas e acelera para longe quando um asteroide chega perto demais.
+    """
+    DANGER_MARGIN = 90   # Folga, além do raio do asteroide, que dispara a fuga
+    DODGE_HORIZON = 45   # Ticks à frente considerados ao prever a trajetória das balas
+    DODGE_RADIUS = 40    # Distância de passagem de uma bala considerada perigosa
+
+    def __init__(self, skill="NORMAL"):
+        self.skill = SKILL_LEVELS[skill]
+        self.dt = 1000.0 / settings.FPS
+        self.ticks_to_plan = 0
+        self.target = None        # Sprite escolhido como alvo no último planejamento
+        self.dodge_heading = None  # Direção de fuga de uma bala, se houver
+
+    def __call__(self, sim):
+        """Permite usar o piloto como política de SessionBatch."""
+        return self.decide(sim.state, self.dt)
+
+    def decide(self, state, dt):
+        """Escolhe a entrada do tick a partir do estado atual da partida."""
+        ship = state.ship
+
+        # Replaneja periodicamente (ou quando o alvo deixa de existir), simulando o tempo de reação.
+        self.ticks_to_plan -= 1
+        if self.ticks_to_plan <= 0 or (self.target is not None and not self.target.alive()):
+            self.ticks_to_plan = self.skill["reaction_ticks"]
+            self._plan(state)
+
+        # 1. Esquiva: vira para a rota de fuga e acelera assim que estiver razoavelmente alinhado.
+        if self.dodge_heading is not None:
+            diff = angle_diff(self.dodge_heading, ship.angle)
+            return InputFrame(dt, diff > 2, diff < -2, abs(diff) < 45, False)
+
+        if self.target is None or not self.target.alive():
+            return InputFrame(dt)
+
+        # 2. Mira e tiro.
+        dx, dy = wrap_delta(ship.position, self.target.position)
+        distance = math.hypot(dx, dy)
+        if self.skill["lead"]:
+            flight_ticks = distance / settings.BULLET_SPEED
+            dx += self.target.velocity.x * flight_ticks
+            dy += self.target.velocity.y * flight_ticks
+        diff = angle_diff(heading_to(dx, dy), ship.angle)
+        tolerance = self.skill["aim_tolerance"]
+        left = diff > tolerance / 2
+        right = diff < -tolerance / 2
+        shoot = abs(diff) <= tolerance and distance <= self.skill["fire_range"]
+
+        # 3. Foge de asteroides próximos quando a nave está de costas para eles.
+        thrust = (distance < getattr(self.target, 'radius', 0) + self.DANGER_MARGIN and abs(diff) > 120)
+        return InputFrame(dt, left, right, thrust, shoot)
+
+    def _plan(self, state):
+        """Escolhe o alvo (ameaça mais próxima) e verifica se alguma bala exige esquiva."""
+        ship = state.ship
+        nearest = state.spatial.nearest(ship.position, 1)
+        self.target = nearest[0][1] if nearest else None
+        self.dodge_heading = self._dodge_heading(ship, state.enemy_bullets) if self.skill["dodge"] else None
+
+    def _dodge_heading(self, ship, enemy_bullets):
+        """Retorna a direção de fuga da bala mais urgente, ou None se nenhuma for perigosa."""
+        most_urgent = None
+        for bullet in enemy_bullets:
+            dx, dy = wrap_delta(ship.position, bullet.position)
+            vx, vy = bullet.velocity.x - ship.velocity.x, bullet.velocity.y - ship.velocity.y
+            speed_sq = vx * vx + vy * vy
+            if speed_sq == 0:
+                continue
+            # Instante e ponto de máxima aproximação, em relação à nave.
+            t = -(dx * vx + dy * vy) / speed_sq
+            if not 0 < t < self.DODGE_HORIZON:
+                continue
+            cx, cy = dx + vx * t, dy + vy * t
+            if math.hypot(cx, cy) < self.DODGE_RADIUS and (most_urgent is None or t < most_urgent[0]):
+                # Foge para o lado oposto ao ponto de passagem (ou perpendicular, se a bala vier direto).
+                if abs(cx) + abs(cy) < 1:
+                    cx, cy = vy, -vx
+                most_urgent = (t, -cx, -cy)
+        return heading_to(most_urgent[1], most_urgent[2]) if most_urgent else None
+
+class AutopilotInput(InputSource):
+    """Fonte de entrada da tela de jogo controlada pelo piloto automático (modo demonstração e testes de longa duração)."""
+    def __init__(self, state, skill="NORMAL"):
+        self.state = state
+        self.pilot = ScriptedPilot(skill)
+
+    def poll(self, dt):
+        return self.pilot.decide(self.state, dt)
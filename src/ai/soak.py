@@ -0,0 +1,52 @@
+import argparse
+import time
+from src import settings
+from src.ai.env import get_headless_assets
+from src.ai.pilot import SKILL_LEVELS, ScriptedPilot
+from src.simulation import HeadlessApp, Simulation
+from src.utils.leak_monitor import LeakMonitor
+
+def main():
+    """
+    Teste de longa duração sem janela: o piloto automático joga partidas seguidas
+    enquanto o LeakMonitor amostra grupos, memória e superfícies.
+    """
+    parser = argparse.ArgumentParser(description="Teste de longa duração com detecção de vazamentos")
+    parser.add_argument('--hours', type=float, default=1.0, help="duração em tempo de jogo")
+    parser.add_argument('--interval', type=float, default=10.0, help="segundos de jogo entre amostras")
+    parser.add_argument('--difficulty', default="MEDIUM", choices=settings.GAMEPLAY_DIFFICULTIES)
+    parser.add_argument('--skill', default="NORMAL", choices=list(SKILL_LEVELS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--csv', default="soak.csv", metavar='ARQUIVO', help="série temporal das amostras")
+    parser.add_argument('--report', default="soak_report.txt", metavar='ARQUIVO', help="relatório de vazamentos")
+    args = parser.parse_args()
+
+    assets = get_headless_assets()
+    monitor = LeakMonitor(args.interval)
+    total_ticks = int(args.hours * 3600 * settings.FPS)
+
+    seed = args.seed
+    sessions = 1
+    sim = Simulation(assets, HeadlessApp(args.difficulty), seed=seed)
+    pilot = ScriptedPilot(args.skill)
+
+    start = time.perf_counter()
+    for tick in range(total_ticks):
+        # Partidas terminadas são substituídas por novas, com a semente seguinte.
+        if sim.is_game_over():
+            seed += 1
+            sessions += 1
+            sim = Simulation(assets, HeadlessApp(args.difficulty), seed=seed)
+            pilot = ScriptedPilot(args.skill)
+        sim.step(pilot(sim))
+        monitor.maybe_sample(sim.state, tick / settings.FPS)
+    elapsed = time.perf_counter() - start
+
+    monitor.write_csv(args.csv)
+    monitor.write_report(args.report)
+    print(monitor.report())
+    print(f"{sessions} partidas, {args.hours:.2f} h de jogo em {elapsed / 60:.1f} min. "
+          f"Série em {args.csv}, relatório em {args.report}")
+
+if __name__ == '__main__':
+    main()
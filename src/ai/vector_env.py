@@ -0,0 +1,174 @@
+import argparse
+import multiprocessing as mp
+import os
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from src.ai.env import AsteroidsEnv
+
+# Buffers compartilhados entre o processo principal e os workers: (nome, dtype, colunas).
+_BUFFERS = (
+    ("obs", np.float32, AsteroidsEnv.OBS_SIZE),
+    ("rewards", np.float32, None),
+    ("terminated", np.bool_, None),
+    ("truncated", np.bool_, None),
+    ("actions", np.int32, None),
+    ("final_scores", np.int64, None),  # Pontuação final do episódio que acabou de terminar
+)
+
+def _attach(shms, num_envs):
+    """Cria arrays NumPy sobre os blocos de memória compartilhada (sem cópia)."""
+    arrays = {}
+    for (name, dtype, columns), shm in zip(_BUFFERS, shms):
+        shape = (num_envs, columns) if columns else (num_envs,)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return arrays
+
+def _episode_seed(base_seed, env_index, episode, num_envs):
+    """Semente de cada episódio: distinta por ambiente e por episódio, e reproduzível."""
+    if base_seed is None:
+        return None
+    return base_seed + env_index + episode * num_envs
+
+def _worker(conn, shm_names, env_indices, num_envs, env_kwargs):
+    """Loop de um processo worker: hospeda alguns ambientes e escreve direto nos buffers compartilhados."""
+    shms = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    buffers = _attach(shms, num_envs)
+    envs = {i: AsteroidsEnv(**env_kwargs) for i in env_indices}
+    episodes = dict.fromkeys(env_indices, 0)
+    base_seed = None
+
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "reset":
+                base_seed = data
+                for i, env in envs.items():
+                    episodes[i] = 0
+                    env.reset(_episode_seed(base_seed, i, 0, num_envs))
+                    env.observe(out=buffers["obs"][i])
+                conn.send(None)
+
+            elif command == "step":
+                for i, env in envs.items():
+                    _, reward, terminated, truncated, info = env.step(int(buffers["actions"][i]))
+                    buffers["rewards"][i] = reward
+                    buffers["terminated"][i] = terminated
+                    buffers["truncated"][i] = truncated
+                    # Episódios encerrados são reiniciados automaticamente.
+                    if terminated or truncated:
+                        buffers["final_scores"][i] = info["score"]
+                        episodes[i] += 1
+                        env.reset(_episode_seed(base_seed, i, episodes[i], num_envs))
+                    env.observe(out=buffers["obs"][i])
+                conn.send(None)
+
+            elif command == "close":
+                break
+    finally:
+        del buffers
+        for shm in shms:
+            shm.close()
+        conn.close()
+
+class VectorEnv:
+    """
+    Executa N AsteroidsEnv em processos worker, no estilo dos "vector envs" do Gym.
+    Observações, recompensas e ações trafegam por memória compartilhada; os pipes levam
+    apenas os comandos. Os arrays retornados por reset() e step() são visões desses buffers
+    e são sobrescritos no próximo passo (copie-os se precisar guardá-los).
+    """
+    def __init__(self, num_envs, num_workers=None, **env_kwargs):
+        self.num_envs = num_envs
+        num_workers = min(num_envs, num_workers or os.cpu_count() or 1)
+
+        # --- Memória Compartilhada ---
+        self.shms = []
+        for name, dtype, columns in _BUFFERS:
+            size = num_envs * (columns or 1) * np.dtype(dtype).itemsize
+            self.shms.append(shared_memory.SharedMemory(create=True, size=size))
+        self.buffers = _attach(self.shms, num_envs)
+
+        # --- Workers ---
+        # 'spawn' evita herdar o estado do SDL de um processo que já inicializou o Pygame.
+        context = mp.get_context("spawn")
+        self.pipes = []
+        self.processes = []
+        shm_names = [shm.name for shm in self.shms]
+        for indices in np.array_split(np.arange(num_envs), num_workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker, args=(child_conn, shm_names, indices.tolist(), num_envs, env_kwargs), daemon=True)
+            process.start()
+            child_conn.close()
+            self.pipes.append(parent_conn)
+            self.processes.append(process)
+        self.closed = False
+
+    def _broadcast(self, command, data=None):
+        """Envia um comando a todos os workers e espera que terminem."""
+        for pipe in self.pipes:
+            pipe.send((command, data))
+        for pipe in self.pipes:
+            pipe.recv()
+
+    def reset(self, seed=None):
+        """Reinicia todos os ambientes (o ambiente i usa a semente seed + i). Retorna as observações."""
+        self._broadcast("reset", seed)
+        return self.buffers["obs"]
+
+    def step(self, actions):
+        """Aplica uma ação por ambiente. Retorna (obs, recompensas, terminados, truncados)."""
+        self.buffers["actions"][:] = actions
+        self._broadcast("step")
+        b = self.buffers
+        return b["obs"], b["rewards"], b["terminated"], b["truncated"]
+
+    @property
+    def final_scores(self):
+        """Pontuação final dos episódios que terminaram no último passo (válida onde terminated/truncated)."""
+        return self.buffers["final_scores"]
+
+    def close(self):
+        """Encerra os workers e libera a memória compartilhada."""
+        if self.closed:
+            return
+        self.closed = True
+        for pipe in self.pipes:
+            pipe.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.buffers = None
+        for shm in self.shms:
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def main():
+    """Mede a vazão (passos por segundo) do ambiente vetorizado com ações aleatórias."""
+    parser = argparse.ArgumentParser(description="Benchmark do VectorEnv")
+    parser.add_argument('--envs', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--steps', type=int, default=1000)
+    parser.add_argument('--difficulty', default="MEDIUM")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with VectorEnv(args.envs, args.workers, difficulty_key=args.difficulty) as env:
+        env.reset(seed=0)
+        start = time.perf_counter()
+        episodes = 0
+        for _ in range(args.steps):
+            _, _, terminated, truncated = env.step(rng.integers(0, AsteroidsEnv.NUM_ACTIONS, args.envs))
+            episodes += int(np.count_nonzero(terminated | truncated))
+        elapsed = time.perf_counter() - start
+
+    total = args.steps * args.envs
+    print(f"{total} passos em {elapsed:.2f}s: {total / elapsed:.0f} passos/s ({episodes} episódios concluídos)")
+
+if __name__ == '__main__':
+    main()
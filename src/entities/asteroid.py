@@ -1,54 +1,133 @@
 import pygame
 import random
 from .. import settings
+from ..utils.sprite_cache import rotation_cache
 
 class Asteroid(pygame.sprite.Sprite):
     """
     Representa um asteroide no jogo. Pode ter diferentes tamanhos,
     velocidades e rotações.
+
+    A cinemática (posição, velocidade e rotação) fica no AsteroidField da sessão,
+    que atualiza todos os asteroides de uma vez; o sprite guarda apenas imagem,
+    rect e máscara, e expõe os valores do campo como propriedades.
     """
-    def __init__(self, size, position, image):
+    def __init__(self, size, position, image, field, rng=random):
         super().__init__()
         
         # --- Atributos ---
         self.size = size
-        self.original_image = image  # Armazena a imagem base para rotações
         self.radius = settings.ASTEROID_SIZES.get(self.size, 15) # Obtém o raio do asteroide com base no seu tamanho
         
         # --- Configuração de Sprite ---
         # Redimensiona a imagem para o tamanho correto e a salva como 'original_image' para otimizar.
-        self.image = pygame.transform.scale(self.original_image, (self.radius * 2, self.radius * 2))
-        self.original_image = self.image 
+        # A versão redimensionada vem do cache, compartilhada por todos os asteroides do mesmo tamanho.
+        self.original_image = rotation_cache.scaled(image, (self.radius * 2, self.radius * 2))
+        self.image, self.mask = rotation_cache.rotated(self.original_image, 0) # Imagem e máscara iniciais
         self.rect = self.image.get_rect(center=position)
-        self.mask = pygame.mask.from_surface(self.image) # A máscara inicial
         
         # --- Física e Movimento ---
-        self.position = pygame.math.Vector2(position) # Posição precisa usando vetores
-        speed = random.uniform(settings.ASTEROID_MIN_SPEED, settings.ASTEROID_MAX_SPEED)
-        self.velocity = pygame.math.Vector2(speed, 0).rotate(random.uniform(0, 360)) # Direção e velocidade aleatórias
-        self.rotation = 0
-        self.rotation_speed = random.uniform(-2, 2) # Velocidade de rotação aleatória
-        
+        # Sorteados na mesma ordem de sempre, para manter as partidas reproduzíveis.
+        speed = rng.uniform(settings.ASTEROID_MIN_SPEED, settings.ASTEROID_MAX_SPEED)
+        velocity = pygame.math.Vector2(speed, 0).rotate(rng.uniform(0, 360)) # Direção e velocidade aleatórias
+        rotation_speed = rng.uniform(-2, 2) # Velocidade de rotação aleatória
+        self.field = field
+        self.slot = field.acquire(self, position, velocity, 0, rotation_speed, self.radius)
+
+    # --- Visões sobre o AsteroidField ---
+    # 'position' e 'velocity' retornam cópias: para alterá-las, atribua um novo vetor.
+    # Depois de kill() os valores finais continuam legíveis (ex: para dividir o asteroide),
+    # e as atribuições vão para eles: o slot pode já ser de outro asteroide, e indexar os
+    # arrays com None escreveria em todas as linhas.
+    @property
+    def position(self):
+        if self.slot is None:
+            return pygame.math.Vector2(self.final_state["position"])
+        return pygame.math.Vector2(self.field.pos[self.slot].tolist())
+
+    @position.setter
+    def position(self, value):
+        if self.slot is None:
+            self.final_state["position"] = pygame.math.Vector2(value)
+            return
+        self.field.pos[self.slot] = value
+        self.field.generation += 1
+
+    @property
+    def velocity(self):
+        if self.slot is None:
+            return pygame.math.Vector2(self.final_state["velocity"])
+        return pygame.math.Vector2(self.field.vel[self.slot].tolist())
+
+    @velocity.setter
+    def velocity(self, value):
+        if self.slot is None:
+            self.final_state["velocity"] = pygame.math.Vector2(value)
+            return
+        self.field.vel[self.slot] = value
+
+    @property
+    def rotation(self):
+        if self.slot is None:
+            return self.final_state["rotation"]
+        return float(self.field.angle[self.slot])
+
+    @rotation.setter
+    def rotation(self, value):
+        if self.slot is None:
+            self.final_state["rotation"] = float(value)
+            return
+        self.field.angle[self.slot] = value
+        self.field.quantized[self.slot] = -1  # Força a troca da imagem na próxima sincronização
+
+    @property
+    def rotation_speed(self):
+        if self.slot is None:
+            return self.final_state["rotation_speed"]
+        return float(self.field.ang_vel[self.slot])
+
+    @rotation_speed.setter
+    def rotation_speed(self, value):
+        if self.slot is None:
+            self.final_state["rotation_speed"] = float(value)
+            return
+        self.field.ang_vel[self.slot] = value
+
+    @property
+    def collision_grace(self):
+        if self.slot is None:
+            return self.final_state["collision_grace"]
+        return float(self.field.grace[self.slot])
+
+    @collision_grace.setter
+    def collision_grace(self, value):
+        if self.slot is None:
+            self.final_state["collision_grace"] = float(value)
+            return
+        self.field.grace[self.slot] = value
+
+    @property
+    def entering(self):
+        if self.slot is None:
+            return self.final_state.get("entering", False)
+        return bool(self.field.entering[self.slot])
+
+    @entering.setter
+    def entering(self, value):
+        if self.slot is None:
+            self.final_state["entering"] = bool(value)
+            return
+        self.field.entering[self.slot] = value
+
     def update(self, dt, *args, **kwargs):
-        """Atualiza a posição e rotação do asteroide a cada frame."""
-        # Move o asteroide com base na sua velocidade e delta time.
-        self.position += self.velocity * (dt / (1000.0 / settings.FPS))
-        
-        # Atualiza a rotação.
-        self.rotation = (self.rotation + self.rotation_speed) % 360
-        
-        # Rotaciona a imagem e atualiza o rect e a mask a cada frame para colisões precisas.
-        self.image = pygame.transform.rotate(self.original_image, self.rotation)
-        self.rect = self.image.get_rect(center=self.position)
-        self.mask = pygame.mask.from_surface(self.image)
-        
-        # Garante que o asteroide reapareça do outro lado da tela se sair.
-        self._wrap_around_screen()
-
-    def _wrap_around_screen(self):
-        """Implementa a lógica de "wrap-around" para o asteroide."""
-        # Usa a posição do vetor para precisão, em vez do rect.
-        if self.position.x > settings.SCREEN_WIDTH + self.radius: self.position.x = -self.radius
-        if self.position.x < -self.radius: self.position.x = settings.SCREEN_WIDTH + self.radius
-        if self.position.y > settings.SCREEN_HEIGHT + self.radius: self.position.y = -self.radius
-        if self.position.y < -self.radius: self.position.y = settings.SCREEN_HEIGHT + self.radius
\ No newline at end of file
+        """O movimento é feito em lote por AsteroidField.step(); nada a fazer por sprite."""
+
+    def kill(self):
+        """Remove o asteroide dos grupos e libera o seu slot no campo, guardando os valores finais."""
+        super().kill()
+        if self.slot is not None:
+            self.final_state = {"position": self.position, "velocity": self.velocity,
+                                "rotation": self.rotation, "rotation_speed": self.rotation_speed,
+                                "collision_grace": self.collision_grace}
+            self.field.release(self.slot)
+            self.slot = None
@@ -0,0 +1,228 @@
+import math
+import numpy as np
+from .. import settings
+from ..utils.sprite_cache import rotation_cache
+from ..utils.broadphase import toroidal_pairs, wrap_delta
+
+class AsteroidField:
+    """
+    Armazena a cinemática de todos os asteroides de uma sessão em arrays contíguos
+    (posição, velocidade, ângulo, velocidade angular e raio) e os avança de uma vez,
+    com operações vetorizadas do NumPy.
+
+    Cada Asteroid ocupa um "slot" dos arrays e funciona como uma visão fina sobre ele:
+    guarda apenas a imagem, o rect e a máscara usados na renderização e nas colisões.
+    Slots liberados por kill() são reaproveitados pelos próximos asteroides.
+
+    A tela é um toro: as coordenadas são tomadas módulo a largura e a altura, e quem
+    cruza uma borda aparece dos dois lados ao mesmo tempo (ver WrapSystem). A exceção
+    são os asteroides criados fora da tela, que "entram" nela: até ficarem inteiros
+    dentro da tela, só reaparecem do outro lado depois de saírem totalmente.
+
+    No modo de física entre asteroides, collide() também resolve as colisões
+    elásticas entre eles, com a massa proporcional à área (raio ao quadrado).
+    """
+    def __init__(self, capacity=64):
+        self.count = 0       # Slots já usados alguma vez (os arrays valem até este índice)
+        self.free_slots = []
+        self.generation = 0  # Muda a cada alteração de posições ou slots (ver SpatialIndex)
+        self.screen_size = np.array((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), dtype=float)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Cria (ou aumenta) os arrays, preservando os slots existentes."""
+        old_count = self.count
+        arrays = {
+            "pos": np.zeros((capacity, 2)),
+            "vel": np.zeros((capacity, 2)),
+            "angle": np.zeros(capacity),
+            "ang_vel": np.zeros(capacity),
+            "radius": np.zeros(capacity),
+            "alive": np.zeros(capacity, dtype=bool),
+            "quantized": np.full(capacity, -1, dtype=np.int32),  # Ângulo da imagem atual do sprite
+            "grace": np.zeros(capacity),  # Tempo (ms) em que o asteroide ainda não colide com outros
+            "entering": np.zeros(capacity, dtype=bool),  # Criado fora da tela e ainda entrando nela
+        }
+        for name, array in arrays.items():
+            if old_count:
+                array[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, array)
+        sprites = [None] * capacity
+        if old_count:
+            sprites[:old_count] = self.sprites[:old_count]
+        self.sprites = sprites
+        self.capacity = capacity
+
+    def acquire(self, sprite, position, velocity, angle, angular_velocity, radius):
+        """Reserva um slot para o asteroide e retorna o seu índice."""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.count == self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self.count
+            self.count += 1
+
+        self.pos[slot] = position
+        self.vel[slot] = velocity
+        self.angle[slot] = angle
+        self.ang_vel[slot] = angular_velocity
+        self.radius[slot] = radius
+        self.quantized[slot] = -1
+        self.grace[slot] = 0
+        self.entering[slot] = not (0 <= position[0] < settings.SCREEN_WIDTH and 0 <= position[1] < settings.SCREEN_HEIGHT)
+        self.alive[slot] = True
+        self.sprites[slot] = sprite
+        self.generation += 1
+        return slot
+
+    def release(self, slot):
+        """Libera o slot de um asteroide destruído."""
+        self.alive[slot] = False
+        self.vel[slot] = 0
+        self.ang_vel[slot] = 0
+        self.sprites[slot] = None
+        self.free_slots.append(slot)
+        self.generation += 1
+
+    def step(self, dt):
+        """Move, gira e aplica o "wrap-around" em todos os asteroides e sincroniza seus sprites."""
+        width, height = settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT
+        n = self.count
+        if not n:
+            return
+        self.generation += 1
+        pos, radius = self.pos[:n], self.radius[:n]
+
+        # Movimento e rotação (slots livres têm velocidade zero e não são sincronizados).
+        pos += self.vel[:n] * (dt / (1000.0 / settings.FPS))
+        angle = self.angle[:n]
+        angle += self.ang_vel[:n]
+        np.remainder(angle, 360, out=angle)
+        grace = self.grace[:n]
+        np.maximum(grace - dt, 0, out=grace)
+
+        # "Wrap-around" no toro: coordenadas módulo o tamanho da tela.
+        x, y = pos[:, 0], pos[:, 1]
+        entering = self.entering[:n]
+        on_torus = ~entering
+        x[on_torus] = np.mod(x[on_torus], width)
+        y[on_torus] = np.mod(y[on_torus], height)
+
+        # Asteroides entrando na tela reaparecem do outro lado só depois de saírem totalmente,
+        # e passam a seguir o toro assim que ficam inteiros dentro da tela.
+        if entering.any():
+            slots = np.flatnonzero(entering)
+            r = radius[slots]
+            for coord, limit in ((x, width), (y, height)):
+                values = coord[slots]
+                values = np.where(values > limit + r, -r, values)
+                values = np.where(values < -r, limit + r, values)
+                coord[slots] = values
+            inside = ((x[slots] - r >= 0) & (x[slots] + r <= width) &
+                      (y[slots] - r >= 0) & (y[slots] + r <= height))
+            entering[slots[inside]] = False
+
+        self.sync_sprites()
+
+    def collide(self, restitution=1.0):
+        """
+        Resolve as colisões elásticas entre os asteroides, considerando o "wrap-around"
+        (quem está saindo por uma borda encosta em quem está na borda oposta).
+        Asteroides ainda entrando na tela (entering) ficam de fora: eles não seguem o toro,
+        e a distância pela borda oposta os empurraria através dela.
+
+        Os pares candidatos vêm da busca em grade (toroidal_pairs); impulsos e correções
+        de posição são calculados para todos os contatos de uma vez e somados por asteroide.
+        Quem está em vários contatos recebe a média deles, o que mantém a resolução estável
+        em aglomerados (um par isolado continua perfeitamente elástico).
+        Retorna (slots, variação de velocidade) dos asteroides que sofreram impacto,
+        usados para decidir quais se partem.
+        """
+        n = self.count
+        active = np.flatnonzero(self.alive[:n] & (self.grace[:n] <= 0) & ~self.entering[:n])
+        if len(active) < 2:
+            return active[:0], np.empty(0)
+        width, height = settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT
+        pos, vel, radius = self.pos[active], self.vel[active], self.radius[active]
+
+        # --- Detecção ---
+        i, j = toroidal_pairs(pos, width, height, 2 * radius.max())
+        delta = pos[j] - pos[i]
+        delta[:, 0] = wrap_delta(delta[:, 0], width)
+        delta[:, 1] = wrap_delta(delta[:, 1], height)
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        touching = distance < radius[i] + radius[j]
+        if not touching.any():
+            return active[:0], np.empty(0)
+        i, j, delta, distance = i[touching], j[touching], delta[touching], distance[touching]
+
+        # Normal do contato (de i para j); centros coincidentes usam uma direção fixa.
+        normal = np.zeros_like(delta)
+        normal[:, 0] = 1.0
+        apart = distance > 0
+        normal[apart] = delta[apart] / distance[apart, None]
+
+        # --- Impulsos ---
+        # Massa proporcional à área; o peso de cada contato é dividido pelo número de contatos.
+        contacts = np.bincount(i, minlength=len(active)) + np.bincount(j, minlength=len(active))
+        inverse_mass = 1.0 / (radius * radius)
+        inv_i, inv_j = inverse_mass[i], inverse_mass[j]
+        share_i, share_j = inv_i / contacts[i], inv_j / contacts[j]
+        approach = np.einsum('ij,ij->i', vel[j] - vel[i], normal)
+        impulse = np.where(approach < 0, -(1 + restitution) * approach / (inv_i + inv_j), 0.0)
+        new_vel = vel.copy()
+        np.add.at(new_vel, i, -(impulse * share_i)[:, None] * normal)
+        np.add.at(new_vel, j, (impulse * share_j)[:, None] * normal)
+
+        # --- Separação ---
+        # Desfaz a sobreposição, movendo mais o asteroide mais leve.
+        push = ((radius[i] + radius[j] - distance) / (inv_i + inv_j))[:, None] * normal
+        np.add.at(pos, i, -push * share_i[:, None])
+        np.add.at(pos, j, push * share_j[:, None])
+
+        self.vel[active] = new_vel
+        self.pos[active] = pos
+        self.generation += 1
+
+        # Maior variação de velocidade sofrida por cada asteroide neste tick.
+        delta_v = np.zeros(len(active))
+        np.maximum.at(delta_v, i, impulse * share_i)
+        np.maximum.at(delta_v, j, impulse * share_j)
+        hit = np.flatnonzero(delta_v > 0)
+        return active[hit], delta_v[hit]
+
+    def edge_sprites(self):
+        """
+        Asteroides (já no toro) que podem estar cruzando alguma borda da tela: os que estão
+        a menos de raio x raiz de 2 dela, o alcance da imagem quadrada girada.
+        """
+        n = self.count
+        pos = self.pos[:n]
+        reach = self.radius[:n, None] * math.sqrt(2)
+        near = ((pos < reach) | (pos > self.screen_size - reach)).any(axis=1)
+        slots = np.flatnonzero(near & self.alive[:n] & ~self.entering[:n])
+        return [self.sprites[slot] for slot in slots.tolist()]
+
+    def sync_sprites(self):
+        """Atualiza imagem, máscara e rect dos sprites a partir dos arrays."""
+        n = self.count
+        step = rotation_cache.step
+        quantized = (np.rint(self.angle[:n] / step).astype(np.int32) * step) % 360
+        # Só troca a imagem (e a máscara) dos asteroides cujo ângulo arredondado mudou.
+        changed = np.flatnonzero(self.alive[:n] & (quantized != self.quantized[:n]))
+        self.quantized[:n] = quantized
+        sprites = self.sprites
+        for slot, angle in zip(changed.tolist(), quantized[changed].tolist()):
+            sprite = sprites[slot]
+            sprite.image, sprite.mask = rotation_cache.rotated(sprite.original_image, angle)
+            sprite.rect = sprite.image.get_rect()  # O tamanho muda com a rotação
+
+        alive = np.flatnonzero(self.alive[:n])
+        for slot, center in zip(alive.tolist(), self.pos[alive].tolist()):
+            sprites[slot].rect.center = center
+
+    def kinematics(self):
+        """Array (N, 5) com x, y, vx, vy e raio dos asteroides vivos (cópia)."""
+        alive = np.flatnonzero(self.alive[:self.count])
+        return np.column_stack((self.pos[alive], self.vel[alive], self.radius[alive]))
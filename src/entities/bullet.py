@@ -1,70 +1,45 @@
 import pygame
 import math
 from .. import settings
+from ..utils.sprite_cache import rotation_cache
+from .entity_store import EntityProxy, column_property
 
-class BaseBullet(pygame.sprite.Sprite):
+class BaseBullet(EntityProxy):
     """
     Classe base para todos os projéteis no jogo.
-    Contém a lógica de movimento comum e autodestruição fora da tela.
+    Posição, velocidade e tempo de vida ficam na tabela de projéteis do EntityStore;
+    o movimento e a autodestruição fora da tela são feitos em lote pelo MovementSystem.
     """
-    def __init__(self, position, velocity, image):
-        super().__init__()
-        
-        self.image = image
-        self.position = pygame.math.Vector2(position)
-        self.velocity = velocity
-        
-        self.rect = self.image.get_rect(center=self.position)
-        self.mask = pygame.mask.from_surface(self.image)
-        
-    def update(self, dt, *args, **kwargs):
-        """Atualiza a posição do projétil e verifica se ele saiu da tela."""
-        # Movimento consistente baseado em Delta Time.
-        self.position += self.velocity * (dt / (1000.0 / settings.FPS))
-        self.rect.center = self.position
-        
-        # Remove o projétil se ele sair completamente da tela (com uma margem).
-        screen_rect = pygame.display.get_surface().get_rect()
-        if not screen_rect.inflate(50, 50).colliderect(self.rect):
-            self.kill()
+    def __init__(self, position, velocity, image, angle, table, **values):
+        # Imagem rotacionada (e sua máscara) vêm do cache compartilhado.
+        image, mask = rotation_cache.rotated(image, angle)
+        super().__init__(table, image, mask, position=pygame.math.Vector2(position), velocity=velocity, **values)
 
 class PlayerBullet(BaseBullet):
     """
     Projétil disparado pelo jogador. Herda de BaseBullet e adiciona
-    um tempo de vida limitado.
+    um tempo de vida limitado (componente 'lifetime' da tabela).
     """
-    def __init__(self, position, direction, image):
+    lifetime_countdown = column_property("lifetime")
+
+    def __init__(self, position, direction, image, table):
         # Calcula a velocidade com base na direção e velocidade padrão.
         velocity = direction * settings.BULLET_SPEED
         
-        # Rotaciona a imagem do projétil para alinhar com a sua direção.
+        # Ângulo da imagem do projétil, para alinhá-la com a sua direção.
         angle = math.degrees(math.atan2(-direction.y, direction.x))
-        rotated_image = pygame.transform.rotate(image, angle)
-        
-        # Chama o construtor da classe base.
-        super().__init__(position, velocity, rotated_image)
-        
-        # Define o tempo de vida do projétil.
-        self.lifetime_countdown = settings.BULLET_LIFETIME
-
-    def update(self, dt, *args, **kwargs):
-        """Atualiza o movimento e o tempo de vida do projétil."""
-        super().update(dt) # Chama o update da classe base (movimento e verificação de tela).
         
-        # Reduz o tempo de vida e se destrói se o tempo acabar.
-        self.lifetime_countdown -= dt
-        if self.lifetime_countdown <= 0:
-            self.kill()
+        # Chama o construtor da classe base, já com o tempo de vida do projétil.
+        super().__init__(position, velocity, image, angle, table, lifetime=settings.BULLET_LIFETIME)
 
 class EnemyBullet(BaseBullet):
     """
     Projétil disparado pelos inimigos (UFOs).
     Herda de BaseBullet e tem sua própria velocidade.
     """
-    def __init__(self, position, direction, image):
+    def __init__(self, position, direction, image, table):
         velocity = direction * settings.ENEMY_BULLET_SPEED
         
         angle = math.degrees(math.atan2(-direction.y, direction.x))
-        rotated_image = pygame.transform.rotate(image, angle)
 
-        super().__init__(position, velocity, rotated_image)
\ No newline at end of file
+        super().__init__(position, velocity, image, angle, table)
@@ -0,0 +1,153 @@
+import numpy as np
+import pygame
+
+# --- Componentes ---
+# Cada componente define as colunas que acrescenta a uma tabela:
+# nome da coluna -> (forma por entidade, dtype, valor padrão).
+COMPONENTS = {
+    "transform": {"position": ((2,), np.float64, 0.0)},
+    "velocity": {"velocity": ((2,), np.float64, 0.0)},
+    "lifetime": {"lifetime": ((), np.float64, np.inf)},   # Tempo de vida restante (ms)
+    "collider": {"size": ((2,), np.int64, 0)},             # Largura e altura do rect
+    "render": {"topleft": ((2,), np.int64, 0)},            # Canto do rect, derivado da posição
+}
+
+class ComponentTable:
+    """
+    Tabela densa com todas as entidades de um tipo: uma coluna NumPy por campo dos seus
+    componentes e uma linha por entidade. As linhas [:count] estão sempre ocupadas; ao
+    remover uma entidade, a última linha é movida para o lugar dela.
+
+    Cada linha tem um EntityProxy associado (o sprite visto pelos grupos do Pygame),
+    que é avisado quando a sua linha muda.
+    """
+    def __init__(self, name, components, capacity=64):
+        self.name = name
+        self.components = tuple(components)
+        self.specs = {column: spec for component in self.components for column, spec in COMPONENTS[component].items()}
+        self.count = 0
+        self.capacity = 0
+        self.arrays = {}
+        self.proxies = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Cria (ou aumenta) as colunas, preservando as linhas existentes."""
+        for column, (shape, dtype, default) in self.specs.items():
+            array = np.full((capacity, *shape), default, dtype=dtype)
+            if self.count:
+                array[:self.count] = self.arrays[column][:self.count]
+            self.arrays[column] = array
+        self.capacity = capacity
+
+    def has(self, component):
+        return component in self.components
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, column):
+        """Visão da coluna restrita às linhas ocupadas (alterações escrevem na tabela)."""
+        return self.arrays[column][:self.count]
+
+    def add(self, proxy, **values):
+        """Acrescenta uma entidade e retorna a sua linha. Colunas omitidas recebem o valor padrão."""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        row = self.count
+        for column, (_, _, default) in self.specs.items():
+            self.arrays[column][row] = values.pop(column, default)
+        if values:
+            raise KeyError(f"Colunas desconhecidas na tabela '{self.name}': {', '.join(values)}")
+        self.proxies.append(proxy)
+        self.count += 1
+        return row
+
+    def remove(self, row):
+        """Remove a entidade da linha 'row', movendo a última linha para o seu lugar."""
+        last = self.count - 1
+        if row != last:
+            for array in self.arrays.values():
+                array[row] = array[last]
+            moved = self.proxies[last]
+            self.proxies[row] = moved
+            moved.row = row
+        self.proxies.pop()
+        self.count = last
+
+    def values(self, row):
+        """Valores de todas as colunas de uma linha (cópias), para guardar após a remoção."""
+        return {column: array[row].copy() for column, array in self.arrays.items()}
+
+class EntityStore:
+    """
+    Conjunto de tabelas de componentes de uma sessão, uma por tipo de entidade.
+    Os sistemas percorrem as tabelas que têm os componentes de que precisam
+    (ver MovementSystem), em vez de chamar update() sprite a sprite.
+    """
+    def __init__(self):
+        self.tables = {}
+
+    def create_table(self, name, components, capacity=64):
+        table = ComponentTable(name, components, capacity)
+        self.tables[name] = table
+        return table
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def __len__(self):
+        return sum(len(table) for table in self.tables.values())
+
+    def with_components(self, *components):
+        """Tabelas que têm todos os componentes pedidos."""
+        return [table for table in self.tables.values() if all(table.has(c) for c in components)]
+
+def column_property(column, vector=False):
+    """
+    Propriedade de um EntityProxy ligada a uma coluna da sua tabela. Vetores são
+    retornados como cópias (pygame.math.Vector2); para alterá-los, atribua um novo valor.
+    Depois de kill() os valores finais continuam legíveis, e as atribuições vão para eles
+    (a linha já pode ser de outra entidade, e indexar com None escreveria em todas).
+    """
+    def getter(self):
+        value = self.table.arrays[column][self.row] if self.row is not None else self.final_state[column]
+        return pygame.math.Vector2(value.tolist()) if vector else value.item()
+
+    def setter(self, value):
+        if self.row is None:
+            self.final_state[column] = np.array(value, dtype=self.final_state[column].dtype)
+        else:
+            self.table.arrays[column][self.row] = value
+
+    return property(getter, setter)
+
+class EntityProxy(pygame.sprite.Sprite):
+    """
+    Camada de compatibilidade: um sprite comum para os grupos, colisões e desenho do
+    Pygame, cujos dados de jogo ficam em uma linha de uma ComponentTable. Permite
+    migrar um tipo de entidade por vez para o EntityStore sem alterar telas e sistemas.
+
+    O rect é mantido pelos sistemas a partir da tabela; update() não faz nada.
+    """
+    position = column_property("position", vector=True)
+    velocity = column_property("velocity", vector=True)
+
+    def __init__(self, table, image, mask, **values):
+        super().__init__()
+        self.image = image
+        self.mask = mask
+        self.rect = image.get_rect(center=values["position"])
+        self.table = table
+        self.row = table.add(self, size=self.rect.size, topleft=self.rect.topleft, **values)
+
+    def update(self, *args, **kwargs):
+        """Os dados são atualizados em lote pelos sistemas; nada a fazer por sprite."""
+
+    def kill(self):
+        """Remove o sprite dos grupos e a sua linha da tabela, guardando os valores finais."""
+        super().kill()
+        if self.row is not None:
+            self.final_state = self.table.values(self.row)
+            self.table.remove(self.row)
+            self.row = None
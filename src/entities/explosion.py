@@ -4,7 +4,7 @@ class Explosion(pygame.sprite.Sprite):
     """
     Uma animação de explosão que toca uma vez e depois se autodestrói.
     """
-    def __init__(self, center, frames):
+    def __init__(self, center, frames, rate=75):
         super().__init__()
         
         self.frames = frames                # Lista de imagens (frames da animação)
@@ -13,7 +13,7 @@ class Explosion(pygame.sprite.Sprite):
         
         # --- Controle de Animação ---
         self.frame = 0                      # Índice do frame atual
-        self.rate = 75                      # Duração de cada frame em milissegundos
+        self.rate = rate                    # Duração de cada frame em milissegundos
         self.countdown = self.rate          # Contador regressivo para trocar de frame
         
     def update(self, dt, *args, **kwargs):
@@ -7,7 +7,7 @@ class Particle(pygame.sprite.Sprite):
     Partícula genérica para criar diversos efeitos visuais, como explosões,
     rastros de propulsor, brilhos, etc.
     """
-    def __init__(self, position, p_type='explosion', initial_velocity_vector=None, thrust_direction=None):
+    def __init__(self, position, p_type='explosion', initial_velocity_vector=None, thrust_direction=None, rng=random):
         super().__init__()
         
         self.p_type = p_type
@@ -16,25 +16,25 @@ class Particle(pygame.sprite.Sprite):
         
         # Partícula de brilho para Power-ups
         if self.p_type == 'powerup_glow':
-            self.start_radius = random.randint(8, 12)
+            self.start_radius = rng.randint(8, 12)
             self.radius = self.start_radius
-            self.color = random.choice([(255, 255, 0), (255, 220, 50), (255, 255, 100)])
-            self.velocity = pygame.math.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)) * 0.5
-            self.start_lifetime = random.randint(300, 500)
+            self.color = rng.choice([(255, 255, 0), (255, 220, 50), (255, 255, 100)])
+            self.velocity = pygame.math.Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1)) * 0.5
+            self.start_lifetime = rng.randint(300, 500)
             self.lifetime_countdown = self.start_lifetime
         
         # Partícula para o rastro do propulsor da nave
         elif self.p_type == 'thrust':
-            self.start_radius = random.randint(3, 6) 
+            self.start_radius = rng.randint(3, 6) 
             self.radius = self.start_radius
-            self.start_color = random.choice([(255, 255, 220), (255, 250, 200), (255, 200, 150)])
-            self.end_color = random.choice([(255, 60, 0), (200, 20, 0), (240, 90, 40)])
+            self.start_color = rng.choice([(255, 255, 220), (255, 250, 200), (255, 200, 150)])
+            self.end_color = rng.choice([(255, 60, 0), (200, 20, 0), (240, 90, 40)])
             self.color = self.start_color
 
             ship_momentum = initial_velocity_vector if initial_velocity_vector is not None else pygame.math.Vector2()
-            push_speed = random.uniform(1.5, 4.0) 
-            cone_angle = random.uniform(-10, 10) 
-            self.start_lifetime = random.randint(400, 700)
+            push_speed = rng.uniform(1.5, 4.0) 
+            cone_angle = rng.uniform(-10, 10) 
+            self.start_lifetime = rng.randint(400, 700)
             self.lifetime_countdown = self.start_lifetime
             
             push_vector = thrust_direction.rotate(cone_angle) * push_speed
@@ -42,18 +42,18 @@ class Particle(pygame.sprite.Sprite):
         
         # Partícula para a explosão do UFO (verde)
         elif self.p_type == 'ufo_explosion':
-            self.radius = random.randint(2, 5)
-            self.color = random.choice([(0, 255, 0), (100, 255, 100), (150, 255, 150)])
-            self.velocity = pygame.math.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize() * random.uniform(1, 5)
-            self.lifetime_countdown = random.randint(400, 900)
+            self.radius = rng.randint(2, 5)
+            self.color = rng.choice([(0, 255, 0), (100, 255, 100), (150, 255, 150)])
+            self.velocity = pygame.math.Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1)).normalize() * rng.uniform(1, 5)
+            self.lifetime_countdown = rng.randint(400, 900)
             self.start_lifetime = self.lifetime_countdown
             
         # Partícula de explosão padrão (cinza/branco)
         else: # 'explosion'
-            self.radius = random.randint(2, 5)
-            self.color = random.choice([(180, 180, 180), (255, 255, 255), (200, 200, 200)])
-            self.velocity = pygame.math.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize() * random.uniform(1, 4)
-            self.lifetime_countdown = random.randint(300, 800)
+            self.radius = rng.randint(2, 5)
+            self.color = rng.choice([(180, 180, 180), (255, 255, 255), (200, 200, 200)])
+            self.velocity = pygame.math.Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1)).normalize() * rng.uniform(1, 4)
+            self.lifetime_countdown = rng.randint(300, 800)
             self.start_lifetime = self.lifetime_countdown
 
         # --- Criação da imagem da partícula (um círculo) ---
@@ -61,6 +61,7 @@ class Particle(pygame.sprite.Sprite):
         pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
         self.rect = self.image.get_rect(center=position)
         self.position = pygame.math.Vector2(position)
+        self.base_image = None  # Imagem opaca do brilho, copiada a cada quadro com a transparência
 
     def update(self, dt, *args, **kwargs):
         """Atualiza a posição, aparência e tempo de vida da partícula."""
@@ -68,7 +69,11 @@ class Particle(pygame.sprite.Sprite):
 
         # Efeitos específicos para cada tipo de partícula
         if self.p_type == 'powerup_glow':
-            # Apenas desaparece (fade out)
+            # Apenas desaparece (fade out). A imagem anterior pode estar em um quadro capturado
+            # para o desenho (ver RenderSnapshot): a transparência vai em uma cópia nova.
+            if self.base_image is None:
+                self.base_image = self.image
+            self.image = self.base_image.copy()
             self.image.set_alpha(int(255 * life_percent))
         
         elif self.p_type == 'thrust':
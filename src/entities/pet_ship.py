@@ -0,0 +1,37 @@
+import pygame
+from .. import settings
+from ..utils.sprite_cache import rotation_cache
+
+class PetShip(pygame.sprite.Sprite):
+    """
+    Nave de apoio do power-up PET_SHIP. Orbita a nave do jogador e aponta para o
+    último alvo; a escolha do alvo e os tiros ficam com o PowerUpSystem.
+    """
+    def __init__(self, image, player_ship):
+        super().__init__()
+
+        # --- Configuração de Sprite ---
+        self.original_image = image
+        self.angle = 0.0
+        self.image, self.mask = rotation_cache.rotated(self.original_image, self.angle)
+
+        # --- Órbita ---
+        self.orbit_angle = 0.0  # Ângulo (graus) da posição em volta da nave
+        self.position = player_ship.position + pygame.math.Vector2(settings.PET_ORBIT_RADIUS, 0)
+        self.velocity = pygame.math.Vector2(0, 0)  # Sempre parada em relação à nave (usada nos snapshots)
+        self.rect = self.image.get_rect(center=self.position)
+
+        # --- Tiro ---
+        self.shot_timer = settings.PET_SHOT_COOLDOWN
+
+    def update(self, dt, player_ship, *args, **kwargs):
+        """Acompanha a nave, girando em volta dela."""
+        self.orbit_angle = (self.orbit_angle + settings.PET_ORBIT_SPEED * (dt / (1000.0 / settings.FPS))) % 360
+        self.position = player_ship.position + pygame.math.Vector2(settings.PET_ORBIT_RADIUS, 0).rotate(self.orbit_angle)
+        self.rect.center = self.position
+
+    def aim(self, direction):
+        """Aponta a nave de apoio na direção informada (a imagem original aponta para cima)."""
+        self.angle = -pygame.math.Vector2(0, -1).angle_to(direction) % 360
+        self.image, self.mask = rotation_cache.rotated(self.original_image, self.angle)
+        self.rect = self.image.get_rect(center=self.position)
@@ -0,0 +1,39 @@
+import pygame
+from .. import settings
+
+class PowerUp(pygame.sprite.Sprite):
+    """
+    Um power-up deixado por um inimigo destruído. Deriva lentamente pela tela
+    ("wrap-around" como a nave) até ser coletado pela nave ou expirar.
+    O efeito de cada tipo é aplicado pelo PowerUpSystem.
+    """
+    def __init__(self, kind, position, image, rng):
+        super().__init__()
+
+        # --- Configuração de Sprite ---
+        self.kind = kind  # Um membro de PowerUpType
+        self.base_image = image
+        self.blank_image = pygame.Surface(image.get_size(), pygame.SRCALPHA)  # Usada no pisca-pisca
+        self.image = image
+        self.mask = pygame.mask.from_surface(image)
+        self.rect = self.image.get_rect(center=position)
+
+        # --- Movimento e Tempo de Vida ---
+        self.position = pygame.math.Vector2(position)
+        self.velocity = pygame.math.Vector2(settings.POWERUP_SPEED, 0).rotate(rng.uniform(0, 360))
+        self.lifetime_countdown = settings.POWERUP_LIFETIME_MS
+
+    def update(self, dt, *args, **kwargs):
+        """Move o power-up, pisca perto do fim e o remove quando expira."""
+        self.position += self.velocity * (dt / (1000.0 / settings.FPS))
+        self.position.x %= settings.SCREEN_WIDTH
+        self.position.y %= settings.SCREEN_HEIGHT
+        self.rect.center = self.position
+
+        self.lifetime_countdown -= dt
+        if self.lifetime_countdown <= 0:
+            self.kill()
+        elif self.lifetime_countdown < 2000:
+            # Pisca cada vez mais rápido nos últimos 2 segundos.
+            interval = 100 if self.lifetime_countdown < 1000 else 200
+            self.image = self.blank_image if (self.lifetime_countdown // interval) % 2 else self.base_image
@@ -1,19 +1,24 @@
 import pygame
 import math 
 from .. import settings 
+from ..utils.input import InputFrame
+from ..utils.sprite_cache import rotation_cache
 
 class Ship(pygame.sprite.Sprite):
     """
     Representa a nave controlada pelo jogador.
     Gerencia seu movimento, rotação, tiros e estado de invulnerabilidade.
     """
-    def __init__(self, image_surface):
+    def __init__(self, image_surface, spawn_point=None):
         super().__init__()
         
+        # Ponto de partida e de respawn (o centro da tela; no co-op, cada nave tem o seu).
+        self.spawn_point = spawn_point or (settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
+        
         # --- Configuração de Sprite ---
         self.original_image = image_surface # Imagem base para rotações
         self.image = self.original_image.copy()
-        self.rect = self.image.get_rect(center=(settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2))
+        self.rect = self.image.get_rect(center=self.spawn_point)
         self.mask = pygame.mask.from_surface(self.image)
         
         # --- Física e Movimento ---
@@ -21,6 +26,7 @@ class Ship(pygame.sprite.Sprite):
         self.velocity = pygame.math.Vector2(0, 0)
         self.angle = 0.0
         self.accelerating = False 
+        self.controls = InputFrame()  # Entrada do tick atual, definida pela simulação
 
         # --- Estado da Nave ---
         self.invulnerable = False
@@ -37,24 +43,23 @@ class Ship(pygame.sprite.Sprite):
         self._handle_invulnerability(dt)
 
     def _get_input(self):
-        """Verifica as teclas pressionadas para controlar a nave."""
+        """Aplica a entrada do tick atual (teclado, replay ou bot) para controlar a nave."""
         self.accelerating = False
-        keys = pygame.key.get_pressed()
+        controls = self.controls
         
-        if keys[pygame.K_LEFT]: 
+        if controls.left: 
             self._rotate(settings.SHIP_ROTATION_SPEED)
-        if keys[pygame.K_RIGHT]: 
+        if controls.right: 
             self._rotate(-settings.SHIP_ROTATION_SPEED)
-        if keys[pygame.K_UP]: 
+        if controls.thrust: 
             self._accelerate()
             self.accelerating = True
 
     def _rotate(self, speed):
         """Rotaciona a nave e atualiza sua imagem, rect e máscara."""
         self.angle = (self.angle + speed) % 360
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        self.image, self.mask = rotation_cache.rotated(self.original_image, self.angle)
         self.rect = self.image.get_rect(center=self.position)
-        self.mask = pygame.mask.from_surface(self.image)
 
     def _accelerate(self):
         """Aplica uma força de propulsão na direção em que a nave está apontando."""
@@ -79,11 +84,10 @@ class Ship(pygame.sprite.Sprite):
         self.rect.center = self.position
 
     def _wrap_around_screen(self):
-        """Faz a nave reaparecer no lado oposto da tela."""
-        if self.position.x > settings.SCREEN_WIDTH: self.position.x = 0
-        if self.position.x < 0: self.position.x = settings.SCREEN_WIDTH
-        if self.position.y > settings.SCREEN_HEIGHT: self.position.y = 0
-        if self.position.y < 0: self.position.y = settings.SCREEN_HEIGHT
+        """Faz a nave reaparecer no lado oposto da tela (coordenadas módulo o tamanho da tela)."""
+        self.position.x %= settings.SCREEN_WIDTH
+        self.position.y %= settings.SCREEN_HEIGHT
+        self.rect.center = self.position
     
     def _handle_invulnerability(self, dt):
         """Gerencia o estado de invulnerabilidade e o efeito de piscar."""
@@ -111,7 +115,7 @@ class Ship(pygame.sprite.Sprite):
     
     def respawn(self):
         """Reseta a nave para sua posição e estado iniciais após ser destruída."""
-        self.position = pygame.math.Vector2(settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
+        self.position = pygame.math.Vector2(self.spawn_point)
         self.velocity = pygame.math.Vector2(0, 0)
         self.angle = 0.0
         self._rotate(0) # Reseta a rotação da imagem
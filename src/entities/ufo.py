@@ -8,13 +8,14 @@ class UFO(pygame.sprite.Sprite):
     Representa a nave inimiga (UFO).
     Pode ter diferentes padrões de movimento e atira no jogador.
     """
-    def __init__(self, assets, all_sprites_group, enemy_bullets_group, app, movement_pattern="horizontal"):
+    def __init__(self, assets, all_sprites_group, enemy_bullets_group, bullet_table, app, movement_pattern="horizontal", rng=random):
         super().__init__()
         
         # --- Referências Externas ---
         self.assets = assets
         self.all_sprites = all_sprites_group
         self.enemy_bullets = enemy_bullets_group
+        self.bullet_table = bullet_table  # Tabela do EntityStore onde os projéteis guardam seus dados
         self.app = app
         
         # --- Configuração de Movimento e Aparência ---
@@ -24,8 +25,8 @@ class UFO(pygame.sprite.Sprite):
         # Define a imagem, posição inicial e velocidade com base no padrão de movimento.
         if self.movement_pattern == "horizontal":
             self.image = self.assets['ufo_image']
-            spawn_side = random.choice([-1, 1])
-            y = random.randint(50, settings.SCREEN_HEIGHT - 200)
+            spawn_side = rng.choice([-1, 1])
+            y = rng.randint(50, settings.SCREEN_HEIGHT - 200)
             if spawn_side == -1: # Esquerda
                 x = -self.image.get_width()
                 self.velocity = pygame.math.Vector2(ufo_speed, 0)
@@ -35,8 +36,8 @@ class UFO(pygame.sprite.Sprite):
         
         elif self.movement_pattern == "vertical":
             self.image = self.assets['ufo_vertical_image']
-            spawn_side = random.choice([-1, 1])
-            x = random.randint(100, settings.SCREEN_WIDTH - 100)
+            spawn_side = rng.choice([-1, 1])
+            x = rng.randint(100, settings.SCREEN_WIDTH - 100)
             if spawn_side == -1: # Cima
                 y = -self.image.get_height()
                 self.velocity = pygame.math.Vector2(0, ufo_speed)
@@ -51,7 +52,7 @@ class UFO(pygame.sprite.Sprite):
         
         # --- Lógica de Tiro ---
         self.shot_cooldown = self.app.difficulty_settings["ufo_shot_cooldown"]
-        self.shot_timer = random.uniform(0.5, 1.5) * self.shot_cooldown # Delay inicial variado para não atirar imediatamente
+        self.shot_timer = rng.uniform(0.5, 1.5) * self.shot_cooldown # Delay inicial variado para não atirar imediatamente
 
     def update(self, dt, player_ship):
         """Atualiza a posição do UFO, verifica se saiu da tela e tenta atirar."""
@@ -80,7 +81,7 @@ class UFO(pygame.sprite.Sprite):
                     direction.normalize_ip() # Normaliza para obter um vetor de direção unitário
                 
                 # Cria e adiciona a bala aos grupos.
-                bullet = EnemyBullet(self.rect.center, direction, self.assets['enemy_gunshot_image'])
+                bullet = EnemyBullet(self.rect.center, direction, self.assets['enemy_gunshot_image'], self.bullet_table)
                 self.all_sprites.add(bullet)
                 self.enemy_bullets.add(bullet)
                 
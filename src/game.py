@@ -1,60 +1,125 @@
+import time
+from collections import namedtuple
 import pygame
 from . import settings
-from .entities.ship import Ship
-from .entities.bullet import PlayerBullet
-from .systems.collision_system import CollisionSystem
-from .systems.spawn_system import SpawnSystem
-from .systems.vfx_system import VFXSystem
+from .simulation import Simulation
 from .utils.hud import HUD
+from .utils.perf_overlay import PerfOverlay
 from .utils.background import Starfield
-from .game_state import GameSessionState
+from .utils.render_scaler import RenderScaler
+from .utils.frame_pipeline import FramePipeline
 from .utils.enums import GameState
+from .utils.input import KeyboardInput, ReplayInput
+from .utils.replay import ReplayWriter
+from .ai.pilot import AutopilotInput
+
+# Tudo o que o desenho de um quadro precisa, capturado logo após a simulação do quadro.
+# 'blits' é a lista (imagem, x, y) na ordem de desenho, já com o tremor da câmera; as
+# imagens são as superfícies compartilhadas dos sprites. Com o pipeline, a thread principal
+# desenha essas superfícies enquanto a de trabalho simula o próximo quadro: nenhuma superfície
+# referenciada por um snapshot pode ser alterada depois da captura. Um sprite que muda de
+# aparência troca 'image' por uma superfície nova (ver Particle.update).
+RenderSnapshot = namedtuple("RenderSnapshot", [
+    "blits", "ship_velocity", "score", "lives", "ufo_alert", "effects",
+    "time_paused", "time_scale", "stress_line", "game_over", "input_ended",
+])
 
 class GameScreen:
     """
     Gerencia toda a lógica, atualização e renderização da tela de jogo principal.
     Esta classe é um "mini-aplicativo" que roda quando o estado do jogo é 'PLAYING'.
     """
-    def __init__(self, screen, clock, assets, app):
+    def __init__(self, screen, clock, assets, app, attract=False):
         self.screen = screen
         self.clock = clock
         self.assets = assets
         self.app = app  # Referência à classe principal para acessar configurações globais
+        self.attract = attract  # Modo demonstração: o piloto automático joga e qualquer tecla volta ao menu
         self._start_game()
 
     def _start_game(self):
         """Inicializa ou reinicializa todos os componentes para uma nova partida."""
-        # Cria um contêiner para todos os dados da sessão de jogo atual.
-        self.state = GameSessionState(self.assets, self.app.difficulty_settings)
+        # Cria a simulação (estado da sessão + sistemas que gerenciam a lógica do jogo).
+        # O modo demonstração ignora replays e sementes fixas: cada demonstração é uma partida diferente.
+        replay = None if self.attract else self.app.replay
+        seed = None if self.attract else self.app.session_seed
+        self.sim = Simulation(self.assets, self.app, seed=replay.seed if replay else seed)
+        self.state = self.sim.state
+        self.vfx = self.sim.vfx
         
-        # Inicializa os sistemas que gerenciam a lógica do jogo.
-        self.vfx = VFXSystem(self.state, self.app)
-        self.collision = CollisionSystem(self.state, self.vfx, self.assets, self.app)
-        self.spawn = SpawnSystem(self.state, self.assets, self.app)
+        # A entrada vem do teclado, de um replay gravado (opcionalmente a partir de um tick)
+        # ou do piloto automático.
+        if replay:
+            frames = replay.seek(self.sim, self.app.replay_start) if self.app.replay_start else replay.frames()
+            self.input = ReplayInput(frames)
+        elif self.attract:
+            self.input = AutopilotInput(self.state, settings.ATTRACT_SKILL)
+        elif self.app.autopilot_skill:
+            self.input = AutopilotInput(self.state, self.app.autopilot_skill)
+        else:
+            self.input = KeyboardInput()
+        # Velocidade do jogo: só replays e o piloto automático podem ser acelerados ou
+        # desacelerados (numa partida jogada, a escala de tempo seria uma vantagem).
+        self.time_controls = isinstance(self.input, (ReplayInput, AutopilotInput)) and not self.attract
+        if self.time_controls:
+            self.state.clock.set_scale(self.app.time_scale)
+        self.state.clock.fixed_step = replay is not None  # Nos replays, cada passo é um tick gravado
+        if self.app.broadcaster:
+            self.app.broadcaster.attach(self.sim)
+        self.recorder = None
+        if self.app.record_path and not replay and not self.attract:
+            self.recorder = ReplayWriter(self.app.record_path, self.sim, self.app.difficulty_key, self.app.difficulty_overrides)
         
         # Inicializa os componentes de interface e visuais.
         self.hud = HUD(self.assets)
         self.background = Starfield()
+        # O mundo pode ser desenhado em resolução interna menor (opção das Configurações).
+        self.renderer = RenderScaler(self.screen, self.app.render_scale)
+        # Sobreposição de desempenho (F3); sempre visível no modo de estresse.
+        self.perf_overlay = PerfOverlay(self.assets, visible=self.sim.stress is not None)
+        self.stress_summary = None  # Linhas do resumo, quando o benchmark termina
+        
+        # Simulação em paralelo com o desenho (ver FramePipeline), criada a cada execução da tela.
+        self.pipeline = None
+        self.pending_commands = []  # Comandos para a simulação, enviados com o próximo trabalho
+        self.input_ended = False    # A fonte de entrada acabou (fim do replay)
+        self.view = self._capture()  # Último quadro capturado, desenhado por _draw()
         
         # Variáveis de controle do jogo.
-        self.player_shot_countdown = 0
         self.running = True
         
         # Define o estado padrão para o qual a tela de jogo transitará ao terminar.
-        self.next_screen = GameState.GAME_OVER
+        # A demonstração termina voltando ao menu, sem tela de Game Over nem recorde.
+        self.end_screen = GameState.MENU if self.attract else GameState.GAME_OVER
+        self.next_screen = self.end_screen
         self.screen_data = None
 
     def run(self):
         """O loop principal da tela de jogo. Continua até que 'self.running' se torne False."""
         self.running = True
+        self.app.gc.enter_gameplay()  # Sem coletas automáticas no meio da partida
+        self._start_pipeline()
         while self.running:
             # Garante que o jogo rode a uma taxa de quadros constante e obtém o delta time.
-            dt = self.clock.tick(settings.FPS)
+            frame_rate = self.app.get_frame_rate()
+            dt = self.clock.tick(frame_rate)
+            frame_start = time.perf_counter()
             
             # Estrutura clássica de um game loop.
             self._handle_events()
-            self._update(dt)
+            if self.pipeline:
+                self._update_pipelined(dt)
+            else:
+                self._update(dt)
             self._draw()
+            
+            # Amostra grupos e memória para o relatório de vazamentos, se ativo.
+            if self.app.leak_monitor:
+                self.app.leak_monitor.maybe_sample(self.state, pygame.time.get_ticks() / 1000)
+            
+            # Disponibiliza o quadro para consumidores, se a exportação estiver ativa.
+            if self.app.frame_exporter:
+                self.app.frame_exporter.publish(self.screen)
 
             # Se a transição de fade-out terminou, encerra o loop desta tela.
             if self.app.transition.is_faded_out():
@@ -62,10 +127,37 @@ class GameScreen:
 
             # Atualiza o conteúdo da tela inteira.
             pygame.display.flip()
+            
+            # Aproveita a folga do quadro para coletar lixo (e registra os tempos, se ativo).
+            work_ms = (time.perf_counter() - frame_start) * 1000
+            self._record_frame_time(work_ms, 1000 / frame_rate)
+            self.app.gc.end_frame(dt, work_ms, 1000 / frame_rate)
+        
+        self._stop_pipeline()
+        # A transição de tela é um bom momento para uma coleta completa.
+        self.app.gc.exit_gameplay()
         
         # Retorna o próximo estado e os dados para a classe App.
         return self.next_screen, self.screen_data
 
+    def _record_frame_time(self, work_ms, frame_budget_ms):
+        """Alimenta a sobreposição de desempenho, o ajuste de qualidade e as medições do modo de estresse."""
+        self.perf_overlay.record(work_ms)
+        stress = self.sim.stress
+        # O benchmark mede sempre a mesma carga: a qualidade não se adapta no modo de estresse.
+        if not stress:
+            self.app.quality.record(work_ms, frame_budget_ms)
+        if stress and not self.stress_summary:
+            stress.record_frame(work_ms, len(self.state.all_sprites))
+            if stress.finished:
+                self.stress_summary = [*stress.summary(), self.renderer.describe()]
+                print("\n".join(["=== Resultado do modo de estresse ===", *self.stress_summary]))
+
+    def end_session(self):
+        """Finaliza a partida, fechando a gravação do replay, se houver."""
+        if self.recorder:
+            self.recorder.close()
+
     def _handle_events(self):
         """Processa todas as entradas do usuário (teclado, fechar janela)."""
         # Não processa eventos se uma transição de tela estiver ativa.
@@ -78,14 +170,66 @@ class GameScreen:
                 self.next_screen = GameState.QUIT
                 self.app.transition.start_fade_out()
             
+            # No modo demonstração, qualquer tecla (ou a perda de foco) volta ao menu.
+            if self.attract:
+                if self.app.handle_window_event(event) or event.type == pygame.KEYDOWN:
+                    self._end_attract()
+                continue
+            
+            # Pausa automaticamente se a janela perder o foco ou for minimizada.
+            if self.app.handle_window_event(event):
+                self._pause_game()
+            
             # Eventos de teclas pressionadas.
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    self._handle_player_shooting()
-                elif event.key == pygame.K_ESCAPE:
-                    self.next_screen = GameState.PAUSE
-                    self.screen_data = self.screen.copy()  # Salva um screenshot para o fundo da pausa
+                # Com o resumo do benchmark na tela, qualquer tecla volta ao menu.
+                if self.stress_summary:
+                    self.next_screen = GameState.MENU
                     self.app.transition.start_fade_out()
+                elif event.key == pygame.K_F3:
+                    self.perf_overlay.toggle()
+                elif event.key == pygame.K_SPACE:
+                    self._on_sim(self.input.queue_shot)
+                elif self.time_controls and event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    self._on_sim(lambda: self._change_time_scale(-1))
+                elif self.time_controls and event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                    self._on_sim(lambda: self._change_time_scale(1))
+                elif self.time_controls and event.key == pygame.K_p:
+                    self._on_sim(self.state.clock.toggle_pause)
+                elif event.key == pygame.K_ESCAPE:
+                    self._pause_game()
+
+    def _change_time_scale(self, direction):
+        """Passa para a velocidade de jogo anterior (-1) ou seguinte (+1) de TIME_SCALES."""
+        scales = settings.TIME_SCALES
+        current = min(range(len(scales)), key=lambda i: abs(scales[i] - self.state.clock.scale))
+        self.state.clock.set_scale(scales[max(0, min(len(scales) - 1, current + direction))])
+
+    def _pause_game(self):
+        """Inicia a transição para a tela de pausa."""
+        # Ignora pedidos repetidos enquanto a transição já estiver em andamento.
+        if self.app.transition.is_active():
+            return
+        self.next_screen = GameState.PAUSE
+        self.screen_data = self.screen.copy()  # Salva um screenshot para o fundo da pausa
+        self.app.transition.start_fade_out()
+
+    def _end_attract(self):
+        """Encerra o modo demonstração e volta ao menu principal."""
+        if self.app.transition.is_active():
+            return
+        self.next_screen = GameState.MENU
+        self.app.transition.start_fade_out()
+
+    def _on_sim(self, command):
+        """
+        Executa um comando que altera a simulação. Com o pipeline ativo, o comando vai junto
+        com o próximo trabalho e roda na thread da simulação, antes dos ticks do quadro.
+        """
+        if self.pipeline:
+            self.pending_commands.append(command)
+        else:
+            command()
 
     def _update(self, dt):
         """Atualiza a lógica de todos os objetos e sistemas do jogo."""
@@ -94,67 +238,188 @@ class GameScreen:
             self.app.transition.update()
             return
             
-        # Atualiza o cooldown de tiro do jogador.
-        if self.player_shot_countdown > 0:
-            self.player_shot_countdown -= dt
-            
-        # Cria partículas de rastro se a nave estiver acelerando.
-        if self.state.ship.accelerating:
-            self.vfx.create_thrust_particles()
-        
-        # Delega a atualização para os sistemas especializados.
-        self.spawn.update(dt)
-        self.vfx.update()
-        self.collision.process()
+        # Com o benchmark encerrado, a simulação fica congelada exibindo o resumo.
+        if self.stress_summary:
+            return
         
-        # Atualiza todos os sprites do jogo.
-        self.state.all_sprites.update(dt, self.state.ship)
+        self.input.sample()
+        self._simulate(dt)
+        self._broadcast()
+        self.app.transition.update()
+        self._apply_view(self._capture())
+
+    def _simulate(self, dt):
+        """Avança a simulação pelos ticks de um quadro que durou 'dt' ms."""
+        if self.input_ended or self.sim.is_game_over():
+            return
+        # O relógio da sessão converte o tempo real do quadro em ticks de simulação
+        # (nenhum se pausado, vários no avanço rápido).
+        for step_dt in self.state.clock.frame_steps(dt):
+            # Obtém a entrada deste tick. Um replay sem quadros restantes encerra a partida.
+            frame = self.input.poll(step_dt)
+            if frame is None:
+                self.input_ended = True
+                return
+            if self.recorder:
+                self.recorder.record(frame)
+            
+            # Avança a simulação em um tick.
+            self.sim.step(frame)
+            if self.sim.is_game_over():
+                break
+
+    def _broadcast(self):
+        """Entrega o estado aos espectadores, se a transmissão estiver ativa (na thread da simulação)."""
+        if self.app.broadcaster:
+            self.app.broadcaster.publish()
+
+    def _capture(self):
+        """Captura o que o desenho precisa do estado atual (ver RenderSnapshot)."""
+        # Obtém o deslocamento da câmera para o efeito de "screen shake".
+        offset_x, offset_y = self.vfx.get_render_offset()
+        ship = self.state.ship
         
+        # Todos os sprites, exceto a nave, para que o rastro fique atrás dela; depois, a parte
+        # do outro lado da tela dos asteroides que cruzam as bordas (mesmas cópias das colisões).
+        blits = [(sprite.image, sprite.rect.x + offset_x, sprite.rect.y + offset_y)
+                 for sprite in self.state.all_sprites if sprite is not ship]
+        blits += [(ghost.image, ghost.rect.x + offset_x, ghost.rect.y + offset_y) for ghost in self.sim.wrap.asteroid_ghosts]
+        # A nave por último, para que ela fique por cima de tudo.
+        if ship.visible:
+            blits.append((ship.image, ship.rect.x + offset_x, ship.rect.y + offset_y))
+            blits += [(ghost.image, ghost.rect.x + offset_x, ghost.rect.y + offset_y) for ghost in self.sim.wrap.ship_ghosts]
+
+        clock = self.state.clock
+        effects = [(self.sim.powerups.LABELS[kind], max(0, end - clock.now) / 1000) for kind, end in self.state.active_effects.items()]
+        stress = self.sim.stress
+        stress_line = f"Estresse: estágio {stress.stage + 1}/{len(settings.STRESS_STAGES)}, alvo {stress.target}" if stress else None
+        return RenderSnapshot(blits, pygame.math.Vector2(ship.velocity), self.state.score, self.state.lives, bool(self.state.ufos),
+                              effects, clock.paused, clock.scale, stress_line, self.sim.is_game_over(), self.input_ended)
+
+    def _apply_view(self, view):
+        """Adota o quadro capturado para o desenho e verifica o fim da partida."""
+        self.view = view
         # Atualiza o fundo para criar um efeito de parallax com base na velocidade da nave.
-        self.background.update_game_parallax(self.state.ship.velocity)
+        self.background.update_game_parallax(view.ship_velocity)
+        
+        # Verifica a condição de fim de jogo (ou o fim do replay).
+        if (view.game_over or view.input_ended) and not self.app.transition.is_active():
+            self.next_screen = self.end_screen
+            self.screen_data = view.score  # Passa a pontuação final para a tela de Game Over
+            self.app.transition.start_fade_out()
+
+    # --- Simulação e Desenho em Paralelo ---
+    def _start_pipeline(self):
+        """
+        Ativa o pipeline se configurado. O modo de estresse e o monitor de vazamentos medem
+        ou percorrem o estado a partir da thread principal e ficam sempre no caminho sequencial.
+        """
+        if self.app.pipelined and not self.sim.stress and not self.app.leak_monitor:
+            self.pipeline = FramePipeline(self._produce)
+            self.pipeline.start()
+
+    def _stop_pipeline(self):
+        """Termina os trabalhos em andamento e volta ao caminho sequencial (ex: na pausa)."""
+        if not self.pipeline:
+            return
+        view = self.pipeline.stop()
+        if view is not None:
+            self.view = view  # O fim da partida, se houver, é tratado quando a tela voltar a rodar
+        self.pipeline = None
+        # Comandos que não chegaram a ser enviados rodam agora, sem a outra thread.
+        commands, self.pending_commands = self.pending_commands, []
+        for command in commands:
+            command()
+
+    def _update_pipelined(self, dt):
+        """
+        Um quadro com o pipeline: recolhe o quadro já simulado, envia a simulação do
+        próximo para a thread de trabalho e o desenho (em _draw) acontece enquanto ela roda.
+        """
+        view = self.pipeline.collect()
+        if view is not None:
+            self._apply_view(view)
+        if self.app.transition.is_active():
+            self.app.transition.update()
+            return
         
+        self.input.sample()
+        commands, self.pending_commands = self.pending_commands, []
+        self.pipeline.submit((dt, commands))
         self.app.transition.update()
 
-        # Verifica a condição de fim de jogo.
-        if self.state.lives <= 0:
-            self.next_screen = GameState.GAME_OVER
-            self.screen_data = self.state.score  # Passa a pontuação final para a tela de Game Over
-            self.app.transition.start_fade_out()
+    def _produce(self, job):
+        """Trabalho da thread de simulação: comandos pendentes, os ticks do quadro e a captura."""
+        dt, commands = job
+        for command in commands:
+            command()
+        self._simulate(dt)
+        self._broadcast()
+        return self._capture()
 
     def _draw(self):
-        """Desenha todos os elementos visuais na tela."""
-        # Obtém o deslocamento da câmera para o efeito de "screen shake".
-        render_offset = self.vfx.get_render_offset()
-        
-        # Limpa a tela e desenha o fundo.
-        self.screen.fill((10, 10, 25))
-        self.background.draw(self.screen)
-        
-        # Desenha todos os sprites, exceto a nave, para que o rastro fique atrás dela.
-        for sprite in self.state.all_sprites:
-            if sprite is not self.state.ship:
-                self.screen.blit(sprite.image, (sprite.rect.x + render_offset[0], sprite.rect.y + render_offset[1]))
+        """Desenha o último quadro capturado na tela."""
+        view = self.view
+        draw_start = time.perf_counter()
+
+        # O mundo é desenhado na resolução interna (a própria tela, na escala 1).
+        renderer = self.renderer
+        renderer.set_scale(self.app.render_scale)
+        world = renderer.world()
         
-        # Desenha a nave por último para que ela fique por cima de tudo.
-        if self.state.ship.visible:
-            self.screen.blit(self.state.ship.image, (self.state.ship.rect.x + render_offset[0], self.state.ship.rect.y + render_offset[1]))
+        # Limpa a tela e desenha o fundo e os sprites.
+        world.fill((10, 10, 25))
+        self.background.draw(world, self.app.quality.preset["star_layers"], renderer.scale)
+        for image, x, y in view.blits:
+            renderer.blit(image, x, y)
+
+        # Amplia o mundo para a janela; a interface abaixo já é desenhada na resolução nativa.
+        renderer.present()
+        renderer.record((time.perf_counter() - draw_start) * 1000)
 
         # Desenha a interface (HUD) e a camada de transição por cima de todos os elementos do jogo.
-        self.hud.draw(self.screen, self.state.score, self.state.lives, bool(self.state.ufos))
+        self.hud.draw(self.screen, view.score, view.lives, view.ufo_alert, view.effects)
+        if self.attract:
+            self._draw_attract_banner()
+        if self.time_controls:
+            self._draw_time_scale()
+        extra_lines = [self.app.quality.describe(), self.renderer.describe()]
+        if self.pipeline:
+            extra_lines.append(self.pipeline.describe())
+        if self.app.broadcaster:
+            extra_lines.append(self.app.broadcaster.describe())
+        if view.stress_line:
+            extra_lines.append(view.stress_line)
+        self.perf_overlay.draw(self.screen, self.clock.get_fps(), self.state, extra_lines)
+        if self.stress_summary:
+            self._draw_stress_summary()
         self.app.transition.draw()
-        
-    def _handle_player_shooting(self):
-        """Lida com a lógica de criação de um projétil quando o jogador atira."""
-        # Verifica se a nave está viva e se o cooldown de tiro já terminou.
-        if self.state.ship.alive() and self.player_shot_countdown <= 0:
-            self.player_shot_countdown = settings.PLAYER_BULLET_COOLDOWN
-            
-            # Toca o som de tiro, se estiver ativado.
-            if self.app.sfx_on:
-                self.assets['player_gunshot_sound'].play()
-                
-            # Cria e adiciona a nova bala aos grupos de sprites apropriados.
-            bullet_data = self.state.ship.shoot(self.assets['player_gunshot_image'])
-            new_bullet = PlayerBullet(bullet_data["pos"], bullet_data["dir"], bullet_data["img"])
-            self.state.all_sprites.add(new_bullet)
-            self.state.bullets.add(new_bullet)
+
+    def _draw_stress_summary(self):
+        """Desenha o painel com o resultado do modo de estresse."""
+        panel = pygame.Rect(0, 0, 820, 80 + 32 * len(self.stress_summary))
+        panel.center = (settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
+        pygame.draw.rect(self.screen, (10, 10, 25), panel)
+        pygame.draw.rect(self.screen, (255, 255, 255), panel, 2)
+
+        text_renderer = self.assets['text_renderer']
+        text_renderer.draw(self.screen, "Resultado do Benchmark", 28, (255, 215, 0), panel.centerx, panel.top + 30)
+        for i, line in enumerate(self.stress_summary):
+            text_renderer.draw(self.screen, line, 18, (255, 255, 255), panel.left + 30, panel.top + 70 + i * 32, align="left")
+
+    def _draw_time_scale(self):
+        """Indica a velocidade do jogo quando ela não é a normal."""
+        if self.view.time_paused:
+            label = "PAUSADO (P)"
+        elif self.view.time_scale != 1:
+            label = f"Velocidade x{self.view.time_scale:g}"
+        else:
+            return
+        self.assets['text_renderer'].draw(self.screen, label, 20, (255, 215, 0), settings.SCREEN_WIDTH / 2, 60)
+
+    def _draw_attract_banner(self):
+        """Desenha o aviso piscante do modo demonstração."""
+        if (pygame.time.get_ticks() // 600) % 2 == 0:
+            text_renderer = self.assets['text_renderer']
+            text_renderer.draw(self.screen, "DEMONSTRAÇÃO", 36, (255, 215, 0), settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT * 0.40)
+            text_renderer.draw(self.screen, "Pressione qualquer tecla", 20, (255, 255, 255), settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT * 0.40 + 50)
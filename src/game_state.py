@@ -1,6 +1,11 @@
 import pygame
 from . import settings
 from .entities.ship import Ship
+from .entities.asteroid_field import AsteroidField
+from .entities.entity_store import EntityStore
+from .utils.session_clock import SessionClock
+from .utils.session_random import SessionRandom
+from .utils.spatial_index import SpatialIndex
 
 class GameSessionState:
     """
@@ -8,7 +13,16 @@ class GameSessionState:
     Isso desacopla os dados da lógica principal do jogo, facilitando o reinício
     de uma partida e o acesso a esses dados por diferentes sistemas.
     """
-    def __init__(self, assets, difficulty_settings):
+    def __init__(self, assets, difficulty_settings, seed=None, players=1):
+        # --- Aleatoriedade da Sessão ---
+        # Todos os sistemas sorteiam destes fluxos, derivados de uma única semente.
+        self.rng = SessionRandom(seed)
+        self.seed = self.rng.seed
+        
+        # --- Tempo da Sessão ---
+        # Relógio de jogo lido por todos os sistemas (pausa, escala de tempo e timers agendados).
+        self.clock = SessionClock()
+        
         # --- Grupos de Sprites ---
         # Esses grupos gerenciam a atualização e o desenho de todos os objetos do jogo.
         self.all_sprites = pygame.sprite.Group()
@@ -18,14 +32,41 @@ class GameSessionState:
         self.particles = pygame.sprite.Group()
         self.ufos = pygame.sprite.Group()
         self.enemy_bullets = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.pets = pygame.sprite.GroupSingle()  # Nave de apoio do power-up PET_SHIP
+        
+        # --- Cinemática dos Asteroides ---
+        # Posições, velocidades e rotações ficam em arrays, atualizados em lote (ver AsteroidField).
+        self.asteroid_field = AsteroidField()
+        # Consultas de alvo mais próximo (asteroides e UFOs), para entidades que miram sozinhas.
+        self.spatial = SpatialIndex(self.asteroid_field, self.ufos)
+
+        # --- Tabelas de Componentes ---
+        # Entidades já migradas para o EntityStore (arrays densos, atualizados pelo MovementSystem).
+        # Os sprites correspondentes continuam nos grupos acima, como antes.
+        self.entities = EntityStore()
+        bullet_components = ("transform", "velocity", "lifetime", "collider", "render")
+        self.entities.create_table("player_bullets", bullet_components)
+        self.entities.create_table("enemy_bullets", bullet_components)
         
         # --- Variáveis de Estado da Partida ---
         self.score = 0
         self.lives = difficulty_settings["start_lives"]
         self.wave_count = 1
+        self.deaths = {"asteroid": 0, "ufo": 0, "enemy_bullet": 0}  # Vidas perdidas por causa
+        self.active_effects = {}  # Power-ups temporários ativos (PowerUpType -> término no relógio da sessão)
         
         # --- Inicialização do Jogador ---
         # Cria a instância da nave e a adiciona aos grupos relevantes.
         self.ship = Ship(assets['ship_image'])
         self.all_sprites.add(self.ship)
         self.player_group.add(self.ship)
+        
+        # No co-op, as naves dos demais jogadores começam ao lado da primeira. Elas dividem
+        # as vidas e a pontuação; UFOs e a nave de apoio continuam seguindo a primeira nave.
+        self.ships = [self.ship]
+        for player in range(1, players):
+            spawn_point = (settings.SCREEN_WIDTH / 2 + player * settings.COOP_SPAWN_SPACING, settings.SCREEN_HEIGHT / 2)
+            partner = Ship(assets['ship_image'], spawn_point)
+            self.all_sprites.add(partner)
+            self.ships.append(partner)
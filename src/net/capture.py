@@ -0,0 +1,100 @@
+import math
+import numpy as np
+from src.entities.asteroid import Asteroid
+from src.entities.bullet import EnemyBullet, PlayerBullet
+from src.entities.explosion import Explosion
+from src.entities.particles import Particle
+from src.entities.pet_ship import PetShip
+from src.entities.powerup import PowerUp
+from src.entities.ship import Ship
+from src.entities.ufo import UFO
+from src.net import protocol
+
+PARTICLE_KINDS = {
+    'explosion': protocol.EntityKind.PARTICLE_EXPLOSION,
+    'ufo_explosion': protocol.EntityKind.PARTICLE_UFO,
+    'thrust': protocol.EntityKind.PARTICLE_THRUST,
+    'powerup_glow': protocol.EntityKind.PARTICLE_GLOW,
+}
+
+class EntityCapture:
+    """
+    Converte o estado de uma Simulation nos registros quantizados do protocolo (ver
+    protocol), usados pelo servidor do co-op e pela transmissão para espectadores.
+
+    Cada entidade recebe um id de rede estável enquanto existir, para que os deltas
+    entre snapshots só levem o que mudou.
+    """
+    def __init__(self, sim, assets):
+        self.sim = sim
+        self.ids = {}  # sprite -> id de rede
+        self.next_id = 1
+        self.explosion_frames = {id(frame): index for index, frame in enumerate(assets['explosion_anim'])}
+
+    def header(self):
+        """Cabeçalho do snapshot com o placar, as vidas e as flags do estado atual."""
+        state = self.sim.state
+        flags = (protocol.FLAG_GAME_OVER if self.sim.is_game_over() else 0) | (protocol.FLAG_UFO_ALERT if state.ufos else 0)
+        return protocol.SnapshotHeader(state.score, max(0, min(255, state.lives)), flags)
+
+    def capture(self):
+        """
+        Registros quantizados das entidades: (registros das entidades de jogo, partículas).
+        As partículas vêm à parte, como ([(id, registro)], array de posições), para o filtro de interesse.
+        """
+        records = {}
+        particles = []
+        for entity_id, record, is_particle in self._entities():
+            if is_particle:
+                particles.append((entity_id, record))
+            else:
+                records[entity_id] = record
+        positions = np.array([record[1:3] for _, record in particles], dtype=float).reshape(-1, 2)
+        return records, (particles, positions)
+
+    def capture_all(self):
+        """Todos os registros, partículas incluídas, em um único dicionário {id: registro}."""
+        return {entity_id: record for entity_id, record, _ in self._entities()}
+
+    def _entities(self):
+        """(id, registro, é partícula) de cada entidade com representação na rede."""
+        ids = {}
+        for sprite in self.sim.state.all_sprites:
+            record = self._record(sprite)
+            if record is None:
+                continue
+            entity_id = self.ids.get(sprite)
+            if entity_id is None:
+                entity_id = self.next_id
+                self.next_id = self.next_id % 0xFFFFFFFE + 1
+            ids[sprite] = entity_id
+            yield entity_id, record, isinstance(sprite, Particle)
+        self.ids = ids  # Entidades que sumiram perdem o id
+
+    def _record(self, sprite):
+        x, y = sprite.rect.center
+        angle, variant = 0, 0
+        if isinstance(sprite, Ship):
+            kind = protocol.EntityKind.SHIP
+            angle = sprite.angle
+            variant = self.sim.state.ships.index(sprite) | (0 if sprite.visible else protocol.VARIANT_HIDDEN)
+        elif isinstance(sprite, Asteroid):
+            kind, angle, variant = protocol.EntityKind.ASTEROID, sprite.rotation, sprite.size
+        elif isinstance(sprite, UFO):
+            kind, variant = protocol.EntityKind.UFO, (1 if sprite.movement_pattern == "vertical" else 0)
+        elif isinstance(sprite, (PlayerBullet, EnemyBullet)):
+            kind = protocol.EntityKind.PLAYER_BULLET if isinstance(sprite, PlayerBullet) else protocol.EntityKind.ENEMY_BULLET
+            velocity = sprite.velocity
+            angle = math.degrees(math.atan2(-velocity.y, velocity.x))
+        elif isinstance(sprite, PowerUp):
+            kind = protocol.EntityKind.POWERUP
+            variant = protocol.VARIANT_HIDDEN if sprite.image is sprite.blank_image else 0
+        elif isinstance(sprite, PetShip):
+            kind, angle = protocol.EntityKind.PET, sprite.angle
+        elif isinstance(sprite, Explosion):
+            kind, variant = protocol.EntityKind.EXPLOSION, self.explosion_frames.get(id(sprite.image), 0)
+        elif isinstance(sprite, Particle):
+            kind, variant = PARTICLE_KINDS[sprite.p_type], min(255, sprite.image.get_width() // 2)
+        else:
+            return None
+        return (kind, protocol.quantize_position(x), protocol.quantize_position(y), protocol.quantize_angle(angle), variant)
@@ -0,0 +1,225 @@
+import argparse
+import pygame
+from src import settings
+from src.net import protocol
+from src.net.link import NetworkLink, open_socket
+from src.systems.wrap_system import wrap_offsets
+from src.utils.input import InputFrame
+from src.utils.sprite_cache import rotation_cache
+
+Kind = protocol.EntityKind
+
+# Cores das partículas recebidas (o servidor só envia o tipo e o raio).
+PARTICLE_COLORS = {
+    Kind.PARTICLE_EXPLOSION: (200, 200, 200),
+    Kind.PARTICLE_UFO: (100, 255, 100),
+    Kind.PARTICLE_THRUST: (255, 150, 60),
+    Kind.PARTICLE_GLOW: (255, 230, 60),
+}
+
+# Tom da nave de cada jogador (o primeiro usa a imagem original).
+PLAYER_TINTS = [None, (120, 200, 255), (255, 150, 120), (170, 255, 140)]
+
+class CoopClient:
+    """
+    Cliente leve do co-op: envia a entrada do jogador e reconstrói o estado da partida a
+    partir dos snapshots do servidor. Não simula nada.
+
+    Cada snapshot é um delta contra um tick anterior (a base); os estados recebidos ficam
+    guardados até o servidor passar a usar uma base mais nova. Snapshots mais antigos que o
+    último aplicado (reordenados pela rede) são ignorados. O ack enviado com a entrada diz ao
+    servidor qual foi o último tick recebido.
+    """
+    HELLO_INTERVAL_MS = 250
+
+    def __init__(self, server_address, host="127.0.0.1", link_options=None, clock=None):
+        self.server = tuple(server_address)
+        self.sock = open_socket(host, 0)
+        self.link = NetworkLink(self.sock, clock=clock, **(link_options or {}))
+        self.player = None   # Índice da nave, depois do WELCOME
+        self.rejected = False  # O servidor respondeu que a partida está cheia
+        self.next_hello = 0
+
+        # --- Estado Recebido ---
+        self.states = {}     # tick -> registros (bases possíveis dos próximos deltas)
+        self.tick = None     # Tick do estado atual
+        self.header = protocol.SnapshotHeader(0, 0, 0)
+        self.records = {}    # id -> registro do estado atual
+        self.shots = 0       # Contador de tiros pedidos (ver protocol)
+        self.sequence = 0    # Contador de INPUTs enviados
+
+        # --- Medições ---
+        self.bytes_received = 0
+        self.snapshots_applied = 0
+        self.snapshots_stale = 0        # Chegaram depois de um mais novo
+        self.snapshots_undecodable = 0  # A base já tinha sido descartada
+
+    @property
+    def game_over(self):
+        return bool(self.header.flags & protocol.FLAG_GAME_OVER)
+
+    def send_input(self, frame):
+        """Envia os botões de um InputFrame (o tiro incrementa o contador de tiros)."""
+        if self.player is None:
+            return
+        if frame.shoot:
+            self.shots += 1
+        self.sequence += 1
+        buttons = frame._replace(shoot=False).to_bits()
+        self.link.send(protocol.encode_input(self.tick, buttons, self.shots, self.sequence), self.server)
+        self.link.flush()
+
+    def poll(self):
+        """Processa os datagramas recebidos. Retorna os ticks dos snapshots aplicados."""
+        now = self.link.clock()
+        if self.player is None and not self.rejected and now >= self.next_hello:
+            self.link.send(protocol.encode_hello(), self.server)
+            self.next_hello = now + self.HELLO_INTERVAL_MS
+
+        applied = []
+        for data, address in self.link.receive():
+            if address != self.server:
+                continue
+            self.bytes_received += len(data)
+            kind = protocol.packet_type(data)
+            if kind == protocol.WELCOME:
+                self.player, _ = protocol.decode_welcome(data)
+            elif kind == protocol.FULL:
+                self.rejected = True
+            elif kind == protocol.SNAPSHOT:
+                if self._apply_snapshot(data):
+                    applied.append(self.tick)
+        self.link.flush()
+        return applied
+
+    def _apply_snapshot(self, data):
+        tick = protocol.snapshot_tick(data)
+        if self.tick is not None and tick <= self.tick:
+            # Repetido (após o fim da partida o servidor reenvia o último tick) ou fora de ordem.
+            self.snapshots_stale += tick < self.tick
+            return False
+        decoded = protocol.decode_snapshot(data, self.states)
+        if decoded is None:
+            self.snapshots_undecodable += 1
+            return False
+        tick, base_tick, header, records = decoded
+        self.tick, self.header, self.records = tick, header, records
+        self.states[tick] = records
+        # O servidor nunca volta a uma base mais antiga que a deste snapshot.
+        if base_tick is not None:
+            for old_tick in [t for t in self.states if t < base_tick]:
+                del self.states[old_tick]
+        self.snapshots_applied += 1
+        return True
+
+    def close(self):
+        if self.player is not None:
+            self.link.send(protocol.encode_bye(), self.server)
+            self.link.flush()
+        self.sock.close()
+
+class RemoteRenderer:
+    """Desenha os registros recebidos com as mesmas imagens do jogo local."""
+    def __init__(self, assets):
+        self.assets = assets
+        self.ship_images = [self._tinted(assets['ship_image'], tint) for tint in PLAYER_TINTS]
+        self.asteroid_images = {size: rotation_cache.scaled(assets['asteroid_image'], (radius * 2, radius * 2))
+                                for size, radius in settings.ASTEROID_SIZES.items()}
+
+    @staticmethod
+    def _tinted(image, tint):
+        if tint is None:
+            return image
+        tinted = image.copy()
+        tinted.fill((*tint, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        return tinted
+
+    def draw(self, surface, records):
+        for kind, x, y, angle, variant in records.values():
+            if kind in PARTICLE_COLORS:
+                pygame.draw.circle(surface, PARTICLE_COLORS[kind], (x, y), max(1, variant))
+                continue
+            image, wraps = self._image(kind, protocol.angle_degrees(angle), variant)
+            if image is None:
+                continue
+            rect = image.get_rect(center=(x, y))
+            surface.blit(image, rect)
+            # Naves e asteroides cruzando uma borda aparecem também do outro lado.
+            if wraps:
+                for dx, dy in wrap_offsets(rect):
+                    surface.blit(image, rect.move(dx, dy))
+
+    def _image(self, kind, angle, variant):
+        """(imagem, desenha cópias nas bordas) de um registro; imagem None = não desenhar."""
+        assets = self.assets
+        if kind in (Kind.SHIP, Kind.POWERUP) and variant & protocol.VARIANT_HIDDEN:
+            return None, False
+        if kind == Kind.SHIP:
+            return rotation_cache.rotated(self.ship_images[variant % len(self.ship_images)], angle)[0], True
+        if kind == Kind.ASTEROID:
+            base = self.asteroid_images.get(variant)
+            return (rotation_cache.rotated(base, angle)[0] if base else None), True
+        if kind == Kind.UFO:
+            return assets['ufo_vertical_image' if variant else 'ufo_image'], False
+        if kind == Kind.PLAYER_BULLET:
+            return rotation_cache.rotated(assets['player_gunshot_image'], angle)[0], False
+        if kind == Kind.ENEMY_BULLET:
+            return rotation_cache.rotated(assets['enemy_gunshot_image'], angle)[0], False
+        if kind == Kind.POWERUP:
+            return assets['powerup_image'], False
+        if kind == Kind.PET:
+            return rotation_cache.rotated(assets['pet_ship_image'], angle)[0], False
+        if kind == Kind.EXPLOSION:
+            frames = assets['explosion_anim']
+            return (frames[variant] if variant < len(frames) else None), False
+        return None, False
+
+def main():
+    """Janela do cliente: lê o teclado, envia ao servidor e desenha o estado recebido."""
+    parser = argparse.ArgumentParser(description="Cliente do co-op em rede")
+    parser.add_argument('server', help="endereço do servidor")
+    parser.add_argument('--port', type=int, default=settings.NET_PORT)
+    args = parser.parse_args()
+
+    from src.utils.asset_loader import load_all_assets
+    from src.utils.background import Starfield
+    from src.utils.hud import HUD
+    pygame.init()
+    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    pygame.display.set_caption(f"{settings.TITLE} - Co-op")
+    assets = load_all_assets(load_sounds=False)
+    clock = pygame.time.Clock()
+    client = CoopClient((args.server, args.port), host="0.0.0.0")
+    renderer = RemoteRenderer(assets)
+    hud = HUD(assets)
+    background = Starfield()
+
+    running = True
+    while running:
+        dt = clock.tick(settings.FPS)
+        shoot = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                shoot = True
+        keys = pygame.key.get_pressed()
+        client.send_input(InputFrame(dt, keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_UP], shoot))
+        client.poll()
+
+        screen.fill((10, 10, 25))
+        background.draw(screen)
+        renderer.draw(screen, client.records)
+        hud.draw(screen, client.header.score, client.header.lives, bool(client.header.flags & protocol.FLAG_UFO_ALERT))
+        if client.player is None:
+            status = "Partida cheia" if client.rejected else f"Conectando a {args.server}:{args.port}..."
+            assets['text_renderer'].draw(screen, status, 24, (255, 215, 0), settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
+        elif client.game_over:
+            assets['text_renderer'].draw(screen, "GAME OVER", 48, (255, 80, 80), settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
+        pygame.display.flip()
+
+    client.close()
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
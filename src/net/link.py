@@ -0,0 +1,81 @@
+import errno
+import heapq
+import random
+import socket
+import time
+from src import settings
+
+# Erros de envio passageiros ou de um destino que sumiu: para o UDP, o mesmo que um datagrama
+# perdido. Os demais (como EMSGSIZE, um datagrama grande demais) são erros do programa.
+TRANSIENT_ERRNOS = {errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS, errno.EINTR, errno.ECONNREFUSED,
+                    errno.ECONNRESET, errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EHOSTDOWN, errno.ENETDOWN}
+
+class NetworkLink:
+    """
+    Envio de datagramas UDP com latência, variação (jitter) e perda simuladas, para testar
+    o co-op em loopback como se fosse uma rede real. Sem parâmetros, envia direto.
+
+    Cada lado (servidor e clientes) simula a sua direção: send() sorteia a perda e agenda
+    o datagrama para daqui a latência +- jitter; flush() envia os que já venceram. O
+    relógio é injetável, para que testes rodem em tempo simulado, mais rápido que o real.
+    """
+    def __init__(self, sock, latency_ms=0, jitter_ms=0, loss=0.0, seed=None, clock=None):
+        self.sock = sock
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.clock = clock or (lambda: time.perf_counter() * 1000)  # ms
+        self.queue = []  # (instante de entrega, sequência, dados, endereço)
+        self.sequence = 0
+
+        # --- Medições ---
+        self.packets_sent = 0
+        self.bytes_sent = 0
+        self.packets_dropped = 0
+
+    def send(self, data, address):
+        self.packets_sent += 1
+        self.bytes_sent += len(data)
+        if self.loss and self.rng.random() < self.loss:
+            self.packets_dropped += 1
+            return
+        delay = self.latency_ms + (self.rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0)
+        if delay <= 0:
+            self._send_now(data, address)
+            return
+        self.sequence += 1
+        heapq.heappush(self.queue, (self.clock() + delay, self.sequence, data, address))
+
+    def flush(self):
+        """Envia os datagramas cujo atraso simulado já passou."""
+        now = self.clock()
+        while self.queue and self.queue[0][0] <= now:
+            _, _, data, address = heapq.heappop(self.queue)
+            self._send_now(data, address)
+
+    def _send_now(self, data, address):
+        try:
+            self.sock.sendto(data, address)
+        except OSError as error:
+            if error.errno not in TRANSIENT_ERRNOS:
+                raise
+            self.packets_dropped += 1
+
+    def receive(self):
+        """Datagramas recebidos até agora, como pares (dados, endereço), sem bloquear."""
+        received = []
+        while True:
+            try:
+                received.append(self.sock.recvfrom(settings.NET_MAX_PACKET))
+            except (BlockingIOError, InterruptedError):
+                return received
+            except ConnectionResetError:
+                continue  # Windows: ICMP "porta inalcançável" de um envio anterior
+
+def open_socket(host="127.0.0.1", port=0):
+    """Socket UDP não bloqueante ligado a (host, port); port=0 escolhe uma porta livre."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind((host, port))
+    sock.setblocking(False)
+    return sock
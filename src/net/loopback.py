@@ -0,0 +1,108 @@
+import argparse
+import random
+import sys
+from src import settings
+from src.net import protocol
+from src.net.client import CoopClient
+from src.net.server import CoopServer
+from src.utils.input import InputFrame
+
+class VirtualClock:
+    """Relógio em ms avançado à mão: a partida roda o mais rápido possível, sem esperar o tempo real."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def scripted_input(rng, dt):
+    """Entrada aleatória de um "jogador" do teste: gira, acelera e atira de vez em quando."""
+    turn = rng.random()
+    return InputFrame(dt, turn < 0.3, 0.3 <= turn < 0.6, rng.random() < 0.4, rng.random() < 0.15)
+
+def run_loopback(seconds=30, players=2, latency_ms=0, jitter_ms=0, loss=0.0, seed=1, difficulty="MEDIUM"):
+    """
+    Roda um servidor e 'players' clientes no mesmo processo, por UDP em 127.0.0.1, com
+    latência e perda simuladas em ambas as direções e entradas aleatórias (com semente).
+
+    A cada quadro com snapshots novos, confere se o estado reconstruído pelo cliente é exatamente o
+    que o servidor enviou a ele naquele tick. Retorna (servidor, clientes, divergências).
+    """
+    from src.ai.env import get_headless_assets
+    clock = VirtualClock()
+    dt = 1000.0 / settings.FPS
+
+    def link_options(side):
+        return {'latency_ms': latency_ms, 'jitter_ms': jitter_ms, 'loss': loss, 'seed': seed * 31 + side}
+
+    server = CoopServer(get_headless_assets(), port=0, players=players, seed=seed,
+                        difficulty=difficulty, link_options=link_options(0), clock=clock)
+    clients = [CoopClient(server.address, link_options=link_options(i + 1), clock=clock) for i in range(players)]
+    inputs = [random.Random(seed * 101 + i) for i in range(players)]
+
+    mismatches = 0
+    for _ in range(int(seconds * settings.FPS)):
+        clock.now += dt
+        for client, rng in zip(clients, inputs):
+            client.send_input(scripted_input(rng, dt))
+        server.tick()
+        for client in clients:
+            if client.poll():
+                # Um poll pode aplicar vários snapshots; confere o último (o estado atual).
+                sent = server.clients[client.sock.getsockname()].history.get(client.tick)
+                if sent is not None and sent != client.records:
+                    mismatches += 1
+    return server, clients, mismatches
+
+def main():
+    """
+    Teste do co-op em loopback: imprime o custo do servidor, a banda e as perdas, e termina
+    com erro se algum estado divergir, algum cliente não entrar ou algum snapshot não tiver base.
+    """
+    parser = argparse.ArgumentParser(description="Teste do co-op em rede (loopback)")
+    parser.add_argument('--seconds', type=float, default=30, help="duração da partida simulada")
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--latency', type=float, default=0, help="latência simulada (ms, cada direção)")
+    parser.add_argument('--jitter', type=float, default=0, help="variação da latência (ms)")
+    parser.add_argument('--loss', type=float, default=0.0, help="fração de datagramas perdidos (0-1)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--difficulty', default="MEDIUM", choices=settings.GAMEPLAY_DIFFICULTIES)
+    args = parser.parse_args()
+
+    server, clients, mismatches = run_loopback(args.seconds, args.players, args.latency, args.jitter,
+                                               args.loss, args.seed, args.difficulty)
+    print("\n".join(server.summary(args.seconds)))
+    for client in clients:
+        sent = client.link.packets_sent
+        print(f"Cliente {client.player + 1 if client.player is not None else '?'}: "
+              f"{client.snapshots_applied} snapshots aplicados, {client.snapshots_stale} fora de ordem, "
+              f"{client.snapshots_undecodable} sem base, {client.bytes_received / args.seconds / 1024:.1f} KiB/s recebidos, "
+              f"{client.link.packets_dropped}/{sent} entradas perdidas")
+    print(f"Snapshots perdidos pelo servidor: {server.link.packets_dropped}/{server.link.packets_sent}")
+    # Tamanho do último estado se fosse enviado inteiro, para comparar com os deltas acima.
+    for client in clients:
+        if client.tick is not None:
+            full = protocol.encode_snapshot(client.tick, client.header, client.records)
+            print(f"Cliente {client.player + 1 if client.player is not None else '?'}: snapshot completo teria {len(full)} bytes")
+            break
+    print(f"Placar final {server.sim.state.score} - estados divergentes: {mismatches}")
+    for client in clients:
+        client.close()
+    server.close()
+
+    # Falhas do teste: saída diferente de zero, para que ele possa barrar uma mudança.
+    failures = []
+    if mismatches:
+        failures.append(f"{mismatches} estados reconstruídos diferentes do enviado")
+    failures += [f"cliente {i + 1} não recebeu o WELCOME" for i, client in enumerate(clients) if client.player is None]
+    failures += [f"cliente {i + 1}: {client.snapshots_undecodable} snapshots sem base"
+                 for i, client in enumerate(clients) if client.snapshots_undecodable]
+    failures += [f"jogador {remote.player + 1}: {remote.oversized} snapshots grandes demais para um datagrama"
+                 for remote in server.clients.values() if remote.oversized]
+    if failures:
+        print("FALHOU: " + "; ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+import struct
+from collections import namedtuple
+from enum import IntEnum
+
+# --- Formato dos Datagramas do Co-op em Rede ---
+# Little-endian, um pacote por datagrama; o primeiro byte é o tipo.
+# Cliente -> servidor:
+#   HELLO    pede uma vaga de jogador.
+#   INPUT    [ack: u32][botões: u8][contador de tiros: u16][sequência: u16]: o último tick
+#            de snapshot recebido (ack) e a entrada atual. Tiros são contados, não enviados
+#            como "apertou agora", para que um datagrama perdido não perca um tiro. A
+#            sequência cresce a cada INPUT: um que chega depois de um mais novo é descartado.
+#   BYE      sai da partida.
+# Servidor -> cliente:
+#   WELCOME  [jogador: u8][jogadores: u8]: o índice da nave atribuída ao cliente.
+#   FULL     a partida está cheia.
+#   SNAPSHOT [tick: u32][base: u32][score: u32][vidas: u8][flags: u8][alterados: u16][removidos: u16]
+#            + ids removidos (u32) + para cada entidade nova ou alterada: [id: u32][máscara: u8]
+#            e só os campos marcados na máscara.
+# Cada entidade visível é um registro quantizado (tipo, x, y, ângulo, variante): posições em
+# pixels inteiros (int16, o mesmo arredondamento do rect usado no desenho), ângulos em
+# 1/65536 de volta (u16) e um byte de variante (tamanho do asteroide, quadro da explosão,
+# jogador da nave...). O snapshot é um delta contra a base, o último snapshot que o cliente
+# confirmou; sem base (NO_BASE), todos os registros vão inteiros.
+
+HELLO, WELCOME, FULL, INPUT, SNAPSHOT, BYE = range(1, 7)
+
+# Flags do cabeçalho do snapshot
+FLAG_GAME_OVER = 1
+FLAG_UFO_ALERT = 2
+
+# Bits da variante das naves e power-ups
+VARIANT_HIDDEN = 0x80  # Não desenhar neste tick (pisca-pisca)
+
+NO_BASE = 0xFFFFFFFF  # Snapshot completo (sem base)
+
+class EntityKind(IntEnum):
+    SHIP = 1
+    ASTEROID = 2
+    UFO = 3
+    PLAYER_BULLET = 4
+    ENEMY_BULLET = 5
+    POWERUP = 6
+    PET = 7
+    EXPLOSION = 8
+    PARTICLE_EXPLOSION = 9
+    PARTICLE_UFO = 10
+    PARTICLE_THRUST = 11
+    PARTICLE_GLOW = 12
+
+# Registro de uma entidade: (kind, x, y, angle, variant), já quantizado.
+# Cada campo tem um bit na máscara do delta e um formato struct.
+FIELDS = (("kind", "B"), ("x", "h"), ("y", "h"), ("angle", "H"), ("variant", "B"))
+_FIELD_STRUCTS = [struct.Struct("<" + fmt) for _, fmt in FIELDS]
+ALL_FIELDS = (1 << len(FIELDS)) - 1
+
+SnapshotHeader = namedtuple("SnapshotHeader", ["score", "lives", "flags"])
+
+_PACKET_TYPE = struct.Struct("<B")
+_WELCOME = struct.Struct("<BBB")            # tipo, jogador, jogadores
+_INPUT = struct.Struct("<BIBHH")            # tipo, ack, botões, contador de tiros, sequência
+_SNAPSHOT = struct.Struct("<BIIIBBHH")      # tipo, tick, base, score, vidas, flags, alterados, removidos
+_ENTITY_ID = struct.Struct("<I")
+_ENTITY_HEAD = struct.Struct("<IB")         # id, máscara dos campos presentes
+
+# --- Quantização ---
+def quantize_position(value):
+    return max(-32768, min(32767, int(round(value))))
+
+def quantize_angle(degrees):
+    return int(round(degrees % 360 * 65536 / 360)) % 65536
+
+def angle_degrees(quantized):
+    return quantized * 360 / 65536
+
+# --- Pacotes simples ---
+def packet_type(data):
+    return data[0] if data else None
+
+def encode_hello():
+    return _PACKET_TYPE.pack(HELLO)
+
+def encode_bye():
+    return _PACKET_TYPE.pack(BYE)
+
+def encode_full():
+    return _PACKET_TYPE.pack(FULL)
+
+def encode_welcome(player, players):
+    return _WELCOME.pack(WELCOME, player, players)
+
+def decode_welcome(data):
+    _, player, players = _WELCOME.unpack_from(data)
+    return player, players
+
+def encode_input(ack, buttons, shots, sequence):
+    """
+    'ack' é o último tick recebido (NO_BASE se nenhum); 'shots' conta os tiros pedidos e
+    'sequence' os INPUTs enviados (ambos mod 65536).
+    """
+    return _INPUT.pack(INPUT, NO_BASE if ack is None else ack, buttons, shots % 65536, sequence % 65536)
+
+def decode_input(data):
+    _, ack, buttons, shots, sequence = _INPUT.unpack_from(data)
+    return (None if ack == NO_BASE else ack), buttons, shots, sequence
+
+def is_newer(value, last):
+    """Se o contador 'value' (u16) vem depois de 'last', mesmo depois de dar a volta em 65536."""
+    return 0 < (value - last) % 65536 < 32768
+
+# --- Snapshots ---
+def encode_snapshot(tick, header, records, base_tick=None, base=None):
+    """
+    Codifica 'records' ({id: registro}) como delta contra 'base' (os registros do tick
+    'base_tick', já confirmados pelo cliente). Sem base, todos os registros vão inteiros.
+    """
+    base = base or {}
+    removed = [entity_id for entity_id in base if entity_id not in records]
+    changed = []
+    for entity_id, record in records.items():
+        previous = base.get(entity_id)
+        if previous is None:
+            mask = ALL_FIELDS
+        else:
+            mask = 0
+            for bit, (value, old) in enumerate(zip(record, previous)):
+                if value != old:
+                    mask |= 1 << bit
+            if not mask:
+                continue
+        changed.append((entity_id, mask, record))
+
+    parts = [_SNAPSHOT.pack(SNAPSHOT, tick, NO_BASE if base_tick is None else base_tick,
+                            header.score, header.lives, header.flags, len(changed), len(removed))]
+    parts += [_ENTITY_ID.pack(entity_id) for entity_id in removed]
+    for entity_id, mask, record in changed:
+        parts.append(_ENTITY_HEAD.pack(entity_id, mask))
+        parts += [_FIELD_STRUCTS[bit].pack(value) for bit, value in enumerate(record) if mask & (1 << bit)]
+    return b"".join(parts)
+
+def snapshot_tick(data):
+    """Tick de um snapshot, sem decodificá-lo (para descartar os fora de ordem antes)."""
+    return _SNAPSHOT.unpack_from(data)[1]
+
+def decode_snapshot(data, bases):
+    """
+    Decodifica um snapshot usando 'bases' ({tick: registros} já recebidos).
+    Retorna (tick, base_tick, header, registros) ou None se a base não estiver disponível.
+    """
+    _, tick, base_tick, score, lives, flags, changed_count, removed_count = _SNAPSHOT.unpack_from(data)
+    if base_tick == NO_BASE:
+        base_tick, records = None, {}
+    elif base_tick in bases:
+        records = dict(bases[base_tick])
+    else:
+        return None
+
+    offset = _SNAPSHOT.size
+    for _ in range(removed_count):
+        records.pop(_ENTITY_ID.unpack_from(data, offset)[0], None)
+        offset += _ENTITY_ID.size
+    for _ in range(changed_count):
+        entity_id, mask = _ENTITY_HEAD.unpack_from(data, offset)
+        offset += _ENTITY_HEAD.size
+        record = list(records.get(entity_id, (0,) * len(FIELDS)))
+        for bit, field in enumerate(_FIELD_STRUCTS):
+            if mask & (1 << bit):
+                record[bit] = field.unpack_from(data, offset)[0]
+                offset += field.size
+        records[entity_id] = tuple(record)
+    return tick, base_tick, SnapshotHeader(score, lives, flags), records
@@ -0,0 +1,251 @@
+import argparse
+import time
+from collections import deque
+import numpy as np
+from src import settings
+from src.net import protocol
+from src.net.capture import EntityCapture
+from src.net.link import NetworkLink, open_socket
+from src.net.spectator import SpectatorBroadcaster
+from src.simulation import HeadlessApp, Simulation
+from src.utils.broadphase import wrap_delta
+from src.utils.input import InputFrame
+
+class RemotePlayer:
+    """Um cliente conectado: a nave que controla, a última entrada e os snapshots enviados a ele."""
+    def __init__(self, address, player, now):
+        self.address = address
+        self.player = player
+        self.last_seen = now
+        self.buttons = 0
+        self.shots = 0            # Último contador de tiros recebido (o cliente começa em 0)
+        self.sequence = 0         # Sequência do último INPUT aceito (o primeiro do cliente é 1)
+        self.shot_pending = False
+        self.ack = None           # Último tick que o cliente confirmou ter recebido
+        self.history = {}         # tick -> registros enviados (bases possíveis dos próximos deltas)
+
+        # --- Medições ---
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+        self.full_snapshots = 0
+        self.encode_ms = 0.0
+        self.inputs_stale = 0     # INPUTs que chegaram depois de um mais novo (descartados)
+        self.oversized = 0        # Snapshots maiores que NET_MAX_PACKET (não enviados)
+
+class CoopServer:
+    """
+    Servidor autoritativo do co-op: roda a Simulation (com uma nave por jogador) no ritmo
+    fixo de settings.FPS e, a cada tick, manda a cada cliente o estado da partida.
+
+    - Entrada: cada cliente envia seus botões a cada quadro; o servidor usa a mais recente
+      (um datagrama perdido só atrasa a mudança, um reordenado é descartado pela sequência)
+      e converte o contador de tiros em tiros.
+    - Saída: os registros quantizados das entidades (ver protocol) como delta contra o
+      último snapshot que o cliente confirmou. Snapshots enviados ficam guardados por
+      cliente (até NET_HISTORY_TICKS); se a confirmação for mais antiga que isso, ou não
+      houver nenhuma, o snapshot vai completo.
+    - Filtro de interesse: partículas (só cosméticas, e as mais numerosas) só são enviadas
+      a um cliente se estiverem a menos de NET_PARTICLE_RADIUS da nave dele.
+
+    Mede o custo de cada tick (simulação e, por jogador, a codificação) e os bytes enviados.
+    """
+    def __init__(self, assets, host="127.0.0.1", port=settings.NET_PORT, players=2, seed=None,
+                 difficulty="MEDIUM", link_options=None, clock=None):
+        self.assets = assets
+        self.players = players
+        # Sem janela no servidor, mas com efeitos: as partículas são enviadas aos clientes.
+        self.sim = Simulation(assets, HeadlessApp(difficulty, effects_on=True), seed=seed, players=players)
+        self.sock = open_socket(host, port)
+        self.address = self.sock.getsockname()
+        self.link = NetworkLink(self.sock, clock=clock, **(link_options or {}))
+        self.clients = {}  # endereço -> RemotePlayer
+        self.capture = EntityCapture(self.sim, assets)  # Registros de rede das entidades
+        self.broadcaster = None  # Transmissão opcional para espectadores (ver SpectatorBroadcaster)
+
+        # --- Medições ---
+        self.tick_times = deque(maxlen=600)  # ms de simulação por tick
+        self.ticks = 0
+
+    # --- Conexões e Entrada ---
+    def receive(self):
+        now = self.link.clock()
+        for data, address in self.link.receive():
+            kind = protocol.packet_type(data)
+            client = self.clients.get(address)
+            if kind == protocol.HELLO:
+                self._join(address, now)
+                if address in self.clients:
+                    self.clients[address].last_seen = now
+            elif client and kind == protocol.INPUT:
+                ack, buttons, shots, sequence = protocol.decode_input(data)
+                client.last_seen = now
+                # Reordenado pela rede: os botões e o contador de tiros dele já estão velhos.
+                if not protocol.is_newer(sequence, client.sequence):
+                    client.inputs_stale += 1
+                    continue
+                client.sequence = sequence
+                client.buttons = buttons
+                # Em ordem, o contador só cresce: se mudou, houve pelo menos um tiro desde o último.
+                if shots != client.shots:
+                    client.shot_pending = True
+                client.shots = shots
+                if ack is not None and (client.ack is None or ack > client.ack):
+                    client.ack = ack
+            elif client and kind == protocol.BYE:
+                del self.clients[address]
+
+        # Clientes que pararam de enviar são desconectados (a nave fica parada).
+        for address, client in list(self.clients.items()):
+            if now - client.last_seen > settings.NET_CLIENT_TIMEOUT_MS:
+                del self.clients[address]
+
+    def _join(self, address, now):
+        """Atribui a primeira nave livre ao cliente (ou repete a resposta, se ele já entrou)."""
+        client = self.clients.get(address)
+        if client is None:
+            taken = {other.player for other in self.clients.values()}
+            free = [player for player in range(self.players) if player not in taken]
+            if not free:
+                self.link.send(protocol.encode_full(), address)
+                return
+            client = self.clients[address] = RemotePlayer(address, free[0], now)
+        self.link.send(protocol.encode_welcome(client.player, self.players), address)
+
+    def _input_frames(self, dt):
+        """Um InputFrame por nave; naves sem cliente ficam paradas."""
+        frames = [InputFrame(dt) for _ in range(self.players)]
+        for client in self.clients.values():
+            frames[client.player] = InputFrame.from_bits(dt, client.buttons)._replace(shoot=client.shot_pending)
+            client.shot_pending = False
+        return frames
+
+    # --- Tick ---
+    def tick(self):
+        """Recebe as entradas, avança a simulação um tick e envia os snapshots."""
+        self.receive()
+        if self.clients:
+            # Depois do fim da partida, o último estado continua sendo enviado (o aviso
+            # de fim de jogo também precisa sobreviver à perda de datagramas).
+            if not self.sim.is_game_over():
+                frames = self._input_frames(1000.0 / settings.FPS)
+                start = time.perf_counter()
+                self.sim.step(frames[0], frames[1:])
+                self.tick_times.append((time.perf_counter() - start) * 1000)
+                self.ticks += 1
+
+            records, particles = self.capture.capture()
+            header = self.capture.header()
+            for client in self.clients.values():
+                self._send_snapshot(client, header, records, particles)
+            if self.broadcaster:
+                self.broadcaster.publish()
+        self.link.flush()
+
+    def run(self, seconds=None):
+        """Roda o servidor em tempo real, no ritmo de settings.FPS."""
+        interval = 1.0 / settings.FPS
+        deadline = time.perf_counter() + seconds if seconds else None
+        next_tick = time.perf_counter()
+        while deadline is None or time.perf_counter() < deadline:
+            self.tick()
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()  # Atrasado: não tenta recuperar os ticks perdidos
+
+    def close(self):
+        self.sock.close()
+
+    # --- Snapshots ---
+    def _send_snapshot(self, client, header, records, particles):
+        start = time.perf_counter()
+        # Filtro de interesse: só as partículas perto da nave deste jogador.
+        visible = dict(records)
+        particles, positions = particles
+        if particles:
+            ship = self.sim.state.ships[client.player].rect.center
+            dx = wrap_delta(positions[:, 0] - ship[0], settings.SCREEN_WIDTH)
+            dy = wrap_delta(positions[:, 1] - ship[1], settings.SCREEN_HEIGHT)
+            near = np.hypot(dx, dy) <= settings.NET_PARTICLE_RADIUS
+            visible.update(particles[i] for i in np.flatnonzero(near).tolist())
+
+        # Delta contra o último snapshot confirmado, se ainda estiver guardado.
+        base = client.history.get(client.ack) if client.ack is not None else None
+        base_tick = client.ack if base is not None else None
+        tick = self.sim.tick
+        data = protocol.encode_snapshot(tick, header, visible, base_tick, base)
+        if len(data) > settings.NET_MAX_PACKET:
+            # Não cabe em um datagrama: não é enviado nem guardado como base (o cliente nunca o confirmará).
+            client.oversized += 1
+            client.encode_ms += (time.perf_counter() - start) * 1000
+            return
+        self.link.send(data, client.address)
+
+        # Guarda o enviado e descarta as bases que não serão mais usadas.
+        client.history[tick] = visible
+        oldest = tick - settings.NET_HISTORY_TICKS
+        for old_tick in [t for t in client.history if t < oldest or (client.ack is not None and t < client.ack)]:
+            del client.history[old_tick]
+
+        client.bytes_sent += len(data)
+        client.snapshots_sent += 1
+        client.full_snapshots += base is None
+        client.encode_ms += (time.perf_counter() - start) * 1000
+
+    # --- Relatório ---
+    def summary(self, seconds):
+        """
+        Linhas com o custo do tick e a banda por jogador, em 'seconds' segundos de partida.
+        A simulação é uma só para todas as naves (tempo total); o custo medido de cada jogador
+        é o do seu snapshot (filtro de interesse, delta e envio).
+        """
+        times = sorted(self.tick_times)
+        p95 = times[int(len(times) * 0.95)] if times else 0.0
+        average = sum(times) / len(times) if times else 0.0
+        lines = [f"Servidor: {self.ticks} ticks, simulação total {average:.2f} ms/tick (p95 {p95:.2f})"]
+        for client in sorted(self.clients.values(), key=lambda c: c.player):
+            sent = max(1, client.snapshots_sent)
+            lines.append(f"Jogador {client.player + 1}: custo {client.encode_ms / sent:.3f} ms/tick (snapshot), "
+                         f"{client.bytes_sent / max(seconds, 1e-9) / 1024:.1f} KiB/s, "
+                         f"{client.bytes_sent / sent:.0f} bytes/snapshot, {client.full_snapshots} completos, "
+                         f"{client.inputs_stale} entradas fora de ordem")
+            if client.oversized:
+                lines.append(f"Jogador {client.player + 1}: {client.oversized} snapshots maiores que "
+                             f"{settings.NET_MAX_PACKET} bytes não enviados (entidades demais para um datagrama)")
+        return lines
+
+def main():
+    """Roda um servidor de co-op até ser interrompido (Ctrl+C)."""
+    parser = argparse.ArgumentParser(description="Servidor do co-op em rede")
+    parser.add_argument('--host', default="0.0.0.0", help="endereço local (0.0.0.0 aceita a rede local)")
+    parser.add_argument('--port', type=int, default=settings.NET_PORT)
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--difficulty', default="MEDIUM", choices=settings.GAMEPLAY_DIFFICULTIES)
+    parser.add_argument('--spectators', type=int, nargs='?', const=settings.SPECTATOR_PORT, metavar='PORTA',
+                        help="também transmite a partida para espectadores (TCP)")
+    args = parser.parse_args()
+
+    from src.ai.env import get_headless_assets
+    assets = get_headless_assets()
+    server = CoopServer(assets, args.host, args.port, args.players, args.seed, args.difficulty)
+    if args.spectators is not None:
+        server.broadcaster = SpectatorBroadcaster(assets, args.host, args.spectators)
+        server.broadcaster.attach(server.sim)
+        server.broadcaster.start()
+    print(f"Servidor de co-op em {server.address[0]}:{server.address[1]} ({args.players} jogadores)")
+    start = time.perf_counter()
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
+    print("\n".join(server.summary(time.perf_counter() - start)))
+    if server.broadcaster:
+        print("\n".join(server.broadcaster.summary()))
+        server.broadcaster.stop()
+    server.close()
+
+if __name__ == '__main__':
+    main()
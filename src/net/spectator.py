@@ -0,0 +1,362 @@
+import argparse
+import socket
+import struct
+import threading
+import time
+from collections import deque
+import pygame
+from src import settings
+from src.net import protocol
+from src.net.capture import EntityCapture
+
+# --- Formato da Transmissão ---
+# Um fluxo TCP por espectador, só do servidor para ele. Cada quadro é
+# [tamanho: u32][snapshot], com o mesmo snapshot do co-op (ver protocol): um delta contra o
+# quadro anterior do fluxo ou, com base NO_BASE, o estado completo. O primeiro quadro de um
+# espectador (e o seguinte a cada descarte da sua fila) é sempre completo.
+_FRAME_LENGTH = struct.Struct("<I")
+
+class Viewer:
+    """Um espectador conectado: a fila de quadros a enviar e o quanto já foi enviado."""
+    def __init__(self, sock, address, now):
+        self.sock = sock
+        self.address = address
+        self.pending = deque()    # Quadros (bytes) ainda não enviados por inteiro
+        self.offset = 0           # Bytes já enviados do primeiro quadro da fila
+        self.needs_full = True    # O próximo quadro tem de ser completo (início ou fila descartada)
+        self.last_progress = now  # Último instante em que a fila andou (ou estava vazia)
+
+        # --- Medições ---
+        self.frames_sent = 0
+        self.frames_skipped = 0   # Quadros que este espectador não recebeu (fila cheia)
+        self.resyncs = 0          # Vezes que a fila foi descartada
+        self.bytes_sent = 0
+
+class SpectatorBroadcaster:
+    """
+    Transmite uma partida para muitos espectadores sem atrasar o loop do jogo.
+
+    A thread do jogo só chama publish() após os ticks de cada quadro: captura os registros
+    das entidades (uma vez, qualquer que seja o número de espectadores) e os deixa numa
+    caixa de correio de um lugar. Uma thread de transmissão pega o estado mais recente,
+    codifica o delta uma única vez e envia os mesmos bytes a todos. Se a transmissão
+    atrasar, os estados intermediários são pulados; a thread do jogo nunca espera.
+
+    Cada espectador tem uma fila limitada (SPECTATOR_QUEUE_FRAMES) e um buffer de envio
+    pequeno no sistema. Com a fila cheia, os quadros pendentes são descartados e ele passa
+    a receber só estados completos quando consegue esvaziá-la: um espectador lento vê
+    menos quadros por segundo, em vez de acumular atraso. Quem não lê nada por
+    SPECTATOR_STALL_MS é desconectado.
+    """
+    IDLE_WAIT = 0.05  # s; mesmo sem quadro novo, a fila dos espectadores continua sendo enviada
+
+    def __init__(self, assets, host="127.0.0.1", port=settings.SPECTATOR_PORT):
+        self.assets = assets
+        self.capture = None  # EntityCapture da partida atual (ver attach)
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen(128)
+        self.listener.setblocking(False)
+        self.address = self.listener.getsockname()
+        self.viewers = []
+
+        # --- Caixa de Correio (thread do jogo -> thread de transmissão) ---
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+        self.mailbox = None         # (tick, cabeçalho, registros) mais recente, ainda não transmitido
+        self.published_tick = None  # Último tick publicado (pausado, nada é publicado)
+        self.thread = None
+        self.stopping = False
+
+        # --- Estado da Transmissão (só a thread de transmissão usa) ---
+        self.last_tick = None
+        self.last_records = None
+
+        # --- Medições ---
+        self.publish_times = deque(maxlen=600)  # ms gastos na thread do jogo por publicação
+        self.published = 0
+        self.superseded = 0       # Estados substituídos na caixa antes de serem transmitidos
+        self.broadcast = 0        # Estados transmitidos
+        self.busy_ms = 0.0        # Tempo de trabalho da thread de transmissão
+        self.bytes_sent = 0
+        self.frames_skipped = 0
+        self.resyncs = 0
+        self.disconnected = 0     # Espectadores desconectados por não lerem
+        self.started_at = None
+
+    # --- Ciclo de Vida ---
+    def start(self):
+        if self.thread is not None:
+            return
+        self.started_at = time.perf_counter()
+        self.stopping = False
+        self.thread = threading.Thread(target=self._run, name="SpectatorBroadcaster", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Encerra a thread de transmissão e fecha todas as conexões."""
+        if self.thread is not None:
+            self.stopping = True
+            self.ready.set()
+            self.thread.join()
+            self.thread = None
+        for viewer in self.viewers:
+            viewer.sock.close()
+        self.viewers = []
+        self.listener.close()
+
+    def attach(self, sim):
+        """Passa a transmitir a partida de 'sim' (a cada nova partida na mesma conexão)."""
+        self.capture = EntityCapture(sim, self.assets)
+        self.published_tick = None
+
+    # --- Thread do Jogo ---
+    def publish(self):
+        """Entrega o estado atual à transmissão. Sem tick novo desde a última vez, não faz nada."""
+        sim = self.capture.sim
+        if sim.tick == self.published_tick:
+            return
+        start = time.perf_counter()
+        frame = (sim.tick, self.capture.header(), self.capture.capture_all())
+        with self.lock:
+            if self.mailbox is not None:
+                self.superseded += 1
+            self.mailbox = frame
+        self.ready.set()
+        self.published_tick = sim.tick
+        self.published += 1
+        self.publish_times.append((time.perf_counter() - start) * 1000)
+
+    # --- Thread de Transmissão ---
+    def _run(self):
+        while not self.stopping:
+            self.ready.wait(self.IDLE_WAIT)
+            self.ready.clear()
+            with self.lock:
+                frame, self.mailbox = self.mailbox, None
+            start = time.perf_counter()
+            now = start * 1000
+            self._accept(now)
+            if frame is not None:
+                self._fan_out(frame)
+            self._flush(now)
+            self.busy_ms += (time.perf_counter() - start) * 1000
+
+    def _accept(self, now):
+        while True:
+            try:
+                sock, address = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return  # Limite de arquivos abertos: tenta de novo no próximo quadro
+            if len(self.viewers) >= settings.SPECTATOR_MAX_VIEWERS:
+                sock.close()
+                continue
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, settings.SPECTATOR_SOCKET_BUFFER)
+            self.viewers.append(Viewer(sock, address, now))
+
+    def _fan_out(self, frame):
+        """Codifica o estado uma vez (delta e, se alguém precisar, completo) e o põe nas filas."""
+        tick, header, records = frame
+        full = None
+        delta = None
+        if self.last_records is not None:
+            payload = protocol.encode_snapshot(tick, header, records, self.last_tick, self.last_records)
+            delta = _FRAME_LENGTH.pack(len(payload)) + payload
+
+        for viewer in self.viewers:
+            if not viewer.needs_full and len(viewer.pending) >= settings.SPECTATOR_QUEUE_FRAMES:
+                # Fila cheia: descarta o que ainda não começou a ser enviado e espera esvaziar.
+                dropped = len(viewer.pending) - (1 if viewer.offset else 0)
+                for _ in range(dropped):
+                    viewer.pending.pop()
+                viewer.frames_skipped += dropped
+                viewer.needs_full = True
+                viewer.resyncs += 1
+                self.frames_skipped += dropped
+                self.resyncs += 1
+            if viewer.needs_full:
+                if viewer.pending:
+                    viewer.frames_skipped += 1
+                    self.frames_skipped += 1
+                    continue
+                if full is None:
+                    payload = protocol.encode_snapshot(tick, header, records)
+                    full = _FRAME_LENGTH.pack(len(payload)) + payload
+                viewer.pending.append(full)
+                viewer.needs_full = False
+            else:
+                viewer.pending.append(delta)
+
+        self.last_tick, self.last_records = tick, records
+        self.broadcast += 1
+
+    def _flush(self, now):
+        """Envia o que couber no buffer de cada espectador, sem bloquear."""
+        alive = []
+        for viewer in self.viewers:
+            if self._send_pending(viewer, now):
+                alive.append(viewer)
+            else:
+                viewer.sock.close()
+        self.viewers = alive
+
+    def _send_pending(self, viewer, now):
+        """Envia a fila de um espectador. Retorna False se ele deve ser desconectado."""
+        while viewer.pending:
+            data = viewer.pending[0]
+            try:
+                sent = viewer.sock.send(memoryview(data)[viewer.offset:])
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                return False  # O espectador fechou a conexão
+            viewer.last_progress = now
+            viewer.bytes_sent += sent
+            self.bytes_sent += sent
+            viewer.offset += sent
+            if viewer.offset < len(data):
+                break
+            viewer.pending.popleft()
+            viewer.offset = 0
+            viewer.frames_sent += 1
+        if not viewer.pending:
+            viewer.last_progress = now
+        elif now - viewer.last_progress > settings.SPECTATOR_STALL_MS:
+            self.disconnected += 1
+            return False
+        return True
+
+    # --- Relatório ---
+    def describe(self):
+        """Linha da sobreposição de desempenho: espectadores, banda e custo na thread do jogo."""
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        rate = self.bytes_sent / elapsed / 1024 if elapsed else 0.0
+        times = sorted(self.publish_times)
+        p95 = times[int(len(times) * 0.95)] if times else 0.0
+        return f"Transmissão: {len(self.viewers)} espectadores  {rate:.0f} KiB/s  publicação p95 {p95:.2f} ms"
+
+    def summary(self):
+        """Linhas do resumo: custo na thread do jogo, ocupação da transmissão e descartes."""
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        busy = self.busy_ms / (elapsed * 1000) if elapsed else 0.0
+        return [self.describe(),
+                f"{self.published} estados publicados, {self.broadcast} transmitidos ({self.superseded} pulados), "
+                f"transmissão ocupada {busy:.0%}",
+                f"Espectadores lentos: {self.frames_skipped} quadros descartados, {self.resyncs} ressincronizações, "
+                f"{self.disconnected} desconectados"]
+
+class SpectatorStream:
+    """
+    Lado do espectador: lê os quadros da transmissão e reconstrói o estado da partida.
+    Quadros que dependem de um estado que ele não tem são ignorados até o próximo completo.
+    """
+    def __init__(self, address, timeout=5.0):
+        self.sock = socket.create_connection(tuple(address), timeout)
+        self.sock.setblocking(False)
+        self.buffer = bytearray()
+        self.closed = False
+
+        # --- Estado Recebido ---
+        self.tick = None
+        self.header = protocol.SnapshotHeader(0, 0, 0)
+        self.records = {}
+
+        # --- Medições ---
+        self.frames = 0
+        self.full_frames = 0
+        self.undecodable = 0
+        self.bytes_received = 0
+
+    def read(self):
+        """Lê os bytes disponíveis. Retorna os quadros completos recebidos (sem decodificar)."""
+        while not self.closed:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                data = b""
+            if not data:
+                self.closed = True
+                break
+            self.bytes_received += len(data)
+            self.buffer += data
+
+        frames = []
+        offset = 0
+        while len(self.buffer) - offset >= _FRAME_LENGTH.size:
+            length = _FRAME_LENGTH.unpack_from(self.buffer, offset)[0]
+            end = offset + _FRAME_LENGTH.size + length
+            if len(self.buffer) < end:
+                break
+            frames.append(bytes(self.buffer[offset + _FRAME_LENGTH.size:end]))
+            offset = end
+        del self.buffer[:offset]
+        return frames
+
+    def poll(self):
+        """Lê e aplica os quadros recebidos. Retorna quantos foram aplicados."""
+        applied = 0
+        for data in self.read():
+            decoded = protocol.decode_snapshot(data, {self.tick: self.records} if self.tick is not None else {})
+            if decoded is None:
+                self.undecodable += 1
+                continue
+            self.tick, base_tick, self.header, self.records = decoded
+            self.full_frames += base_tick is None
+            self.frames += 1
+            applied += 1
+        return applied
+
+    def close(self):
+        self.sock.close()
+
+def main():
+    """Janela do espectador: desenha a partida transmitida com o renderizador do cliente do co-op."""
+    parser = argparse.ArgumentParser(description="Espectador de uma partida transmitida")
+    parser.add_argument('server', nargs='?', default="127.0.0.1", help="endereço de quem transmite")
+    parser.add_argument('--port', type=int, default=settings.SPECTATOR_PORT)
+    args = parser.parse_args()
+
+    from src.net.client import RemoteRenderer
+    from src.utils.asset_loader import load_all_assets
+    from src.utils.background import Starfield
+    from src.utils.hud import HUD
+    pygame.init()
+    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    pygame.display.set_caption(f"{settings.TITLE} - Espectador")
+    assets = load_all_assets(load_sounds=False)
+    clock = pygame.time.Clock()
+    stream = SpectatorStream((args.server, args.port))
+    renderer = RemoteRenderer(assets)
+    hud = HUD(assets)
+    background = Starfield()
+
+    running = True
+    while running and not stream.closed:
+        clock.tick(settings.FPS)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        stream.poll()
+
+        screen.fill((10, 10, 25))
+        background.draw(screen)
+        renderer.draw(screen, stream.records)
+        hud.draw(screen, stream.header.score, stream.header.lives, bool(stream.header.flags & protocol.FLAG_UFO_ALERT))
+        if stream.tick is None:
+            assets['text_renderer'].draw(screen, "Aguardando a transmissão...", 24, (255, 215, 0), settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
+        elif stream.header.flags & protocol.FLAG_GAME_OVER:
+            assets['text_renderer'].draw(screen, "GAME OVER", 48, (255, 80, 80), settings.SCREEN_WIDTH / 2, settings.SCREEN_HEIGHT / 2)
+        pygame.display.flip()
+
+    stream.close()
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
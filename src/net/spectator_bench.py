@@ -0,0 +1,204 @@
+import argparse
+import multiprocessing as mp
+import socket
+import sys
+import time
+from src import settings
+from src.ai.env import get_headless_assets
+from src.ai.pilot import AutopilotInput
+from src.net.spectator import SpectatorBroadcaster, SpectatorStream
+from src.simulation import HeadlessApp, Simulation
+
+# Partida que não termina (a nave não morre), jogada pelo piloto automático, com efeitos:
+# as partículas são as entidades mais numerosas da transmissão.
+BENCH_OVERRIDES = {"immortal": True}
+
+SLOW_READ_BYTES = 512        # Espectadores lentos leem isto a cada 50 ms (~10 KiB/s, metade da transmissão)
+STALLED_RECEIVE_BUFFER = 16384  # Buffer de recepção pequeno dos travados (enchem antes)
+CHECKED_VIEWERS = 4          # Espectadores rápidos que decodificam tudo (os demais só separam os quadros)
+DRAIN_SECONDS = 0.5          # Espera, após o último tick, para os rápidos receberem os últimos quadros
+
+def _subscribers(address, fast, slow, stalled, ready, stop, results):
+    """
+    Processo dos espectadores: abre as conexões e lê (ou não) até 'stop'. Os rápidos leem
+    tudo, os lentos leem devagar e os travados nunca leem.
+    """
+    def connect(receive_buffer=None):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if receive_buffer:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer)
+        sock.connect(address)
+        sock.setblocking(False)
+        return sock
+
+    fast_streams = [SpectatorStream(address) for _ in range(fast)]
+    slow_socks = [connect() for _ in range(slow)]
+    stalled_socks = [connect(STALLED_RECEIVE_BUFFER) for _ in range(stalled)]
+    ready.set()
+
+    frames = [0] * fast
+    slow_bytes = [0] * slow
+    slow_closed = [False] * slow
+    next_slow_read = time.perf_counter()
+    while not stop.is_set():
+        for i, stream in enumerate(fast_streams):
+            if i < CHECKED_VIEWERS:
+                frames[i] += stream.poll()
+            else:
+                frames[i] += len(stream.read())
+        if time.perf_counter() >= next_slow_read:
+            next_slow_read += 0.05
+            for i, sock in enumerate(slow_socks):
+                if slow_closed[i]:
+                    continue
+                try:
+                    data = sock.recv(SLOW_READ_BYTES)
+                except (BlockingIOError, InterruptedError):
+                    continue
+                except OSError:
+                    data = b""
+                slow_closed[i] = not data
+                slow_bytes[i] += len(data)
+        time.sleep(0.005)
+
+    # Os travados desconectados pelo servidor: o fechamento aparece depois dos dados pendentes.
+    stalled_closed = 0
+    for sock in stalled_socks:
+        sock.setblocking(True)
+        sock.settimeout(0.5)
+        try:
+            while sock.recv(65536):
+                pass
+            stalled_closed += 1
+        except OSError:
+            pass
+
+    checked = fast_streams[:CHECKED_VIEWERS]
+    results.put({
+        "fast_frames": frames,
+        "fast_closed": sum(stream.closed for stream in fast_streams),
+        "checked": [(stream.tick, stream.records, stream.full_frames, stream.undecodable) for stream in checked],
+        "slow_bytes": slow_bytes,
+        "slow_closed": sum(slow_closed),
+        "stalled_closed": stalled_closed,
+    })
+
+def run_session(assets, seconds, seed, broadcaster=None):
+    """
+    Joga 'seconds' segundos no ritmo real de settings.FPS e retorna, em ms, o tempo de cada
+    tick na thread do jogo (simulação + publicação): o tempo real e o de CPU da thread. Com
+    uma só CPU, o tempo real também inclui os momentos em que o sistema deu a CPU a outro
+    processo (como o dos espectadores); o de CPU mede só o trabalho do jogo.
+    """
+    sim = Simulation(assets, HeadlessApp("MEDIUM", effects_on=True, overrides=BENCH_OVERRIDES), seed=seed)
+    pilot = AutopilotInput(sim.state)
+    if broadcaster:
+        broadcaster.attach(sim)
+    dt = 1000.0 / settings.FPS
+    times, cpu_times = [], []
+    next_tick = time.perf_counter()
+    for _ in range(int(seconds * settings.FPS)):
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        sim.step(pilot.poll(dt))
+        if broadcaster:
+            broadcaster.publish()
+        times.append((time.perf_counter() - start) * 1000)
+        cpu_times.append((time.thread_time() - cpu_start) * 1000)
+        next_tick += dt / 1000
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    return times, cpu_times
+
+def format_times(label, times, cpu_times):
+    """Linha da tabela: média, p50, p95 e p99 do tempo real e p50 e p95 do tempo de CPU."""
+    def pick(values, q):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+    return (f"{label:>12} {sum(times) / len(times):>7.3f} {pick(times, 0.5):>7.3f} {pick(times, 0.95):>7.3f} "
+            f"{pick(times, 0.99):>7.3f} {pick(cpu_times, 0.5):>9.3f} {pick(cpu_times, 0.95):>9.3f}")
+
+def main():
+    """
+    Mede o tempo de tick do jogo transmitindo para centenas de espectadores locais. Termina
+    com erro se um espectador rápido perder quadros, se um estado reconstruído divergir ou
+    se um travado não for desconectado (a rodada precisa durar o bastante para isso).
+    """
+    parser = argparse.ArgumentParser(description="Custo da transmissão para espectadores (loopback)")
+    parser.add_argument('--viewers', type=int, nargs='+', default=[0, 100, 300], help="espectadores em cada rodada")
+    parser.add_argument('--slow', type=float, default=0.1, help="fração de espectadores lentos")
+    parser.add_argument('--stalled', type=float, default=0.05, help="fração de espectadores que nunca leem")
+    parser.add_argument('--seconds', type=float, default=15, help="duração de cada rodada (os travados levam ~10 s para serem desconectados)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    assets = get_headless_assets()
+    context = mp.get_context("spawn")
+    print("Tempo de cada tick na thread do jogo (ms)")
+    print(f"{'espectadores':>12} {'média':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'CPU p50':>9} {'CPU p95':>9}")
+    print(format_times("sem", *run_session(assets, args.seconds, args.seed)))
+    failures = []
+
+    for count in args.viewers:
+        slow = int(count * args.slow)
+        stalled = int(count * args.stalled)
+        fast = count - slow - stalled
+        broadcaster = SpectatorBroadcaster(assets, port=0)
+        broadcaster.start()
+        ready, stop, results = context.Event(), context.Event(), context.Queue()
+        process = context.Process(target=_subscribers, args=(broadcaster.address, fast, slow, stalled, ready, stop, results), daemon=True)
+        process.start()
+        ready.wait()
+        # Espera todas as conexões serem aceitas antes de medir.
+        while len(broadcaster.viewers) < count:
+            time.sleep(0.01)
+
+        # Guarda cada estado transmitido, para conferir o que os espectadores reconstruíram.
+        history = {}
+        original_fan_out = broadcaster._fan_out
+        def logged_fan_out(frame):
+            history[frame[0]] = frame[2]
+            original_fan_out(frame)
+        broadcaster._fan_out = logged_fan_out
+
+        times, cpu_times = run_session(assets, args.seconds, args.seed, broadcaster)
+        time.sleep(DRAIN_SECONDS)
+        stop.set()
+        report = results.get()
+        process.join()
+        summary = broadcaster.summary()
+        broadcaster.stop()
+
+        print(format_times(count, times, cpu_times))
+        for line in summary:
+            print(f"{'':>14}{line}")
+        if fast:
+            frames = report["fast_frames"]
+            print(f"{'':>14}Rápidos ({fast}): {min(frames)}-{max(frames)} quadros recebidos de {broadcaster.broadcast}, "
+                  f"{report['fast_closed']} desconectados")
+        if slow:
+            print(f"{'':>14}Lentos ({slow}): {sum(report['slow_bytes']) / slow / args.seconds / 1024:.1f} KiB/s lidos em média, "
+                  f"{report['slow_closed']} desconectados")
+        if stalled:
+            print(f"{'':>14}Travados ({stalled}): {report['stalled_closed']} desconectados")
+        # Os que decodificam tudo precisam terminar exatamente no estado transmitido naquele tick.
+        matches = sum(tick is not None and history.get(tick) == records and not undecodable
+                      for tick, records, _, undecodable in report["checked"])
+        if report["checked"]:
+            print(f"{'':>14}Estado reconstruído idêntico ao transmitido: {matches}/{len(report['checked'])}")
+
+        if fast and min(report["fast_frames"]) < broadcaster.broadcast:
+            failures.append(f"{count} espectadores: rápido recebeu {min(report['fast_frames'])} de {broadcaster.broadcast} quadros")
+        if matches != len(report["checked"]):
+            failures.append(f"{count} espectadores: {len(report['checked']) - matches} estados reconstruídos diferentes")
+        if report["stalled_closed"] < stalled:
+            failures.append(f"{count} espectadores: {stalled - report['stalled_closed']} travados não desconectados")
+
+    # Falhas do teste: saída diferente de zero, para que ele possa barrar uma mudança.
+    if failures:
+        print("FALHOU: " + "; ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,11 @@ from src.screens.pause_screen import PauseScreen
 from src.utils.asset_loader import load_all_assets 
 from src.utils.enums import GameState 
 from src.utils.transition import FadeTransition
+from src.utils.frame_export import FrameExporter
+from src.net.spectator import SpectatorBroadcaster
+from src.utils.leak_monitor import LeakMonitor
+from src.utils.gc_manager import GCManager
+from src.utils.quality_governor import QualityGovernor
 from src.utils.score_manager import load_highscore, save_highscore
 
 class App:
@@ -18,7 +23,7 @@ class App:
     Atua como uma máquina de estados, controlando a transição entre as diferentes
     telas do jogo (Menu, Jogo, Configurações, etc.).
     """
-    def __init__(self):
+    def __init__(self, seed=None, record_path=None, replay=None, replay_start=0, autopilot=None, attract=False, leak_report=None, gc_log=None, stress=False, asteroid_physics=False, time_scale=1, render_scale=settings.RENDER_SCALE, pipelined=settings.PIPELINED_RENDERING, broadcast_port=None):
         # --- Inicialização do Pygame e da Janela ---
         pygame.init()
         pygame.mixer.init(channels=16)  # Permite múltiplos canais de áudio
@@ -30,28 +35,96 @@ class App:
         self.assets = load_all_assets()
         self.transition = FadeTransition(self.screen)
         self.highscore = load_highscore()
+        # Qualidade visual adaptada ao tempo dos quadros (ver QualityGovernor).
+        self.quality = QualityGovernor(self.assets['text_renderer'])
+        self.frame_exporter = None  # Exportação dos quadros do jogo (ver enable_frame_export)
+        self.broadcaster = None     # Transmissão das partidas para espectadores (ver enable_broadcast)
+        if broadcast_port is not None:
+            self.enable_broadcast(broadcast_port)
+        
+        # --- Coletor de Lixo ---
+        # Os assets e módulos carregados vivem até o fim: são congelados fora das coletas.
+        self.gc = GCManager(settings.GC_CONTROL, gc_log)
+        self.gc.freeze_long_lived()
 
         # --- Configurações Globais da Aplicação ---
         self.music_on = True
         self.sfx_on = True
         self.screen_shake_on = True
+        self.effects_on = True  # Partículas e explosões (puramente cosméticas)
+        self.render_scale = render_scale  # Fração da resolução da janela usada para desenhar o mundo
+        self.pipelined = pipelined        # Simulação em uma thread separada do desenho (ver FramePipeline)
+        
+        # --- Modo de Segundo Plano ---
+        # Ativado quando a janela perde o foco ou é minimizada: o jogo pausa,
+        # a taxa de quadros cai para o mínimo e a mixagem de áudio é suspensa.
+        self.in_background = False
         
         # --- Gerenciamento de Estado e Música ---
         self.music_channel = pygame.mixer.Channel(0)  # Canal dedicado para a música de fundo
         self.current_state = GameState.MENU  # O jogo começa no menu principal
         
         # --- Configurações de Dificuldade ---
+        self.difficulty_key = None
         self.difficulty_settings = None
+        # Parâmetros que substituem os do preset escolhido (gravados junto com os replays).
+        self.difficulty_overrides = {"asteroid_physics": True} if asteroid_physics else {}
         self.set_difficulty("MEDIUM")  # Define a dificuldade padrão ao iniciar
+        
+        # --- Gravação e Reprodução de Partidas ---
+        self.session_seed = seed        # Semente fixa para as partidas (None = aleatória)
+        self.record_path = record_path  # Arquivo onde a partida atual é gravada
+        self.replay = replay            # Replay a ser reproduzido no lugar do teclado
+        self.replay_start = replay_start  # Tick a partir do qual o replay é reproduzido
+        self.time_scale = time_scale      # Velocidade inicial de replays e do piloto automático
+        if self.replay:
+            # O replay define a dificuldade e começa direto no jogo.
+            self.difficulty_overrides = dict(self.replay.overrides)
+            self.set_difficulty(self.replay.difficulty_key)
+            self.current_state = GameState.PLAYING
+        
+        # --- Piloto Automático ---
+        self.autopilot_skill = autopilot  # Se definido, a nave é controlada pelo piloto automático
+        if attract:
+            self.current_state = GameState.ATTRACT  # Começa direto no modo demonstração
+        if stress:
+            # Começa direto no benchmark do modo de estresse.
+            self.set_difficulty("STRESS")
+            self.current_state = GameState.PLAYING
+        
+        # --- Monitor de Vazamentos ---
+        # Amostrado pela tela de jogo; o relatório é gravado ao fechar o jogo.
+        self.leak_report = leak_report
+        self.leak_monitor = LeakMonitor(settings.LEAK_SAMPLE_SECONDS) if leak_report else None
 
     def set_difficulty(self, difficulty_key):
         """Atualiza as configurações de dificuldade com base na chave fornecida."""
-        self.difficulty_settings = settings.DIFFICULTY_LEVELS[difficulty_key]
+        self.difficulty_key = difficulty_key
+        self.difficulty_settings = {**settings.DIFFICULTY_LEVELS[difficulty_key], **self.difficulty_overrides}
+
+    def enable_frame_export(self):
+        """Ativa a publicação dos quadros da tela de jogo para consumidores externos (bots, gravadores)."""
+        if self.frame_exporter is None:
+            self.frame_exporter = FrameExporter(self.screen)
+        return self.frame_exporter
+
+    def enable_broadcast(self, port=settings.SPECTATOR_PORT, host="0.0.0.0"):
+        """Transmite as partidas para espectadores conectados por TCP (ver SpectatorBroadcaster)."""
+        if self.broadcaster is None:
+            self.broadcaster = SpectatorBroadcaster(self.assets, host, port)
+            self.broadcaster.start()
+        return self.broadcaster
 
     def toggle_screen_shake(self): 
         """Ativa ou desativa o efeito de 'screen shake'."""
         self.screen_shake_on = not self.screen_shake_on
     
+    def cycle_render_scale(self):
+        """Passa para a próxima resolução interna de RENDER_SCALES."""
+        scales = settings.RENDER_SCALES
+        index = scales.index(self.render_scale) if self.render_scale in scales else -1
+        self.render_scale = scales[(index + 1) % len(scales)]
+
     def toggle_sfx(self):
         """Ativa ou desativa os efeitos sonoros."""
         self.sfx_on = not self.sfx_on
@@ -61,6 +134,30 @@ class App:
         self.music_on = not self.music_on
         self.handle_music(self.current_state)
 
+    def handle_window_event(self, event):
+        """
+        Processa eventos de foco/visibilidade da janela, alternando o modo de segundo plano.
+        Retorna True se o evento indica que a janela foi para segundo plano.
+        """
+        if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            if not self.in_background:
+                self.in_background = True
+                pygame.mixer.pause()  # Suspende todos os canais de áudio
+            return True
+
+        if event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+            if self.in_background:
+                self.in_background = False
+                pygame.mixer.unpause()
+                # Na tela de pausa a música deve continuar parada.
+                if self.current_state == GameState.PAUSE:
+                    self.music_channel.pause()
+        return False
+
+    def get_frame_rate(self, default=settings.FPS):
+        """Retorna a taxa de quadros alvo, reduzida ao mínimo enquanto a janela estiver em segundo plano."""
+        return settings.BACKGROUND_FPS if self.in_background else default
+
     def handle_music(self, new_state):
         """Gerencia qual faixa de música deve tocar com base no estado atual do jogo."""
         # Se a música estiver desativada, para qualquer som e sai da função.
@@ -70,7 +167,7 @@ class App:
         
         # Determina a faixa de música correta para o novo estado.
         target_track = None
-        if new_state in [GameState.MENU, GameState.TUTORIAL, GameState.SETTINGS, GameState.DIFFICULTY_SELECT]:
+        if new_state in [GameState.MENU, GameState.TUTORIAL, GameState.SETTINGS, GameState.DIFFICULTY_SELECT, GameState.ATTRACT]:
             target_track = 'menu_sound'
         elif new_state == GameState.PLAYING:
             target_track = 'action_soundtrack'
@@ -98,10 +195,10 @@ class App:
             # 1. Resolve estados de transição que afetam a instância do jogo.
             # Se o jogo for reiniciado ou voltar ao menu, a instância anterior é descartada.
             if self.current_state == GameState.RESTART:
-                game_instance = None
+                game_instance = self._end_game_session(game_instance)
                 self.current_state = GameState.PLAYING
             elif self.current_state == GameState.MENU:
-                game_instance = None
+                game_instance = self._end_game_session(game_instance)
             
             # Verifica se o jogo estava pausado para tratar a música corretamente.
             was_paused = self.current_state == GameState.RESUME
@@ -117,7 +214,7 @@ class App:
                 screen_instance = game_instance
 
             elif self.current_state == GameState.GAME_OVER:
-                game_instance = None  # Garante que o jogo não pode ser retomado
+                game_instance = self._end_game_session(game_instance)  # Garante que o jogo não pode ser retomado
                 final_score = screen_data if screen_data is not None else 0
                 is_new_highscore = final_score > self.highscore
                 if is_new_highscore:
@@ -125,6 +222,10 @@ class App:
                     save_highscore(self.highscore)
                 screen_instance = GameOverScreen(self.screen, self.clock, self.assets, final_score, self.highscore, is_new_highscore, self)
 
+            elif self.current_state == GameState.ATTRACT:
+                # Cada demonstração é uma partida nova e descartável (nunca é pausada nem retomada).
+                screen_instance = GameScreen(self.screen, self.clock, self.assets, self, attract=True)
+
             elif self.current_state == GameState.MENU:
                 screen_instance = MainMenuScreen(self.screen, self.clock, self.assets, self)
 
@@ -165,4 +266,18 @@ class App:
             self.current_state = next_state
 
         # Encerra o Pygame de forma limpa quando o loop principal termina.
-        pygame.quit()
\ No newline at end of file
+        self._end_game_session(game_instance)
+        if self.leak_monitor:
+            self.leak_monitor.write_csv(self.leak_report + ".csv")
+            self.leak_monitor.write_report(self.leak_report + ".txt")
+        if self.broadcaster:
+            print("\n".join(self.broadcaster.summary()))
+            self.broadcaster.stop()
+        self.gc.close()
+        pygame.quit()
+
+    def _end_game_session(self, game_instance):
+        """Finaliza a partida descartada (ex: fechando a gravação do replay). Sempre retorna None."""
+        if game_instance is not None:
+            game_instance.end_session()
+        return None
\ No newline at end of file
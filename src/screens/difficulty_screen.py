@@ -21,8 +21,8 @@ class DifficultyScreen:
         self.selected_index = 0  # Começa em "NIGHTMARE"
         self.pulse_angle = 0     # Para animação de pulso do item selecionado
         
-        # Ordem das dificuldades na tela
-        self.difficulties = ["NIGHTMARE", "MEDIUM", "EASY"]
+        # Ordem das dificuldades na tela (o modo de estresse fica por último)
+        self.difficulties = ["NIGHTMARE", "MEDIUM", "EASY", "STRESS"]
 
     def handle_event(self, event):
         """Processa a entrada do jogador para navegar e selecionar a dificuldade."""
@@ -79,7 +79,7 @@ class DifficultyScreen:
         # Loop para desenhar cada opção de dificuldade
         for i, key in enumerate(self.difficulties):
             difficulty_data = settings.DIFFICULTY_LEVELS[key]
-            y_pos = settings.SCREEN_HEIGHT * 0.40 + i * 150 # Espaçamento vertical
+            y_pos = settings.SCREEN_HEIGHT * 0.33 + i * 125 # Espaçamento vertical
             
             # Estilo para o item selecionado (maior, cor pulsante)
             if i == self.selected_index:
@@ -114,9 +114,10 @@ class DifficultyScreen:
                 if event.type == pygame.QUIT:
                     self.next_screen = GameState.QUIT
                     self.app.transition.start_fade_out()
+                self.app.handle_window_event(event)
                 self.handle_event(event)
             self.update()
             self.draw()
             pygame.display.flip()
-            self.clock.tick(60)
+            self.clock.tick(self.app.get_frame_rate(60))
         return self.next_screen, None
\ No newline at end of file
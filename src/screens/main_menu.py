@@ -25,12 +25,14 @@ class MainMenuScreen:
         self.selected_button_index = 0
         self.show_exit_confirmation = False
         self.selected_exit_button_index = 1 # 0=Sim, 1=Não
+        self.idle_time = 0 # Tempo sem teclas pressionadas, para iniciar o modo demonstração
 
     def handle_event(self, event):
         """Processa a entrada do jogador, delegando para o menu apropriado (principal ou confirmação de saída)."""
         if self.app.transition.is_active(): return
 
         if event.type == pygame.KEYDOWN:
+            self.idle_time = 0
             if self.show_exit_confirmation:
                 self._handle_exit_confirmation_input(event)
             else:
@@ -73,10 +75,17 @@ class MainMenuScreen:
         elif event.key == pygame.K_ESCAPE:
             self.show_exit_confirmation = False # Cancelar com ESC
 
-    def update(self):
+    def update(self, dt):
         """Atualiza o estado da tela, como animações e transições."""
         if not self.app.transition.is_active():
             self.pulse_angle += 0.05
+            
+            # Após um tempo ocioso (e com a janela em primeiro plano), inicia o modo demonstração.
+            if not self.app.in_background:
+                self.idle_time += dt
+            if self.idle_time >= settings.ATTRACT_IDLE_MS and not self.show_exit_confirmation:
+                self.next_screen = GameState.ATTRACT
+                self.app.transition.start_fade_out()
         
         self.background.update_menu_scroll()
         self.app.transition.update()
@@ -142,14 +151,16 @@ class MainMenuScreen:
         """O loop principal que executa esta tela."""
         self.running = True
         self.next_screen = GameState.MENU
+        dt = 0
         while self.running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.next_screen = GameState.QUIT
                     self.app.transition.start_fade_out()
+                self.app.handle_window_event(event)
                 self.handle_event(event)
-            self.update()
+            self.update(dt)
             self.draw()
             pygame.display.flip()
-            self.clock.tick(60)
+            dt = self.clock.tick(self.app.get_frame_rate(60))
         return self.next_screen, None
\ No newline at end of file
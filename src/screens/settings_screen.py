@@ -49,7 +49,9 @@ class SettingsScreen:
                     self.app.toggle_sfx()
                 elif self.selected_button_index == 2:
                     self.app.toggle_screen_shake()
-                elif self.selected_button_index == 3: # Voltar
+                elif self.selected_button_index == 3:
+                    self.app.cycle_render_scale()
+                elif self.selected_button_index == 4: # Voltar
                     self.next_screen = GameState.MENU
                     self.app.transition.start_fade_out()
             
@@ -72,6 +74,7 @@ class SettingsScreen:
             f"Música: {'ON' if self.app.music_on else 'OFF'}",
             f"Efeitos Sonoros: {'ON' if self.app.sfx_on else 'OFF'}",
             f"Screen Shake: {'ON' if self.app.screen_shake_on else 'OFF'}",
+            f"Resolução Interna: {self.app.render_scale:.0%}",
             "Voltar"
         ]
 
@@ -88,7 +91,7 @@ class SettingsScreen:
         
         # Botões
         for i, text in enumerate(self.button_texts):
-            y_pos = settings.SCREEN_HEIGHT * 0.35 + i * 80 # Espaçamento ajustado
+            y_pos = settings.SCREEN_HEIGHT * 0.32 + i * 75 # Espaçamento ajustado
             if i == self.selected_button_index:
                 pulse_highlight = (math.sin(self.pulse_angle * 0.8 + i) + 1) / 2
                 highlight_brightness = 200 + int(pulse_highlight * 55)
@@ -109,9 +112,10 @@ class SettingsScreen:
                 if event.type == pygame.QUIT:
                     self.next_screen = GameState.QUIT
                     self.app.transition.start_fade_out()
+                self.app.handle_window_event(event)
                 self.handle_event(event)
             self.update()
             self.draw()
             pygame.display.flip()
-            self.clock.tick(60)
+            self.clock.tick(self.app.get_frame_rate(60))
         return self.next_screen, None
\ No newline at end of file
@@ -113,9 +113,10 @@ class TutorialScreen:
                 if event.type == pygame.QUIT:
                     self.next_screen = GameState.QUIT
                     self.app.transition.start_fade_out()
+                self.app.handle_window_event(event)
                 self.handle_event(event)
             self.update()
             self.draw()
             pygame.display.flip()
-            self.clock.tick(60)
+            self.clock.tick(self.app.get_frame_rate(60))
         return self.next_screen, None
\ No newline at end of file
@@ -1,10 +1,26 @@
+import pygame
+
 # === CONFIGURAÇÕES GERAIS E DE TELA ===
 # Parâmetros que não mudam, independentemente da dificuldade.
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
+SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)  # Área de jogo, independente da janela
 FPS = 60
+RNG_EPOCH_TICKS = 120  # Ticks entre ressemeaduras do RNG da sessão (e entre keyframes dos replays)
+BACKGROUND_FPS = 5  # Taxa de quadros mínima quando a janela perde o foco ou é minimizada
+ROTATION_CACHE_STEP = 1  # Passo (em graus) dos ângulos guardados no cache de sprites rotacionados
 TITLE = "Asteroids"
+ATTRACT_IDLE_MS = 30000  # Tempo ocioso no menu até iniciar o modo demonstração
+ATTRACT_SKILL = "EXPERT"  # Habilidade do piloto automático no modo demonstração
+LEAK_SAMPLE_SECONDS = 10  # Intervalo entre amostras do monitor de vazamentos (--leak-report)
+TIME_SCALES = (0.25, 0.5, 1, 2, 4, 8)  # Velocidades de jogo disponíveis em replays e no piloto automático (teclas - e +)
+GC_CONTROL = True  # Controla as coletas do GC durante a partida (ver GCManager)
 SAFE_SPAWN_DISTANCE = 150  # Distância mínima da nave para spawn seguro de asteroides
+SPAWN_ASTEROID_GAP = 20  # Espaço mínimo entre um asteroide recém-criado e os demais
+SPAWN_GRID_CELL = 30  # Lado (px) das células da grade de ocupação usada no spawn (ver SpawnPlacer)
+SPATIAL_CELL = 80  # Lado (px) das células do índice espacial das consultas de alvo (ver SpatialIndex)
+ASTEROID_RAMP_MS = 30000  # Tempo de jogo entre aumentos do limite de asteroides
+ASTEROID_CAP = 20  # Limite do aumento gradual de asteroides (cada dificuldade pode definir 'asteroid_cap')
 
 # === CONFIGURAÇÕES FÍSICAS DA NAVE ===
 # Como a nave se comporta.
@@ -32,6 +48,28 @@ ASTEROID_SIZES = {
     1: 15  # size: radius (Small)
 }
 
+# === FÍSICA ENTRE ASTEROIDES ===
+# Usada apenas quando a dificuldade tem 'asteroid_physics' ativo (ou com --asteroid-physics).
+# A massa de cada asteroide é proporcional à sua área (raio ao quadrado).
+ASTEROID_RESTITUTION = 1.0     # 1.0 = colisões perfeitamente elásticas
+ASTEROID_FRACTURE_DV = 4.5     # Variação de velocidade (px/quadro) em um impacto que parte o asteroide
+ASTEROID_SPLIT_GRACE_MS = 400  # Tempo em que os fragmentos recém-criados atravessam os demais
+
+# === POWER-UPS ===
+# Os nomes são os membros de PowerUpType (src/utils/enums.py).
+POWERUP_DROP_CHANCE = 0.05     # Chance de um asteroide destruído pelo jogador deixar um power-up (UFOs sempre deixam)
+POWERUP_LIFETIME_MS = 10000    # Tempo até um power-up não coletado sumir (pisca nos últimos 2 s)
+POWERUP_SPEED = 0.6            # Velocidade de deriva dos power-ups (px/quadro)
+POWERUP_WEIGHTS = {"IMMORTALITY": 2, "EXTRA_LIFE": 1, "RAPID_FIRE": 3, "PET_SHIP": 2, "NUKE": 1, "SCORE_MULTIPLIER": 2}
+POWERUP_DURATIONS = {"IMMORTALITY": 8000, "RAPID_FIRE": 10000, "PET_SHIP": 15000, "SCORE_MULTIPLIER": 12000}  # Efeitos temporários (ms)
+RAPID_FIRE_COOLDOWN = 100      # Cooldown do tiro do jogador com RAPID_FIRE
+SCORE_MULTIPLIER_FACTOR = 2    # Multiplicador de pontos com SCORE_MULTIPLIER
+NUKE_ASTEROIDS_PER_TICK = 6    # Orçamento de asteroides destruídos por tick durante uma NUKE
+PET_ORBIT_RADIUS = 50          # Distância da nave de apoio até a nave
+PET_ORBIT_SPEED = 2            # Graus por quadro da órbita da nave de apoio
+PET_SHOT_COOLDOWN = 500        # Intervalo entre os tiros da nave de apoio
+PET_RANGE = 400                # Alcance da mira da nave de apoio
+
 # === PONTUAÇÃO BASE ===
 # Pontos concedidos antes de aplicar o multiplicador de dificuldade.
 BASE_POINTS = {
@@ -90,5 +128,83 @@ DIFFICULTY_LEVELS = {
         "ufo_shot_cooldown": 1000, # ms
         "ufo_speed": 8,
         "num_ufos": 2
+    },
+    "STRESS": {
+        "label": "Estresse",
+        "description": "Benchmark: milhares de entidades.",
+
+        # Jogo
+        "start_lives": 1,
+        "points_multiplier": 1.0,
+
+        # Spawns (os asteroides são controlados pela rampa do StressSystem)
+        "initial_asteroids": 0,
+        "max_asteroids": 0,
+        "ufo_spawn_rate": 1000, # ms
+        "ufo_shot_cooldown": 50, # ms ("bullet hell")
+        "ufo_speed": 3,
+        "num_ufos": 2,
+
+        # Exclusivos deste modo
+        "stress": True,           # Ativa o StressSystem
+        "immortal": True,         # A nave não sofre dano
+        "powerups": False,        # Sem power-ups (mantém as medições comparáveis)
+        "asteroid_cap": 100000,   # Limite de asteroides da rampa normal de spawn
     }
 }
+# Dificuldades de jogo, sem os presets de benchmark ('stress'), para as ferramentas que jogam partidas normais.
+GAMEPLAY_DIFFICULTIES = tuple(key for key, preset in DIFFICULTY_LEVELS.items() if not preset.get("stress"))
+
+# === QUALIDADE ADAPTATIVA ===
+# O QualityGovernor desce ou sobe um nível conforme o tempo dos quadros (ver src/utils/quality_governor.py).
+QUALITY_GOVERNOR = True        # Ajusta a qualidade automaticamente durante a partida
+QUALITY_WINDOW = 60            # Quadros em cada janela de medição
+QUALITY_PERCENTILE = 0.9       # Percentil do tempo de trabalho comparado ao orçamento
+QUALITY_DOWNGRADE = 0.9        # Desce um nível acima desta fração do orçamento do quadro
+QUALITY_UPGRADE = 0.6          # Sobe um nível abaixo desta fração...
+QUALITY_UPGRADE_WINDOWS = 3    # ...por este número de janelas seguidas
+QUALITY_LEVELS = (
+    # particles: fração das partículas de explosão; explosion_step: usa 1 a cada N quadros da animação (0 = sem animação)
+    {"label": "Alta", "particles": 1.0, "thrust_particles": 4, "star_layers": 3, "explosion_step": 1, "text_shadow": True},
+    {"label": "Média", "particles": 0.5, "thrust_particles": 2, "star_layers": 3, "explosion_step": 2, "text_shadow": True},
+    {"label": "Baixa", "particles": 0.25, "thrust_particles": 1, "star_layers": 2, "explosion_step": 3, "text_shadow": False},
+    {"label": "Mínima", "particles": 0.0, "thrust_particles": 0, "star_layers": 1, "explosion_step": 0, "text_shadow": False},
+)
+
+# === RESOLUÇÃO INTERNA ===
+# O mundo do jogo pode ser desenhado em uma superfície menor e ampliado para a janela;
+# a interface (HUD, textos) continua na resolução nativa (ver src/utils/render_scaler.py).
+RENDER_SCALES = (1.0, 0.75, 0.5)  # Frações da resolução da janela oferecidas nas Configurações
+RENDER_SCALE = 1.0                # Escala inicial
+RENDER_SCALE_MIN = 0.25           # Menor escala aceita (--render-scale)
+RENDER_SCALE_CACHE_SIZE = 4096    # Imagens reduzidas guardadas antes de o cache ser esvaziado
+
+# === SIMULAÇÃO EM PARALELO ===
+# Com o pipeline, a simulação do próximo quadro roda em uma thread de trabalho enquanto a
+# thread principal desenha o atual (ver src/utils/frame_pipeline.py).
+PIPELINED_RENDERING = False  # Desligado: o caminho sequencial tem um quadro a menos de latência
+PIPELINE_DEPTH = 2           # Quadros em andamento na thread de trabalho, no máximo
+
+# === CO-OP EM REDE ===
+# Servidor autoritativo e clientes leves via UDP (ver src/net/).
+COOP_SPAWN_SPACING = 80        # Distância (px) entre as naves no início e no respawn
+NET_PORT = 47800               # Porta UDP padrão do servidor
+NET_HISTORY_TICKS = 64         # Snapshots enviados guardados por cliente (bases possíveis dos deltas)
+NET_PARTICLE_RADIUS = 300      # Partículas só são enviadas a um cliente a menos disto da sua nave
+NET_CLIENT_TIMEOUT_MS = 3000   # Cliente sem enviar nada por este tempo é desconectado
+NET_MAX_PACKET = 60000         # Maior datagrama aceito
+
+# === TRANSMISSÃO PARA ESPECTADORES ===
+# Uma partida transmitida por TCP para muitos espectadores (ver src/net/spectator.py).
+SPECTATOR_PORT = 47801             # Porta TCP padrão da transmissão
+SPECTATOR_QUEUE_FRAMES = 8         # Quadros na fila de cada espectador; cheia, ele só recebe o próximo estado completo
+SPECTATOR_STALL_MS = 2000          # Espectador que não lê nada por este tempo (com a fila cheia) é desconectado
+SPECTATOR_SOCKET_BUFFER = 16384    # Buffer de envio do sistema por espectador (bytes)
+SPECTATOR_MAX_VIEWERS = 1000       # Conexões aceitas no máximo
+
+# === MODO DE ESTRESSE ===
+STRESS_STAGES = (50, 100, 250, 500, 1000, 2000, 5000, 10000)  # Asteroides alvo em cada estágio
+STRESS_STAGE_MS = 8000        # Duração de cada estágio
+STRESS_SPAWN_PER_TICK = 100   # Asteroides criados por tick até atingir o alvo
+STRESS_VOLLEY_MS = 150        # Intervalo entre rajadas de balas da nave
+STRESS_VOLLEY_BULLETS = 24    # Balas por rajada
@@ -0,0 +1,314 @@
+import os
+import time
+from collections import deque
+import pygame
+from . import settings
+from .entities.asteroid import Asteroid
+from .entities.bullet import PlayerBullet, EnemyBullet
+from .entities.pet_ship import PetShip
+from .entities.powerup import PowerUp
+from .entities.ufo import UFO
+from .systems.collision_system import CollisionSystem
+from .systems.movement_system import MovementSystem
+from .systems.powerup_system import PowerUpSystem
+from .systems.spawn_system import SpawnSystem
+from .systems.stress_system import StressSystem
+from .systems.wrap_system import WrapSystem
+from .systems.vfx_system import VFXSystem
+from .game_state import GameSessionState
+from .utils.enums import PowerUpType
+from .utils.quality_governor import QualityGovernor
+from .utils.sprite_cache import rotation_cache
+
+class HeadlessApp:
+    """
+    Substituto mínimo da classe App para rodar a simulação sem janela nem áudio.
+    Expõe apenas as configurações globais que os sistemas consultam.
+    """
+    def __init__(self, difficulty_key="MEDIUM", effects_on=False, overrides=None):
+        self.difficulty_key = difficulty_key
+        # 'overrides' substitui parâmetros do preset (usado nas varreduras de balanceamento).
+        self.difficulty_settings = {**settings.DIFFICULTY_LEVELS[difficulty_key], **(overrides or {})}
+        self.music_on = False
+        self.sfx_on = False
+        self.screen_shake_on = False
+        # Sem janela ninguém vê partículas e explosões; desligá-las não altera a simulação.
+        self.effects_on = effects_on
+        self.quality = QualityGovernor(adaptive=False)  # Sempre no nível mais alto
+
+def init_headless():
+    """
+    Inicializa o Pygame com drivers de vídeo e áudio "dummy".
+    Um modo de vídeo mínimo é necessário para que os assets possam usar convert_alpha().
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+class Simulation:
+    """
+    O núcleo de uma partida: estado da sessão e os sistemas que o atualizam.
+    Não lê o teclado nem desenha nada; avança um tick por vez a partir de um InputFrame,
+    o que permite rodá-la tanto na tela de jogo quanto sem janela (replays, testes).
+    """
+    def __init__(self, assets, app, seed=None, players=1):
+        self.assets = assets
+        self.app = app
+
+        # Contêiner de dados da sessão e sistemas de jogo.
+        self.state = GameSessionState(assets, app.difficulty_settings, seed, players)
+        self.vfx = VFXSystem(self.state, assets, app)
+        self.wrap = WrapSystem(self.state)
+        self.collision = CollisionSystem(self.state, self.vfx, self.wrap, assets, app)
+        self.powerups = PowerUpSystem(self.state, self.vfx, self.collision, assets, app)
+        self.spawn = SpawnSystem(self.state, assets, app)
+        self.movement = MovementSystem(self.state)
+        self.stress = StressSystem(self.state, assets, app) if app.difficulty_settings.get("stress") else None
+
+        # Variáveis de controle da simulação.
+        self.shot_countdowns = [0] * players  # Cooldown de tiro de cada nave
+        self.tick = 0
+
+    @property
+    def player_shot_countdown(self):
+        """Cooldown de tiro da nave do primeiro jogador (o único fora do co-op)."""
+        return self.shot_countdowns[0]
+
+    @player_shot_countdown.setter
+    def player_shot_countdown(self, value):
+        self.shot_countdowns[0] = value
+
+    def step(self, frame, partner_frames=()):
+        """
+        Avança a simulação em um tick usando a entrada e o delta time do quadro.
+        No co-op, 'partner_frames' traz a entrada das demais naves (o dt é o de 'frame').
+        """
+        dt = frame.dt
+        frames = (frame, *partner_frames)
+        for ship, ship_frame in zip(self.state.ships, frames):
+            ship.controls = ship_frame
+
+        # No início de cada época, os fluxos aleatórios são ressemeados (ver SessionRandom).
+        if self.tick % settings.RNG_EPOCH_TICKS == 0:
+            self.state.rng.start_epoch(self.tick // settings.RNG_EPOCH_TICKS)
+
+        # Tiro do jogador (processado antes do cooldown, como um evento de tecla).
+        for player, ship_frame in enumerate(frames):
+            if ship_frame.shoot:
+                self._handle_player_shooting(player)
+
+        # Atualiza o cooldown de tiro do jogador.
+        for player, countdown in enumerate(self.shot_countdowns):
+            if countdown > 0:
+                self.shot_countdowns[player] = countdown - dt
+
+        # Cria partículas de rastro se a nave estiver acelerando.
+        for ship in self.state.ships:
+            if ship.accelerating:
+                self.vfx.create_thrust_particles(ship)
+
+        # Delega a atualização para os sistemas especializados.
+        if self.stress:
+            self.stress.update(dt)
+        self.spawn.update(dt)
+        self.vfx.update()
+        self.collision.process()
+        self.powerups.update(dt)
+
+        # Atualiza todos os sprites do jogo (asteroides e projéteis são movidos em lote,
+        # pelo AsteroidField e pelo MovementSystem).
+        self.state.asteroid_field.step(dt)
+        self.movement.update(dt)
+        self.state.all_sprites.update(dt, self.state.ship)
+        # Cópias das entidades que cruzam as bordas, para as colisões do próximo tick e o desenho.
+        self.wrap.update()
+        # Avança o tempo de jogo; os timers que vencem neste tick disparam ao seu final.
+        self.state.clock.advance(dt)
+        self.tick += 1
+
+    def is_game_over(self):
+        """Verifica a condição de fim de jogo."""
+        return self.state.lives <= 0
+
+    def snapshot(self):
+        """
+        Captura o estado de jogabilidade da partida em um dicionário serializável.
+        Efeitos cosméticos (partículas, explosões, tremor) não são incluídos.
+        Deve ser chamado no início de uma época (tick múltiplo de RNG_EPOCH_TICKS),
+        pois o estado aleatório não é armazenado.
+        """
+        ship = self.state.ship
+        entities = []
+        nuke_order = {asteroid: i for i, asteroid in enumerate(self.powerups.nuke_queue)}
+        # Percorre 'all_sprites' para preservar a ordem relativa das entidades nos grupos.
+        # O centro do rect é salvo à parte: após o "wrap-around" ele pode diferir da posição.
+        for sprite in self.state.all_sprites:
+            if isinstance(sprite, Asteroid):
+                data = {"type": "asteroid", "size": sprite.size, "rot": sprite.rotation, "rot_speed": sprite.rotation_speed}
+                if sprite.entering:
+                    data["entering"] = True  # Ainda entrando na tela (fora do toro)
+                if sprite.collision_grace > 0:
+                    data["grace"] = sprite.collision_grace  # Apenas no modo de física entre asteroides
+                if sprite in nuke_order:
+                    data["nuke"] = nuke_order[sprite]  # Posição na fila de uma NUKE em andamento
+            elif isinstance(sprite, UFO):
+                data = {"type": "ufo", "pattern": sprite.movement_pattern, "shot_timer": sprite.shot_timer}
+            elif isinstance(sprite, PlayerBullet):
+                data = {"type": "player_bullet", "lifetime": sprite.lifetime_countdown}
+            elif isinstance(sprite, EnemyBullet):
+                data = {"type": "enemy_bullet"}
+            elif isinstance(sprite, PowerUp):
+                data = {"type": "powerup", "kind": sprite.kind.name, "lifetime": sprite.lifetime_countdown}
+            elif isinstance(sprite, PetShip):
+                data = {"type": "pet", "orbit": sprite.orbit_angle, "angle": sprite.angle, "shot_timer": sprite.shot_timer}
+            else:
+                continue
+            data.update({"pos": list(sprite.position), "vel": list(sprite.velocity), "rect": list(sprite.rect.center)})
+            entities.append(data)
+
+        return {
+            "tick": self.tick,
+            "score": self.state.score,
+            "lives": self.state.lives,
+            "wave_count": self.state.wave_count,
+            "deaths": dict(self.state.deaths),
+            "player_shot_countdown": self.player_shot_countdown,
+            "clock": self.state.clock.snapshot(),
+            "spawn": {
+                "asteroid_spawn_timer": self.spawn.asteroid_spawn_timer,
+                "max_asteroids": self.spawn.max_asteroids,
+                "ufo_spawn_countdown": self.spawn.ufo_spawn_countdown,
+            },
+            "ship": {
+                "pos": list(ship.position), "vel": list(ship.velocity), "angle": ship.angle, "rect": list(ship.rect.center),
+                "accelerating": ship.accelerating, "invulnerable": ship.invulnerable,
+                "invulnerable_countdown": ship.invulnerable_countdown,
+                "visible": ship.visible, "blink_countdown": ship.blink_countdown,
+            },
+            "entities": entities,
+            "powerups": self.powerups.snapshot(),
+            "stress": self.stress.snapshot() if self.stress else None,
+        }
+
+    def restore(self, snapshot):
+        """Substitui o estado da partida pelo de um snapshot criado por snapshot()."""
+        state = self.state
+        self.tick = snapshot["tick"]
+        state.score = snapshot["score"]
+        state.lives = snapshot["lives"]
+        state.wave_count = snapshot["wave_count"]
+        state.deaths = dict(snapshot.get("deaths", state.deaths))  # Ausente em replays antigos
+        self.player_shot_countdown = snapshot["player_shot_countdown"]
+        state.clock.restore(snapshot["clock"])
+        for key, value in snapshot["spawn"].items():
+            setattr(self.spawn, key, value)
+        self.powerups.restore(snapshot["powerups"])
+        if self.stress and snapshot.get("stress"):
+            self.stress.restore(snapshot["stress"])
+
+        # --- Nave ---
+        ship = state.ship
+        ship_data = snapshot["ship"]
+        ship.position = pygame.math.Vector2(ship_data["pos"])
+        ship.velocity = pygame.math.Vector2(ship_data["vel"])
+        ship.angle = ship_data["angle"]
+        ship._rotate(0)  # Reconstrói imagem, rect e máscara para o ângulo restaurado
+        ship.rect.center = ship_data["rect"]
+        for key in ("accelerating", "invulnerable", "invulnerable_countdown", "visible", "blink_countdown"):
+            setattr(ship, key, ship_data[key])
+
+        # --- Demais entidades ---
+        # Remove tudo exceto a nave e recria as entidades na ordem original.
+        for sprite in state.all_sprites.sprites():
+            if sprite is not ship:
+                sprite.kill()
+        self.vfx.shake_magnitude = self.vfx.shake_duration = 0
+
+        nuke_queue = []
+        for data in snapshot["entities"]:
+            kind = data["type"]
+            if kind == "asteroid":
+                sprite = Asteroid(data["size"], data["pos"], self.assets['asteroid_image'], state.asteroid_field, rng=state.rng.asteroids)
+                sprite.rotation = data["rot"]
+                sprite.rotation_speed = data["rot_speed"]
+                sprite.collision_grace = data.get("grace", 0)
+                sprite.entering = data.get("entering", False)
+                sprite.image, sprite.mask = rotation_cache.rotated(sprite.original_image, sprite.rotation)
+                sprite.rect = sprite.image.get_rect()
+                group = state.asteroids
+                if "nuke" in data:
+                    nuke_queue.append((data["nuke"], sprite))
+            elif kind == "ufo":
+                sprite = UFO(self.assets, state.all_sprites, state.enemy_bullets, state.entities["enemy_bullets"], self.app, movement_pattern=data["pattern"], rng=state.rng.ufo)
+                sprite.shot_timer = data["shot_timer"]
+                group = state.ufos
+            elif kind == "player_bullet":
+                velocity = pygame.math.Vector2(data["vel"])
+                sprite = PlayerBullet(data["pos"], velocity / settings.BULLET_SPEED, self.assets['player_gunshot_image'], state.entities["player_bullets"])
+                sprite.lifetime_countdown = data["lifetime"]
+                group = state.bullets
+            elif kind == "powerup":
+                sprite = PowerUp(PowerUpType[data["kind"]], data["pos"], self.assets['powerup_image'], state.rng.powerups)
+                sprite.lifetime_countdown = data["lifetime"]
+                group = state.powerups
+            elif kind == "pet":
+                sprite = PetShip(self.assets['pet_ship_image'], ship)
+                sprite.orbit_angle = data["orbit"]
+                sprite.shot_timer = data["shot_timer"]
+                sprite.aim(pygame.math.Vector2(0, -1).rotate(-data["angle"]))
+                sprite.angle = data["angle"]  # Valor exato (a conversão acima arredonda)
+                group = state.pets
+            else: # 'enemy_bullet'
+                velocity = pygame.math.Vector2(data["vel"])
+                sprite = EnemyBullet(data["pos"], velocity / settings.ENEMY_BULLET_SPEED, self.assets['enemy_gunshot_image'], state.entities["enemy_bullets"])
+                group = state.enemy_bullets
+
+            # Valores exatos (a reconstrução acima pode introduzir arredondamentos).
+            sprite.position = pygame.math.Vector2(data["pos"])
+            sprite.velocity = pygame.math.Vector2(data["vel"])
+            sprite.rect.center = data["rect"]
+            state.all_sprites.add(sprite)
+            group.add(sprite)
+        self.powerups.nuke_queue = deque(sprite for _, sprite in sorted(nuke_queue, key=lambda item: item[0]))
+        self.wrap.update()
+
+    def _handle_player_shooting(self, player=0):
+        """Lida com a lógica de criação de um projétil quando o jogador (a nave 'player') atira."""
+        ship = self.state.ships[player]
+        # Verifica se a nave está viva e se o cooldown de tiro já terminou.
+        if ship.alive() and self.shot_countdowns[player] <= 0:
+            rapid_fire = PowerUpType.RAPID_FIRE in self.state.active_effects
+            self.shot_countdowns[player] = settings.RAPID_FIRE_COOLDOWN if rapid_fire else settings.PLAYER_BULLET_COOLDOWN
+
+            # Toca o som de tiro, se estiver ativado.
+            if self.app.sfx_on:
+                self.assets['player_gunshot_sound'].play()
+
+            # Cria e adiciona a nova bala aos grupos de sprites apropriados.
+            bullet_data = ship.shoot(self.assets['player_gunshot_image'])
+            new_bullet = PlayerBullet(bullet_data["pos"], bullet_data["dir"], bullet_data["img"], self.state.entities["player_bullets"])
+            self.state.all_sprites.add(new_bullet)
+            self.state.bullets.add(new_bullet)
+
+def play_replay_headless(replay, assets):
+    """
+    Reproduz um replay sem renderização, o mais rápido possível.
+    Retorna um resumo com o resultado da partida e a velocidade da simulação.
+    """
+    sim = Simulation(assets, HeadlessApp(replay.difficulty_key, overrides=replay.overrides), seed=replay.seed)
+
+    start = time.perf_counter()
+    for frame in replay.frames():
+        sim.step(frame)
+        if sim.is_game_over():
+            break
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": sim.tick,
+        "score": sim.state.score,
+        "lives": sim.state.lives,
+        "elapsed": elapsed,
+        "ticks_per_second": sim.tick / elapsed if elapsed > 0 else 0.0,
+    }
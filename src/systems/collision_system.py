@@ -1,25 +1,33 @@
 import pygame
-import random
 from .. import settings
-from ..entities.explosion import Explosion
 from ..entities.asteroid import Asteroid
+from ..utils.enums import PowerUpType
 
 class CollisionSystem:
     """
     Gerencia toda a lógica de detecção e resposta a colisões no jogo.
     Desacopla a lógica de colisão das próprias entidades.
+    As entidades que cruzam as bordas também colidem pelas suas cópias do outro
+    lado da tela, fornecidas pelo WrapSystem.
     """
-    def __init__(self, game_state, vfx_system, assets, app):
+    def __init__(self, game_state, vfx_system, wrap_system, assets, app):
         self.state = game_state
         self.vfx = vfx_system
+        self.wrap = wrap_system
         self.assets = assets
         self.app = app
         self.points_multiplier = self.app.difficulty_settings["points_multiplier"]
+        self.immortal = self.app.difficulty_settings.get("immortal", False)  # Modo de estresse
+        self.asteroid_physics = self.app.difficulty_settings.get("asteroid_physics", False)  # Asteroides colidem entre si
+        # Chamado com a posição de cada inimigo destruído por um tiro (o PowerUpSystem usa para as quedas).
+        self.on_enemy_destroyed = None
 
     def process(self):
         """Método principal chamado a cada frame para verificar todas as colisões."""
         self._check_bullet_hits()
         self._check_player_collisions()
+        if self.asteroid_physics:
+            self._check_asteroid_collisions()
 
     def _check_bullet_hits(self):
         """Verifica colisões entre balas do jogador e inimigos (asteroides e UFOs)."""
@@ -28,56 +36,95 @@ class CollisionSystem:
         # Os dois 'True' removem tanto o asteroide quanto a bala dos seus grupos.
         collided_asteroids = pygame.sprite.groupcollide(self.state.asteroids, self.state.bullets, True, True, pygame.sprite.collide_mask)
         for asteroid in collided_asteroids:
-            self._destroy_asteroid(asteroid)
+            self.destroy_asteroid(asteroid)
+            self._enemy_destroyed(asteroid)
+        # Asteroides que cruzam uma borda também são atingidos pela sua parte do outro lado.
+        for asteroid in self.wrap.ghost_hits(self.wrap.asteroid_ghosts, self.state.bullets):
+            self.destroy_asteroid(asteroid)
+            self._enemy_destroyed(asteroid)
         
         # Balas vs. UFOs
         collided_ufos = pygame.sprite.groupcollide(self.state.ufos, self.state.bullets, True, True, pygame.sprite.collide_mask)
         for ufo in collided_ufos:
             self._destroy_ufo(ufo)
+            self._enemy_destroyed(ufo, always=True)
+
+    def _enemy_destroyed(self, enemy, always=False):
+        """Avisa o ouvinte (se houver) de que um tiro destruiu um inimigo; 'always' garante a queda."""
+        if self.on_enemy_destroyed:
+            self.on_enemy_destroyed(enemy.rect.center, always)
 
     def _check_player_collisions(self):
-        """Verifica colisões envolvendo a nave do jogador."""
-        ship = self.state.ship
-        # Só verifica colisões se a nave estiver viva e não invulnerável.
-        if ship.alive() and not ship.invulnerable:
-            # Nave vs. Asteroides
-            hit_asteroid = pygame.sprite.spritecollideany(ship, self.state.asteroids, pygame.sprite.collide_mask)
-            if hit_asteroid: self._player_hit(hit_asteroid); return
-            
-            # Nave vs. UFOs
-            hit_ufo = pygame.sprite.spritecollideany(ship, self.state.ufos, pygame.sprite.collide_mask)
-            if hit_ufo: self._player_hit(hit_ufo); return
+        """Verifica colisões envolvendo a nave do jogador (cada nave, no co-op)."""
+        # Só verifica colisões se a nave estiver viva e não invulnerável (nem imortal por um power-up).
+        immortal = self.immortal or PowerUpType.IMMORTALITY in self.state.active_effects
+        if immortal:
+            return
+        for ship in self.state.ships:
+            if ship.alive() and not ship.invulnerable:
+                self._check_ship_collisions(ship)
+
+    def _check_ship_collisions(self, ship):
+        # A nave e os asteroides podem estar cruzando as bordas: as cópias também contam.
+        ship_ghosts = [ghost for ghost in self.wrap.ship_ghosts if ghost.owner is ship]
+
+        # Nave vs. Asteroides
+        hit_asteroid = self.wrap.collide_any(ship, ship_ghosts, self.state.asteroids, self.wrap.asteroid_ghosts)
+        if hit_asteroid: self._player_hit(hit_asteroid, "asteroid", ship); return
+        
+        # Nave vs. UFOs
+        hit_ufo = self.wrap.collide_any(ship, ship_ghosts, self.state.ufos)
+        if hit_ufo: self._player_hit(hit_ufo, "ufo", ship); return
+
+        # Nave vs. Balas Inimigas
+        hit_enemy_bullet = self.wrap.collide_any(ship, ship_ghosts, self.state.enemy_bullets)
+        if hit_enemy_bullet: self._player_hit(hit_enemy_bullet, "enemy_bullet", ship)
 
-            # Nave vs. Balas Inimigas
-            hit_enemy_bullet = pygame.sprite.spritecollideany(ship, self.state.enemy_bullets, pygame.sprite.collide_mask)
-            if hit_enemy_bullet: self._player_hit(hit_enemy_bullet)
+    def _check_asteroid_collisions(self):
+        """Colisões elásticas entre asteroides (resolvidas em lote pelo AsteroidField)."""
+        slots, delta_v = self.state.asteroid_field.collide(settings.ASTEROID_RESTITUTION)
+        self._fracture_asteroids(slots, delta_v)
 
-    def _destroy_asteroid(self, asteroid, killed_by_player=True):
-        """Lida com a destruição de um asteroide."""
+    def _fracture_asteroids(self, slots, delta_v):
+        """Parte os asteroides grandes e médios que sofreram um impacto forte (sem pontuação)."""
+        field = self.state.asteroid_field
+        fractured = [field.sprites[slot] for slot, dv in zip(slots.tolist(), delta_v.tolist())
+                     if dv > settings.ASTEROID_FRACTURE_DV]
+        for asteroid in fractured:
+            if asteroid.size > 1:
+                self.destroy_asteroid(asteroid, killed_by_player=False)
+
+    def destroy_asteroid(self, asteroid, killed_by_player=True, split=True, quiet=False):
+        """
+        Lida com a destruição de um asteroide. 'split=False' o destrói sem criar fragmentos e
+        'quiet=True' reduz os efeitos (sem som nem tremor), para destruições em massa (NUKE).
+        """
         # Efeitos sonoros e visuais
-        if self.app.sfx_on:
-            if random.random() < 0.05: self.assets['scream_sound'].play() # Easter egg
+        if self.app.sfx_on and not quiet:
+            if self.state.rng.sfx.random() < 0.05: self.assets['scream_sound'].play() # Easter egg
             else: self.assets['explosion_sound'].play()
         
-        self.vfx.create_particles(asteroid.rect.center, 15)
-        self.vfx.trigger_shake(8)
+        self.vfx.create_particles(asteroid.rect.center, 4 if quiet else 15)
+        if not quiet:
+            self.vfx.trigger_shake(8)
         
         # Animação de explosão
-        if self.assets['explosion_anim']:
-            explosion = Explosion(asteroid.rect.center, self.assets['explosion_anim'])
-            self.state.all_sprites.add(explosion)
+        self.vfx.create_explosion(asteroid.rect.center)
         
         # Pontuação
         if killed_by_player:
             if asteroid.size == 3: base_points = settings.BASE_POINTS["ASTEROID_LARGE"]
             elif asteroid.size == 2: base_points = settings.BASE_POINTS["ASTEROID_MEDIUM"]
             else: base_points = settings.BASE_POINTS["ASTEROID_SMALL"]
-            self.state.score += int(base_points * self.points_multiplier)
+            self._award_points(base_points)
         
         # Se o asteroide for grande ou médio, cria dois menores em seu lugar.
-        if asteroid.size > 1:
+        if split and asteroid.size > 1:
             for _ in range(2):
-                new_asteroid = Asteroid(asteroid.size - 1, asteroid.position, self.assets['asteroid_image'])
+                new_asteroid = Asteroid(asteroid.size - 1, asteroid.position, self.assets['asteroid_image'], self.state.asteroid_field, rng=self.state.rng.asteroids)
+                if self.asteroid_physics:
+                    # Os fragmentos nascem sobrepostos: atravessam os demais até se afastarem.
+                    new_asteroid.collision_grace = settings.ASTEROID_SPLIT_GRACE_MS
                 self.state.all_sprites.add(new_asteroid)
                 self.state.asteroids.add(new_asteroid)
         
@@ -86,8 +133,7 @@ class CollisionSystem:
     def _destroy_ufo(self, ufo):
         """Lida com a destruição de um UFO."""
         # Pontuação
-        base_points = settings.BASE_POINTS["UFO"]
-        self.state.score += int(base_points * self.points_multiplier)
+        self._award_points(settings.BASE_POINTS["UFO"])
         
         # Efeitos visuais e sonoros (mais intensos para o UFO)
         self.vfx.create_particles(ufo.rect.center, 25, p_type='ufo_explosion')
@@ -95,29 +141,33 @@ class CollisionSystem:
         if self.app.sfx_on: self.assets['explosion_sound'].play()
         
         # Animação de explosão
-        if self.assets['explosion_anim']:
-            explosion = Explosion(ufo.rect.center, self.assets['explosion_anim'])
-            self.state.all_sprites.add(explosion)
+        self.vfx.create_explosion(ufo.rect.center)
             
         ufo.kill()
             
-    def _player_hit(self, collided_sprite):
-        """Lida com a nave do jogador sendo atingida."""
+    def _award_points(self, base_points):
+        """Soma os pontos, aplicando o multiplicador da dificuldade e o do power-up SCORE_MULTIPLIER."""
+        points = base_points * self.points_multiplier
+        if PowerUpType.SCORE_MULTIPLIER in self.state.active_effects:
+            points *= settings.SCORE_MULTIPLIER_FACTOR
+        self.state.score += int(points)
+            
+    def _player_hit(self, collided_sprite, cause, ship):
+        """Lida com a nave do jogador sendo atingida (no co-op, as vidas são compartilhadas)."""
         self.state.lives -= 1
+        self.state.deaths[cause] += 1  # Estatística usada pelas ferramentas de balanceamento
         
         # Efeitos visuais e sonoros (muito intensos para a morte do jogador)
         self.vfx.trigger_shake(25)
         if self.app.sfx_on: self.assets['explosion_sound'].play()
-        self.vfx.create_particles(self.state.ship.rect.center, 30)
+        self.vfx.create_particles(ship.rect.center, 30)
         
         # Animação de explosão
-        if self.assets['explosion_anim']:
-            explosion = Explosion(self.state.ship.rect.center, self.assets['explosion_anim'])
-            self.state.all_sprites.add(explosion)
+        self.vfx.create_explosion(ship.rect.center)
         
         # Remove o sprite que colidiu com o jogador (asteroide, ufo ou bala)
         collided_sprite.kill()
 
         # Se o jogador ainda tiver vidas, faz o respawn.
         if self.state.lives > 0:
-            self.state.ship.respawn()
\ No newline at end of file
+            ship.respawn()
\ No newline at end of file
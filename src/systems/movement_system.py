@@ -0,0 +1,59 @@
+import numpy as np
+from .. import settings
+
+class MovementSystem:
+    """
+    Atualiza em lote as entidades do EntityStore da sessão, percorrendo as colunas
+    das tabelas em vez de chamar update() sprite a sprite:
+
+    - 'transform' + 'velocity': movimento baseado em Delta Time;
+    - 'render' + 'collider': recalcula o rect e remove quem saiu da tela (com uma margem);
+    - 'lifetime': desconta o tempo de vida e remove quem o esgotou.
+    """
+    OFFSCREEN_MARGIN = 25  # Margem (em pixels) além da borda antes de remover a entidade
+
+    def __init__(self, game_state):
+        self.state = game_state
+        margin = self.OFFSCREEN_MARGIN
+        self.bounds = (-margin, -margin, settings.SCREEN_WIDTH + margin, settings.SCREEN_HEIGHT + margin)
+
+    def update(self, dt):
+        for table in self.state.entities.tables.values():
+            if table.count:
+                self._update_table(table, dt)
+
+    def _update_table(self, table, dt):
+        expired = np.zeros(table.count, dtype=bool)
+
+        if table.has("transform") and table.has("velocity"):
+            position = table["position"]
+            position += table["velocity"] * (dt / (1000.0 / settings.FPS))
+
+            if table.has("render") and table.has("collider"):
+                # Mesmo arredondamento do Pygame ao atribuir um centro fracionário ao rect
+                # (metade para longe do zero) e o canto calculado a partir dele.
+                center = np.trunc(position + np.copysign(0.5, position)).astype(np.int64)
+                size = table["size"]
+                topleft = table["topleft"]
+                topleft[:] = center - size // 2
+
+                # Mesmo teste de Rect.colliderect contra a tela ampliada pela margem.
+                left, top, right, bottom = self.bounds
+                bottomright = topleft + size
+                visible = ((topleft[:, 0] < right) & (topleft[:, 1] < bottom) &
+                           (bottomright[:, 0] > left) & (bottomright[:, 1] > top))
+                expired |= ~visible
+
+                proxies = table.proxies
+                for row, corner in enumerate(topleft.tolist()):
+                    proxies[row].rect.topleft = corner
+
+        if table.has("lifetime"):
+            lifetime = table["lifetime"]
+            lifetime -= dt
+            expired |= lifetime <= 0
+
+        # Remove de trás para frente: a remoção move a última linha para o lugar da removida.
+        proxies = table.proxies
+        for row in np.flatnonzero(expired)[::-1].tolist():
+            proxies[row].kill()
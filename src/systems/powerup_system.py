@@ -0,0 +1,186 @@
+from collections import deque
+import pygame
+from .. import settings
+from ..entities.bullet import PlayerBullet
+from ..entities.pet_ship import PetShip
+from ..entities.powerup import PowerUp
+from ..utils.enums import PowerUpType
+
+class PowerUpSystem:
+    """
+    Gerencia os power-ups: o aparecimento (quando um inimigo é destruído), a coleta
+    pela nave e os efeitos de cada tipo.
+
+    - Efeitos temporários (IMMORTALITY, RAPID_FIRE, PET_SHIP, SCORE_MULTIPLIER) ficam em
+      'active_effects' do estado da sessão e terminam por um timer do relógio da sessão
+      (coletar de novo renova a duração). Os outros sistemas só consultam 'active_effects'.
+    - NUKE destrói todos os asteroides na tela, mas em lotes de no máximo
+      NUKE_ASTEROIDS_PER_TICK por tick, do mais próximo para o mais distante da nave: a
+      destruição (pontos, explosões, partículas) se espalha por vários quadros em vez de
+      causar um pico em um só. Os asteroides atingidos não se partem, e o som toca uma vez.
+    """
+    LABELS = {
+        PowerUpType.IMMORTALITY: "IMORTAL",
+        PowerUpType.RAPID_FIRE: "TIRO RÁPIDO",
+        PowerUpType.PET_SHIP: "NAVE DE APOIO",
+        PowerUpType.SCORE_MULTIPLIER: f"PONTOS x{settings.SCORE_MULTIPLIER_FACTOR}",
+    }
+    GLOW_INTERVAL = 120  # ms entre as partículas de brilho dos power-ups e da nave imortal
+
+    def __init__(self, game_state, vfx_system, collision_system, assets, app):
+        self.state = game_state
+        self.vfx = vfx_system
+        self.collision = collision_system
+        self.assets = assets
+        self.app = app
+        self.rng = self.state.rng.powerups  # Fluxo aleatório dedicado (não altera os demais sorteios)
+        self.enabled = self.app.difficulty_settings.get("powerups", True)
+
+        # Tipos sorteados nas quedas, com seus pesos.
+        self.kinds = [PowerUpType[name] for name in settings.POWERUP_WEIGHTS]
+        self.weights = list(settings.POWERUP_WEIGHTS.values())
+
+        # Fila de asteroides ainda a destruir por uma NUKE em andamento.
+        self.nuke_queue = deque()
+        self.glow_countdown = 0
+
+        # O fim de cada efeito temporário é um timer do relógio da sessão.
+        for name in settings.POWERUP_DURATIONS:
+            kind = PowerUpType[name]
+            self.state.clock.on(self._timer_name(kind), lambda due, kind=kind: self._expire(kind))
+
+        # Inimigos destruídos pelo jogador podem deixar power-ups.
+        self.collision.on_enemy_destroyed = self._maybe_drop
+
+    @staticmethod
+    def _timer_name(kind):
+        return f"powerup_end:{kind.name}"
+
+    def update(self, dt):
+        """Coleta, tiros da nave de apoio, o lote da NUKE em andamento e o brilho dos power-ups."""
+        # No co-op, qualquer nave coleta (os efeitos valem para todas).
+        for ship in self.state.ships:
+            if ship.alive():
+                for powerup in pygame.sprite.spritecollide(ship, self.state.powerups, True, pygame.sprite.collide_mask):
+                    self.activate(powerup.kind)
+
+        if self.state.pets:
+            self._update_pet(dt)
+        if self.nuke_queue:
+            self._advance_nuke()
+        self._emit_glow(dt)
+
+    # --- Aparecimento ---
+    def _maybe_drop(self, position, always=False):
+        """Chamado pelo CollisionSystem quando o jogador destrói um inimigo."""
+        if not self.enabled:
+            return
+        if always or self.rng.random() < settings.POWERUP_DROP_CHANCE:
+            self.drop(self.rng.choices(self.kinds, self.weights)[0], position)
+
+    def drop(self, kind, position):
+        """Cria um power-up do tipo informado na posição."""
+        powerup = PowerUp(kind, position, self.assets['powerup_image'], self.rng)
+        self.state.all_sprites.add(powerup)
+        self.state.powerups.add(powerup)
+        return powerup
+
+    # --- Efeitos ---
+    def activate(self, kind):
+        """Aplica o efeito de um power-up coletado."""
+        if self.app.sfx_on:
+            self.assets['powerup_sound'].play()
+        self.vfx.create_particles(self.state.ship.rect.center, 12, p_type='powerup_glow')
+
+        if kind == PowerUpType.EXTRA_LIFE:
+            self.state.lives += 1
+        elif kind == PowerUpType.NUKE:
+            self._start_nuke()
+        else:
+            # Efeito temporário: (re)agenda o fim, renovando a duração se já estiver ativo.
+            clock = self.state.clock
+            timer = self._timer_name(kind)
+            clock.cancel(timer)
+            clock.schedule(timer, settings.POWERUP_DURATIONS[kind.name])
+            self.state.active_effects[kind] = clock.now + settings.POWERUP_DURATIONS[kind.name]
+            if kind == PowerUpType.PET_SHIP and not self.state.pets:
+                self._add_pet()
+
+    def _expire(self, kind):
+        """Encerra um efeito temporário (timer do relógio da sessão)."""
+        self.state.active_effects.pop(kind, None)
+        if kind == PowerUpType.PET_SHIP:
+            for pet in self.state.pets.sprites():
+                self.vfx.create_particles(pet.rect.center, 10)
+                pet.kill()
+
+    def _emit_glow(self, dt):
+        """Partículas de brilho em volta dos power-ups e da nave imortal (puramente cosméticas)."""
+        self.glow_countdown -= dt
+        if self.glow_countdown > 0:
+            return
+        self.glow_countdown = self.GLOW_INTERVAL
+        for powerup in self.state.powerups:
+            self.vfx.create_particles(powerup.rect.center, 1, p_type='powerup_glow')
+        if PowerUpType.IMMORTALITY in self.state.active_effects and self.state.ship.alive():
+            self.vfx.create_particles(self.state.ship.rect.center, 2, p_type='powerup_glow')
+
+    # --- Nave de Apoio ---
+    def _add_pet(self):
+        pet = PetShip(self.assets['pet_ship_image'], self.state.ship)
+        self.state.all_sprites.add(pet)
+        self.state.pets.add(pet)
+        return pet
+
+    def _update_pet(self, dt):
+        """A nave de apoio atira no alvo (asteroide ou UFO) mais próximo dela, se estiver ao alcance."""
+        pet = self.state.pets.sprite
+        pet.shot_timer = max(pet.shot_timer - dt, 0)  # Sem alvo, fica pronta para atirar
+        if pet.shot_timer > 0:
+            return
+        targets = self.state.spatial.nearest(pet.position, 1, settings.PET_RANGE)
+        if not targets:
+            return  # Tenta de novo no próximo tick
+        pet.shot_timer = settings.PET_SHOT_COOLDOWN
+        _, _, delta = targets[0]
+        direction = pygame.math.Vector2(delta)
+        if direction.length() > 0:
+            direction.normalize_ip()
+        pet.aim(direction)
+
+        bullet = PlayerBullet(pet.position, direction, self.assets['player_gunshot_image'], self.state.entities["player_bullets"])
+        self.state.all_sprites.add(bullet)
+        self.state.bullets.add(bullet)
+        if self.app.sfx_on:
+            self.assets['pet_gunshot_sound'].play()
+
+    # --- NUKE ---
+    def _start_nuke(self):
+        """Enfileira os asteroides na tela, do mais próximo para o mais distante da nave."""
+        ship_position = self.state.ship.position
+        queued = set(self.nuke_queue)  # Uma segunda NUKE não repete os asteroides da primeira
+        targets = [asteroid for asteroid in self.state.asteroids
+                   if asteroid not in queued and settings.SCREEN_RECT.colliderect(asteroid.rect)]
+        targets.sort(key=lambda asteroid: ship_position.distance_squared_to(asteroid.position))
+        self.nuke_queue.extend(targets)
+        self.vfx.trigger_shake(20, duration=30)
+        if self.app.sfx_on:
+            self.assets['explosion_sound'].play()
+
+    def _advance_nuke(self):
+        """Destrói o próximo lote de asteroides da NUKE (os que já morreram são ignorados)."""
+        destroyed = 0
+        while self.nuke_queue and destroyed < settings.NUKE_ASTEROIDS_PER_TICK:
+            asteroid = self.nuke_queue.popleft()
+            if asteroid.alive():
+                self.collision.destroy_asteroid(asteroid, split=False, quiet=True)
+                destroyed += 1
+
+    # --- Snapshots ---
+    # Os sprites (power-ups, nave de apoio) e a fila da NUKE são salvos com as entidades, pela simulação.
+    def snapshot(self):
+        """Efeitos ativos e seus instantes de término (os timers ficam no relógio da sessão)."""
+        return {kind.name: end for kind, end in self.state.active_effects.items()}
+
+    def restore(self, effects):
+        self.state.active_effects = {PowerUpType[name]: end for name, end in effects.items()}
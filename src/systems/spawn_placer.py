@@ -0,0 +1,138 @@
+import math
+import numpy as np
+import pygame
+from .. import settings
+
+class SpawnPlacer:
+    """
+    Escolhe posições de spawn para asteroides em tempo limitado, usando uma grade de
+    ocupação da tela (um toro) em vez de sortear e rejeitar posições indefinidamente.
+
+    A cada chamada, a grade marca as células proibidas: as próximas da nave (menos de
+    SAFE_SPAWN_DISTANCE) e as próximas dos asteroides existentes (raios somados mais
+    SPAWN_ASTEROID_GAP). A marcação é conservadora: qualquer ponto de uma célula livre
+    respeita as distâncias mínimas. O sorteio é feito entre as células livres, e cada
+    asteroide posicionado em um lote passa a ocupar a grade para os seguintes.
+
+    O custo não depende da sorte: é proporcional ao número de células e de asteroides.
+    Se não houver célula livre, a separação entre asteroides é relaxada e, por fim,
+    a distância da nave também, de modo que sempre há uma posição.
+    """
+    EDGE_OFFSET = 50  # Distância fora da tela dos asteroides que entram pelas bordas
+    EDGES = (None, "top", "bottom", "left", "right")  # Códigos de borda das células candidatas
+
+    def __init__(self, game_state, rng, cell_size=settings.SPAWN_GRID_CELL):
+        self.state = game_state
+        self.rng = rng
+        self.nx = max(1, int(settings.SCREEN_WIDTH // cell_size))
+        self.ny = max(1, int(settings.SCREEN_HEIGHT // cell_size))
+        self.cell_w = settings.SCREEN_WIDTH / self.nx
+        self.cell_h = settings.SCREEN_HEIGHT / self.ny
+        self._stamps = {}
+        self._regions = self._build_regions()
+
+    def place(self, count, size, region="screen"):
+        """
+        Retorna 'count' posições (Vector2) para asteroides do tamanho 'size'.
+        region="screen": em qualquer ponto da tela; region="edge": fora da tela, junto a
+        uma das bordas (o asteroide entra na tela a partir dali).
+        """
+        radius = settings.ASTEROID_SIZES.get(size, 15)
+        ship_blocked, asteroid_blocked = self._build_grids(radius)
+
+        positions = []
+        for _ in range(count):
+            position = self._sample(ship_blocked, asteroid_blocked, region)
+            positions.append(position)
+            # O novo asteroide também ocupa a grade, para os próximos do lote.
+            self._stamp(asteroid_blocked, np.array([self._entry_point(position)]), radius + radius + settings.SPAWN_ASTEROID_GAP)
+        return positions
+
+    # --- Grade de Ocupação ---
+    def _build_grids(self, radius):
+        """Grades (nx, ny) das células proibidas pela nave e pelos asteroides existentes."""
+        ship_blocked = np.zeros((self.nx, self.ny), dtype=bool)
+        ships = [tuple(ship.position) for ship in self.state.ships if ship.alive()]
+        if ships:
+            self._stamp(ship_blocked, np.array(ships), settings.SAFE_SPAWN_DISTANCE)
+
+        asteroid_blocked = np.zeros((self.nx, self.ny), dtype=bool)
+        field = self.state.asteroid_field
+        alive = np.flatnonzero(field.alive[:field.count])
+        if len(alive):
+            # Asteroides ainda entrando na tela contam pelo ponto da borda por onde entram.
+            points = self._entry_point(field.pos[alive])
+            for other_radius in np.unique(field.radius[alive]).tolist():
+                same = field.radius[alive] == other_radius
+                self._stamp(asteroid_blocked, points[same], radius + other_radius + settings.SPAWN_ASTEROID_GAP)
+        return ship_blocked, asteroid_blocked
+
+    def _stamp(self, grid, points, clearance):
+        """Marca em 'grid' as células que têm algum ponto a menos de 'clearance' de um dos pontos."""
+        if not len(points):
+            return
+        dx, dy = self._stamp_offsets(clearance)
+        cx = (points[:, 0] // self.cell_w).astype(np.int64)
+        cy = (points[:, 1] // self.cell_h).astype(np.int64)
+        grid[(cx[:, None] + dx) % self.nx, (cy[:, None] + dy) % self.ny] = True
+
+    def _stamp_offsets(self, clearance):
+        """
+        Deslocamentos (em células) do "carimbo" de um disco de raio 'clearance'. Inclui a
+        diagonal de uma célula de folga, pois o ponto pode estar em qualquer lugar da sua
+        célula. Os carimbos são guardados por raio.
+        """
+        key = round(clearance, 3)
+        if key not in self._stamps:
+            reach_x = math.ceil(clearance / self.cell_w) + 1
+            reach_y = math.ceil(clearance / self.cell_h) + 1
+            dx, dy = np.meshgrid(np.arange(-reach_x, reach_x + 1), np.arange(-reach_y, reach_y + 1), indexing='ij')
+            # Distância entre as células mais a diagonal de uma célula (pior caso dos dois pontos).
+            gap_x = np.maximum(np.abs(dx) - 1, 0) * self.cell_w
+            gap_y = np.maximum(np.abs(dy) - 1, 0) * self.cell_h
+            inside = np.hypot(gap_x, gap_y) < clearance
+            self._stamps[key] = (dx[inside].ravel(), dy[inside].ravel())
+        return self._stamps[key]
+
+    def _entry_point(self, positions):
+        """Ponto da tela correspondente a cada posição (as de fora são presas à borda)."""
+        points = np.asarray(positions, dtype=float)
+        limit = (settings.SCREEN_WIDTH - 1e-6, settings.SCREEN_HEIGHT - 1e-6)
+        return np.clip(points, 0, limit)
+
+    # --- Sorteio ---
+    def _sample(self, ship_blocked, asteroid_blocked, region):
+        """Sorteia uma célula livre (relaxando as restrições se preciso) e um ponto dentro dela."""
+        cx, cy, edge = self._regions[region]
+        for blocked in (ship_blocked | asteroid_blocked, ship_blocked):
+            free = np.flatnonzero(~blocked[cx, cy])
+            if len(free):
+                break
+        else:
+            free = np.arange(len(cx))
+        choice = int(free[self.rng.randrange(len(free))])
+
+        x = (int(cx[choice]) + self.rng.random()) * self.cell_w
+        y = (int(cy[choice]) + self.rng.random()) * self.cell_h
+        side = self.EDGES[int(edge[choice])]
+        if side == "left": x = -self.EDGE_OFFSET
+        elif side == "right": x = settings.SCREEN_WIDTH + self.EDGE_OFFSET
+        elif side == "top": y = -self.EDGE_OFFSET
+        elif side == "bottom": y = settings.SCREEN_HEIGHT + self.EDGE_OFFSET
+        return pygame.math.Vector2(x, y)
+
+    def _build_regions(self):
+        """
+        Células candidatas de cada região, como arrays (cx, cy, borda). Na região das bordas,
+        cada célula junto a uma borda indica por qual lado o asteroide entra (as dos cantos
+        aparecem duas vezes, uma para cada lado).
+        """
+        cx, cy = np.meshgrid(np.arange(self.nx), np.arange(self.ny), indexing='ij')
+        screen = (cx.ravel(), cy.ravel(), np.zeros(cx.size, dtype=np.int64))
+
+        nx, ny = self.nx, self.ny
+        columns, rows = np.arange(nx), np.arange(ny)
+        edge = (np.concatenate([columns, columns, np.zeros(ny, dtype=np.int64), np.full(ny, nx - 1)]),
+                np.concatenate([np.zeros(nx, dtype=np.int64), np.full(nx, ny - 1), rows, rows]),
+                np.repeat([1, 2, 3, 4], [nx, nx, ny, ny]))  # Códigos de EDGES: top, bottom, left, right
+        return {"screen": screen, "edge": edge}
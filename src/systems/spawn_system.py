@@ -1,8 +1,7 @@
-import pygame
-import random
 from .. import settings
 from ..entities.asteroid import Asteroid
 from ..entities.ufo import UFO
+from .spawn_placer import SpawnPlacer
 
 class SpawnSystem:
     """
@@ -13,10 +12,16 @@ class SpawnSystem:
         self.state = game_state
         self.assets = assets
         self.app = app
+        self.rng = self.state.rng.spawn  # Fluxo aleatório dedicado a posições e timers de spawn
+        self.placer = SpawnPlacer(self.state, self.rng)  # Posições seguras, longe da nave e dos asteroides
         
         # --- Configurações de Spawn de Asteroides ---
         self.asteroid_spawn_timer = 0
         self.max_asteroids = self.app.difficulty_settings["max_asteroids"]
+        self.asteroid_cap = self.app.difficulty_settings.get("asteroid_cap", settings.ASTEROID_CAP)
+        # O limite aumenta em intervalos exatos de tempo de jogo (timer do relógio da sessão).
+        self.state.clock.on("asteroid_ramp", self._ramp_max_asteroids)
+        self.state.clock.schedule("asteroid_ramp", settings.ASTEROID_RAMP_MS)
         
         # --- Configurações de Spawn de UFOs ---
         self.ufo_spawn_countdown = self.app.difficulty_settings["ufo_spawn_rate"]
@@ -31,14 +36,10 @@ class SpawnSystem:
         self.asteroid_spawn_timer -= dt
         if self.asteroid_spawn_timer <= 0:
             # Reseta o timer com um valor aleatório para um spawn menos previsível.
-            self.asteroid_spawn_timer = random.uniform(2000, 4000)
+            self.asteroid_spawn_timer = self.rng.uniform(2000, 4000)
             if len(self.state.asteroids) < self.max_asteroids:
                 self._spawn_asteroid_at_edge()
 
-        # Aumenta gradualmente o número máximo de asteroides a cada 30 segundos.
-        if pygame.time.get_ticks() % 30000 < dt:
-             self.max_asteroids = min(self.max_asteroids + 1, 20)  # Limite máximo de 20
-
         # --- Lógica de Spawn de UFOs ---
         # Só conta o tempo para spawnar UFOs se não houver nenhum na tela.
         if not self.state.ufos:
@@ -48,34 +49,26 @@ class SpawnSystem:
                 # Reseta o countdown para a próxima onda de UFOs.
                 self.ufo_spawn_countdown = self.app.difficulty_settings["ufo_spawn_rate"]
 
+    def _ramp_max_asteroids(self, due):
+        """Aumenta gradualmente o número máximo de asteroides (a cada ASTEROID_RAMP_MS de partida)."""
+        self.max_asteroids = min(self.max_asteroids + 1, self.asteroid_cap)
+        # Reagenda a partir do vencimento, e não de 'now', para que os intervalos não acumulem atraso.
+        self.state.clock.schedule_at("asteroid_ramp", due + settings.ASTEROID_RAMP_MS)
+
     def spawn_initial_asteroids(self, number):
         """Cria a leva inicial de asteroides no começo do jogo."""
-        for _ in range(number):
-            # Procura uma posição segura para o spawn, longe da nave do jogador.
-            while True:
-                pos = pygame.math.Vector2(random.randrange(settings.SCREEN_WIDTH), random.randrange(settings.SCREEN_HEIGHT))
-                if not self.state.ship.alive() or pos.distance_to(self.state.ship.position) > settings.SAFE_SPAWN_DISTANCE:
-                    break
+        # Posições seguras para o lote inteiro, longe da nave e umas das outras.
+        for pos in self.placer.place(number, 3):
             self._spawn_asteroid(3, pos) # Spawn de um asteroide grande
 
     def _spawn_asteroid_at_edge(self):
-        """Cria um único asteroide em uma das bordas da tela."""
-        edge = random.choice(['top', 'bottom', 'left', 'right'])
-        
-        if edge == 'top':
-            pos = pygame.math.Vector2(random.randrange(settings.SCREEN_WIDTH), -50)
-        elif edge == 'bottom':
-            pos = pygame.math.Vector2(random.randrange(settings.SCREEN_WIDTH), settings.SCREEN_HEIGHT + 50)
-        elif edge == 'left':
-            pos = pygame.math.Vector2(-50, random.randrange(settings.SCREEN_HEIGHT))
-        else: # 'right'
-            pos = pygame.math.Vector2(settings.SCREEN_WIDTH + 50, random.randrange(settings.SCREEN_HEIGHT))
-            
+        """Cria um único asteroide em uma das bordas da tela, longe da nave e dos demais asteroides."""
+        pos = self.placer.place(1, 3, region="edge")[0]
         self._spawn_asteroid(3, pos) # Spawn de um asteroide grande
 
     def _spawn_asteroid(self, size, position):
         """Cria uma instância de Asteroide e a adiciona aos grupos de sprites."""
-        asteroid = Asteroid(size, position, self.assets['asteroid_image'])
+        asteroid = Asteroid(size, position, self.assets['asteroid_image'], self.state.asteroid_field, rng=self.state.rng.asteroids)
         self.state.all_sprites.add(asteroid)
         self.state.asteroids.add(asteroid)
 
@@ -92,6 +85,6 @@ class SpawnSystem:
         patterns_to_spawn = patterns[:self.num_ufos_to_spawn]
 
         for pattern in patterns_to_spawn:
-            ufo = UFO(self.assets, self.state.all_sprites, self.state.enemy_bullets, self.app, movement_pattern=pattern)
+            ufo = UFO(self.assets, self.state.all_sprites, self.state.enemy_bullets, self.state.entities["enemy_bullets"], self.app, movement_pattern=pattern, rng=self.state.rng.ufo)
             self.state.all_sprites.add(ufo)
             self.state.ufos.add(ufo)
\ No newline at end of file
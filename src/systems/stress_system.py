@@ -0,0 +1,124 @@
+import math
+import pygame
+from .. import settings
+from ..entities.asteroid import Asteroid
+from ..entities.bullet import PlayerBullet
+
+class StressSystem:
+    """
+    Sistema do modo de estresse (benchmark): aumenta a quantidade de asteroides em
+    estágios de ordens de grandeza crescentes e dispara rajadas de balas em todas as
+    direções a partir da nave, gerando explosões contínuas.
+
+    A tela de jogo informa o tempo de cada quadro via record_frame(); ao final, summary()
+    diz quantas entidades a máquina sustenta a 60 FPS.
+    """
+    def __init__(self, game_state, assets, app):
+        self.state = game_state
+        self.assets = assets
+        self.app = app
+
+        # --- Rampa de Estágios ---
+        self.stage = 0
+        self.stage_countdown = settings.STRESS_STAGE_MS
+        self.volley_countdown = 0
+        self.finished = False
+
+        # --- Medições por Estágio ---
+        # Para cada estágio: tempos de trabalho dos quadros (ms) e contagens de entidades.
+        self.frame_times = [[] for _ in settings.STRESS_STAGES]
+        self.entity_counts = [[] for _ in settings.STRESS_STAGES]
+
+    @property
+    def target(self):
+        """Quantidade de asteroides alvo do estágio atual."""
+        return settings.STRESS_STAGES[self.stage]
+
+    def update(self, dt):
+        """Avança a rampa, repõe asteroides até o alvo e dispara as rajadas."""
+        if self.finished:
+            return
+
+        # Repõe asteroides em lotes, para não travar um único quadro.
+        missing = min(self.target - len(self.state.asteroids), settings.STRESS_SPAWN_PER_TICK)
+        for _ in range(missing):
+            self._spawn_asteroid()
+
+        # Rajada de balas em círculo a partir da nave.
+        self.volley_countdown -= dt
+        if self.volley_countdown <= 0:
+            self.volley_countdown = settings.STRESS_VOLLEY_MS
+            self._fire_volley()
+
+        self.stage_countdown -= dt
+        if self.stage_countdown <= 0:
+            self._end_stage()
+
+    def _end_stage(self):
+        """Passa ao próximo estágio ou encerra o benchmark se a máquina já estiver saturada."""
+        saturated = self._percentile(self.frame_times[self.stage], 95) > 4 * (1000 / settings.FPS)
+        if saturated or self.stage == len(settings.STRESS_STAGES) - 1:
+            self.finished = True
+        else:
+            self.stage += 1
+            self.stage_countdown = settings.STRESS_STAGE_MS
+
+    def _spawn_asteroid(self):
+        """Cria um asteroide grande em um ponto aleatório da tela (a nave é imortal neste modo)."""
+        rng = self.state.rng.spawn
+        position = (rng.randrange(settings.SCREEN_WIDTH), rng.randrange(settings.SCREEN_HEIGHT))
+        asteroid = Asteroid(3, position, self.assets['asteroid_image'], self.state.asteroid_field, rng=self.state.rng.asteroids)
+        self.state.all_sprites.add(asteroid)
+        self.state.asteroids.add(asteroid)
+
+    def _fire_volley(self):
+        """Dispara STRESS_VOLLEY_BULLETS balas igualmente espaçadas ao redor da nave."""
+        ship = self.state.ship
+        for i in range(settings.STRESS_VOLLEY_BULLETS):
+            angle = 2 * math.pi * i / settings.STRESS_VOLLEY_BULLETS
+            direction = pygame.math.Vector2(math.cos(angle), math.sin(angle))
+            bullet = PlayerBullet(ship.position, direction, self.assets['player_gunshot_image'], self.state.entities["player_bullets"])
+            self.state.all_sprites.add(bullet)
+            self.state.bullets.add(bullet)
+
+    def record_frame(self, work_ms, entity_count):
+        """Registra o tempo de trabalho de um quadro e a quantidade de entidades no estágio atual."""
+        if not self.finished:
+            self.frame_times[self.stage].append(work_ms)
+            self.entity_counts[self.stage].append(entity_count)
+
+    @staticmethod
+    def _percentile(values, percent):
+        """Percentil simples (sem interpolação) de uma lista; 0 se estiver vazia."""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def summary(self):
+        """Retorna as linhas do resumo: desempenho por estágio e a contagem sustentada a 60 FPS."""
+        budget = 1000 / settings.FPS
+        lines = []
+        sustained = 0
+        for stage, target in enumerate(settings.STRESS_STAGES):
+            times = self.frame_times[stage]
+            if not times:
+                break
+            p95 = self._percentile(times, 95)
+            entities = self._percentile(self.entity_counts[stage], 50)
+            lines.append(f"{target:>6} asteroides: {entities:>6} entidades, p95 {p95:5.1f} ms "
+                         f"(~{min(settings.FPS, 1000 / max(p95, 0.001)):.0f} FPS)")
+            # Um estágio é sustentado a 60 FPS se 95% dos quadros couberem no orçamento.
+            if p95 <= budget:
+                sustained = max(sustained, entities)
+        lines.append(f"Entidades sustentadas a {settings.FPS} FPS: {sustained}")
+        return lines
+
+    def snapshot(self):
+        """Estado da rampa, para snapshots da simulação."""
+        return {"stage": self.stage, "stage_countdown": self.stage_countdown,
+                "volley_countdown": self.volley_countdown, "finished": self.finished}
+
+    def restore(self, data):
+        for key, value in data.items():
+            setattr(self, key, value)
@@ -1,5 +1,5 @@
 import pygame
-import random
+from ..entities.explosion import Explosion
 from ..entities.particles import Particle 
 
 class VFXSystem:
@@ -7,8 +7,9 @@ class VFXSystem:
     Sistema de Efeitos Visuais (Visual Effects).
     Gerencia a criação de partículas e o efeito de "screen shake".
     """
-    def __init__(self, game_state, app):
+    def __init__(self, game_state, assets, app):
         self.state = game_state
+        self.assets = assets
         self.app = app
         
         # Variáveis para controlar o "screen shake"
@@ -48,22 +49,29 @@ class VFXSystem:
         Este valor deve ser adicionado à posição de todos os objetos renderizados.
         """
         if self.shake_magnitude > 0:
-            offset_x = random.randint(-self.shake_magnitude, self.shake_magnitude)
-            offset_y = random.randint(-self.shake_magnitude, self.shake_magnitude)
+            offset_x = self.state.rng.shake.randint(-self.shake_magnitude, self.shake_magnitude)
+            offset_y = self.state.rng.shake.randint(-self.shake_magnitude, self.shake_magnitude)
             return (offset_x, offset_y)
             
         return (0, 0)
 
     def create_particles(self, position, count, p_type='explosion'):
-        """Cria múltiplas partículas de um tipo específico em uma dada posição."""
-        for _ in range(count):
-            particle = Particle(position, p_type=p_type)
+        """
+        Cria múltiplas partículas de um tipo específico em uma dada posição.
+        A quantidade é reduzida conforme o nível de qualidade atual (ver QualityGovernor).
+        """
+        if not self.app.effects_on:
+            return
+        for _ in range(self.app.quality.particles(count)):
+            particle = Particle(position, p_type=p_type, rng=self.state.rng.particles)
             self.state.all_sprites.add(particle)
             self.state.particles.add(particle)
 
-    def create_thrust_particles(self):
-        """Cria as partículas do rastro de propulsão da nave."""
-        ship = self.state.ship
+    def create_thrust_particles(self, ship=None):
+        """Cria as partículas do rastro de propulsão da nave (a do primeiro jogador, por padrão)."""
+        if not self.app.effects_on:
+            return
+        ship = ship or self.state.ship
         
         # Calcula a direção oposta à frente da nave para o rastro.
         thrust_direction = pygame.math.Vector2(0, 1).rotate(-ship.angle)
@@ -73,12 +81,24 @@ class VFXSystem:
         position = ship.position + offset
         
         # Cria um pequeno número de partículas a cada frame para um rastro contínuo.
-        for _ in range(4):
+        for _ in range(self.app.quality.preset["thrust_particles"]):
             particle = Particle(
                 position, 
                 p_type='thrust', 
                 initial_velocity_vector=ship.velocity,  # Passa a inércia da nave
-                thrust_direction=thrust_direction       # Passa a direção do empurrão
+                thrust_direction=thrust_direction,      # Passa a direção do empurrão
+                rng=self.state.rng.particles
             )
             self.state.all_sprites.add(particle)
-            self.state.particles.add(particle)
\ No newline at end of file
+            self.state.particles.add(particle)
+
+    def create_explosion(self, center):
+        """Cria a animação de explosão, com menos quadros (ou nenhuma) nos níveis de qualidade mais baixos."""
+        animation = self.assets['explosion_anim']
+        if not self.app.effects_on or not animation:
+            return
+        frames = self.app.quality.explosion_frames(animation)
+        if frames:
+            # Cada quadro dura mais quando alguns são pulados: a explosão mantém a duração.
+            rate = 75 * len(animation) // len(frames)
+            self.state.all_sprites.add(Explosion(center, frames, rate))
@@ -0,0 +1,84 @@
+import pygame
+from .. import settings
+
+class Ghost:
+    """
+    Cópia de um sprite deslocada de uma largura (e/ou altura) de tela: a parte de uma
+    entidade que, ao cruzar uma borda, aparece do lado oposto. Compartilha a imagem e a
+    máscara do sprite original ('owner') e só existe durante um tick.
+
+    Não é um Sprite (nunca entra em grupos), mas tem 'rect' e 'mask', o suficiente para
+    as funções de colisão do Pygame.
+    """
+    __slots__ = ("owner", "image", "mask", "rect")
+
+    def __init__(self, owner, offset):
+        self.owner = owner
+        self.image = owner.image
+        self.mask = owner.mask
+        self.rect = owner.rect.move(offset)
+
+def wrap_offsets(rect):
+    """Deslocamentos (dx, dy) das cópias de 'rect' que ficam visíveis do outro lado da tela."""
+    width, height = settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT
+    dxs = [0]
+    if rect.left < 0: dxs.append(width)
+    elif rect.right > width: dxs.append(-width)
+    dys = [0]
+    if rect.top < 0: dys.append(height)
+    elif rect.bottom > height: dys.append(-height)
+    return [(dx, dy) for dx in dxs for dy in dys if dx or dy]
+
+class WrapSystem:
+    """
+    Torna colisões e desenho cientes do "wrap-around" da tela (um toro).
+
+    A cada tick, depois do movimento, cria cópias ("ghosts") apenas das entidades que
+    estão cruzando uma borda: os asteroides próximos das bordas (pré-selecionados em lote
+    pelo AsteroidField) e a nave. As mesmas cópias são usadas pelo CollisionSystem no tick
+    seguinte e pela tela de jogo para desenhar os dois lados da entidade.
+    """
+    def __init__(self, game_state):
+        self.state = game_state
+        self.asteroid_ghosts = []
+        self.ship_ghosts = []
+
+    def update(self):
+        """Recria as cópias a partir das posições atuais."""
+        self.asteroid_ghosts = [Ghost(sprite, offset) for sprite in self.state.asteroid_field.edge_sprites()
+                                for offset in wrap_offsets(sprite.rect)]
+        self.ship_ghosts = [Ghost(ship, offset) for ship in self.state.ships if ship.alive()
+                            for offset in wrap_offsets(ship.rect)]
+
+    def ghost_hits(self, ghosts, group):
+        """
+        Donos das cópias atingidas por sprites de 'group' (colisão por máscara). Os sprites
+        de 'group' que acertaram são removidos, como em groupcollide; cada dono conta uma vez.
+        """
+        owners = []
+        for ghost in ghosts:
+            owner = ghost.owner
+            if not owner.alive() or owner in owners:
+                continue
+            # Filtra pelos rects antes de comparar as máscaras.
+            hits = [sprite for sprite in pygame.sprite.spritecollide(ghost, group, False)
+                    if pygame.sprite.collide_mask(ghost, sprite)]
+            for sprite in hits:
+                sprite.kill()
+            if hits:
+                owners.append(owner)
+        return owners
+
+    def collide_any(self, sprite, sprite_ghosts, group, group_ghosts=()):
+        """
+        Como spritecollideany (por máscara), mas testando também as cópias dos dois lados.
+        Retorna o sprite de 'group' atingido (o dono, se o contato foi com uma cópia) ou None.
+        """
+        for copy in (sprite, *sprite_ghosts):
+            hit = pygame.sprite.spritecollideany(copy, group, pygame.sprite.collide_mask)
+            if hit:
+                return hit
+            for ghost in group_ghosts:
+                if ghost.owner.alive() and copy.rect.colliderect(ghost.rect) and pygame.sprite.collide_mask(copy, ghost):
+                    return ghost.owner
+        return None
@@ -2,7 +2,7 @@ import pygame
 import os
 from src.utils.text_renderer import TextRenderer
 
-def load_all_assets():
+def load_all_assets(load_sounds=True):
     """
     Carrega todos os assets do jogo (imagens, sons, fontes) de uma só vez
     e os retorna em um dicionário para fácil acesso em todo o projeto.
@@ -66,6 +66,10 @@ def load_all_assets():
         print("ERRO: Não foi possível carregar a spritesheet de explosão.")
 
     # --- Carregamento de Sons e Músicas ---
+    # Sem mixer (ex: simulação sem janela), os sons são omitidos.
+    if not load_sounds:
+        return assets
+    
     snd_path = os.path.join(assets_path, 'sounds')
     
     # Subpastas de sons
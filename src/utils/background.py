@@ -58,14 +58,19 @@ class Starfield:
                 if star[1] > settings.SCREEN_HEIGHT: star[1] = 0
                 if star[1] < 0: star[1] = settings.SCREEN_HEIGHT
     
-    def draw(self, screen):
-        """Desenha todas as camadas de estrelas na tela, cada uma com sua cor e tamanho."""
+    def draw(self, screen, layers=3, scale=1.0):
+        """
+        Desenha as camadas de estrelas na tela, cada uma com sua cor e tamanho.
+        Com 'layers' menor que 3, as camadas mais distantes (e mais apagadas) são omitidas.
+        'scale' converte as posições para uma superfície de resolução interna menor.
+        """
         # Define a aparência de cada camada (cor e tamanho).
         colors = [(80, 80, 80), (150, 150, 150), (255, 255, 255)]
         sizes = [1, 1, 2]
         
-        for i, layer in enumerate(self.star_layers):
+        for i in range(len(self.star_layers) - layers, len(self.star_layers)):
+            layer = self.star_layers[i]
             color = colors[i]
-            size = sizes[i]
+            size = max(1, round(sizes[i] * scale))
             for star in layer:
-                pygame.draw.circle(screen, color, (int(star[0]), int(star[1])), size)
\ No newline at end of file
+                pygame.draw.circle(screen, color, (int(star[0] * scale), int(star[1] * scale)), size)
\ No newline at end of file
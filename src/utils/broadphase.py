@@ -0,0 +1,47 @@
+import numpy as np
+
+def wrap_delta(delta, period):
+    """Menor deslocamento equivalente no toro ("imagem mínima"), componente a componente."""
+    return delta - period * np.round(delta / period)
+
+def toroidal_pairs(positions, width, height, cell_size):
+    """
+    Busca em grade dos pares de objetos que podem estar se tocando em uma tela com
+    "wrap-around" (um toro de largura x altura).
+
+    Os objetos são distribuídos em células de lado >= 'cell_size' (que deve ser ao menos
+    o dobro do maior raio) e só são comparados com os das 9 células vizinhas, contando
+    as vizinhas do outro lado da tela. Tudo é feito com arrays: as células são ordenadas
+    uma vez e os intervalos de cada vizinha são achados por busca binária.
+
+    Retorna dois arrays de índices (i, j), com i < j e cada par uma única vez.
+    """
+    n = len(positions)
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # --- Células ---
+    nx = max(1, int(width // cell_size))
+    ny = max(1, int(height // cell_size))
+    cx = (np.mod(positions[:, 0], width) // (width / nx)).astype(np.int64) % nx
+    cy = (np.mod(positions[:, 1], height) // (height / ny)).astype(np.int64) % ny
+    keys = cx * ny + cy
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    # --- Células vizinhas ---
+    # Em grades muito pequenas, -1 e +1 podem dar na mesma célula: os deslocamentos são únicos.
+    shifts = [(dx, dy) for dx in sorted({d % nx for d in (-1, 0, 1)}) for dy in sorted({d % ny for d in (-1, 0, 1)})]
+    neighbor_keys = np.stack([((cx + dx) % nx) * ny + (cy + dy) % ny for dx, dy in shifts], axis=1).ravel()
+    starts = np.searchsorted(sorted_keys, neighbor_keys, side='left')
+    counts = np.searchsorted(sorted_keys, neighbor_keys, side='right') - starts
+
+    # --- Expansão dos intervalos em pares ---
+    total = int(counts.sum())
+    owners = np.repeat(np.repeat(np.arange(n), len(shifts)), counts)
+    run_starts = np.cumsum(counts) - counts
+    others = order[np.repeat(starts - run_starts, counts) + np.arange(total)]
+
+    # Cada par aparece uma vez a partir de cada lado; fica só a ocorrência com i < j.
+    keep = owners < others
+    return owners[keep], others[keep]
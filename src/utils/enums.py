@@ -14,13 +14,14 @@ class GameState(Enum):
     PAUSE = auto()
     TUTORIAL = auto()
     GAME_OVER = auto()
+    ATTRACT = auto()    # Modo demonstração: partida jogada pelo piloto automático
     
     # Ações/Transições
     QUIT = auto()       # Sinaliza para encerrar a aplicação
     RESUME = auto()     # Sinaliza para voltar ao jogo a partir da pausa
     RESTART = auto()    # Sinaliza para começar um novo jogo
 
-# Enum para futuros tipos de power-ups.
+# Tipos de power-ups (os efeitos são aplicados pelo PowerUpSystem).
 class PowerUpType(Enum):
     IMMORTALITY = auto()      # 1. Imortalidade por alguns segundos
     EXTRA_LIFE = auto()       # 2. Adiciona +1 vida
@@ -0,0 +1,105 @@
+import threading
+from contextlib import contextmanager
+import numpy as np
+import pygame
+
+class FrameExporter:
+    """
+    Disponibiliza o quadro renderizado para consumidores (bots baseados em pixels, gravadores).
+
+    Usa dois buffers: a tela de jogo publica cada quadro no buffer de trás e depois o promove
+    a buffer da frente. Os consumidores leem o buffer da frente como um array NumPy que aponta
+    direto para os pixels da superfície (sem cópia). Se um consumidor ainda estiver lendo o
+    buffer que seria sobrescrito, o quadro é descartado: a renderização nunca espera.
+    """
+    def __init__(self, surface):
+        # Buffers com o mesmo formato de pixel da tela, para que o blit seja uma cópia direta.
+        self.buffers = [pygame.Surface(surface.get_size(), 0, surface) for _ in range(2)]
+        self.frame_numbers = [0, 0]
+        self.readers = [0, 0]  # Consumidores lendo cada buffer no momento
+        self.front = None      # Índice do buffer com o quadro mais recente
+        self.lock = threading.Lock()
+
+        # Estatísticas
+        self.published = 0
+        self.dropped = 0
+
+        # Buffers pré-alocados da conversão para tons de cinza, por fator de redução.
+        self._gray_buffers = {}
+
+    def publish(self, surface):
+        """Copia o quadro atual para o buffer de trás. Retorna False se o quadro foi descartado."""
+        with self.lock:
+            back = 0 if self.front is None else 1 - self.front
+            # Também descarta se algum array de pixels antigo ainda mantiver a superfície travada.
+            if self.readers[back] or self.buffers[back].get_locked():
+                self.dropped += 1
+                return False
+
+        # O blit acontece fora do lock: nenhum consumidor lê o buffer de trás.
+        self.buffers[back].blit(surface, (0, 0))
+
+        with self.lock:
+            self.published += 1
+            self.frame_numbers[back] = self.published
+            self.front = back
+        return True
+
+    @contextmanager
+    def read(self):
+        """
+        Fornece (número do quadro, array de pixels) do quadro mais recente, ou None se ainda
+        não houver nenhum. O array tem formato (largura, altura, 3) e só é válido dentro do bloco 'with'.
+        """
+        with self.lock:
+            index = self.front
+            if index is not None:
+                self.readers[index] += 1
+
+        if index is None:
+            yield None
+            return
+
+        try:
+            pixels = pygame.surfarray.pixels3d(self.buffers[index])
+            try:
+                yield self.frame_numbers[index], pixels
+            finally:
+                del pixels  # Libera o lock da superfície
+        finally:
+            with self.lock:
+                self.readers[index] -= 1
+
+    def grayscale(self, factor=4, out=None):
+        """
+        Gera uma observação em tons de cinza, reduzida por 'factor' em cada eixo.
+        A redução usa uma visão com passo (sem cópia) e a conversão é feita em buffers
+        pré-alocados. Retorna (número do quadro, array (altura, largura) uint8) ou None.
+        """
+        with self.read() as frame:
+            if frame is None:
+                return None
+            frame_number, pixels = frame
+            sampled = pixels[::factor, ::factor]
+
+            accum, temp, gray = self._get_gray_buffers(factor, sampled.shape[:2])
+            if out is None:
+                out = gray
+
+            # Luminância aproximada com pesos inteiros (77, 150, 29) / 256.
+            np.multiply(sampled[..., 0], 77, out=accum, dtype=np.uint16)
+            np.multiply(sampled[..., 1], 150, out=temp, dtype=np.uint16)
+            accum += temp
+            np.multiply(sampled[..., 2], 29, out=temp, dtype=np.uint16)
+            accum += temp
+            accum >>= 8
+            np.copyto(out, accum.T, casting='unsafe')
+            return frame_number, out
+
+    def _get_gray_buffers(self, factor, shape):
+        """Retorna (acumulador, temporário, saída) para o fator de redução pedido."""
+        if factor not in self._gray_buffers:
+            self._gray_buffers[factor] = (np.empty(shape, dtype=np.uint16),
+                                          np.empty(shape, dtype=np.uint16),
+                                          np.empty(shape[::-1], dtype=np.uint8))
+        return self._gray_buffers[factor]
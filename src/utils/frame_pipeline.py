@@ -0,0 +1,111 @@
+import queue
+import threading
+import time
+from collections import deque
+from src import settings
+
+class FramePipeline:
+    """
+    Executa a produção dos quadros (simulação + captura do que desenhar) em uma thread
+    de trabalho, enquanto a thread principal desenha o quadro anterior.
+
+    A thread principal envia um trabalho por quadro com submit() e recebe os resultados,
+    na ordem, com collect(). No máximo 'depth' trabalhos ficam em andamento (fila
+    limitada): quando a simulação não acompanha, collect() espera em vez de acumular
+    atraso. Boa parte do desenho do Pygame (blits, flip) libera o GIL, e é nesse tempo
+    que a outra thread avança.
+
+    Mede a vazão (resultados por segundo), a latência de cada trabalho (do envio até ser
+    recolhido para o desenho) e quanto a thread principal ficou esperando.
+    """
+    def __init__(self, produce, depth=settings.PIPELINE_DEPTH):
+        self.produce = produce  # Função chamada na thread de trabalho: produce(trabalho) -> resultado
+        self.depth = depth
+        self.jobs = queue.Queue(maxsize=depth)
+        self.results = queue.Queue()
+        self.in_flight = 0
+        self.thread = None
+
+        # --- Medições ---
+        self.latencies = deque(maxlen=120)  # ms entre o envio e a coleta, nos últimos trabalhos
+        self.completed = 0
+        self.wait_ms = 0.0                  # Tempo total da thread principal esperando resultados
+        self.busy_ms = 0.0                  # Tempo total da thread de trabalho produzindo
+        self.started_at = None
+
+    # --- Ciclo de Vida ---
+    def start(self):
+        if self.thread is not None:
+            return
+        self.started_at = time.perf_counter()
+        self.thread = threading.Thread(target=self._work, name="FramePipeline", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Espera os trabalhos em andamento e encerra a thread. Retorna o último resultado (ou None)."""
+        if self.thread is None:
+            return None
+        last = None
+        while self.in_flight:
+            last = self.collect(block=True)
+        self.jobs.put(None)  # Sinal de parada
+        self.thread.join()
+        self.thread = None
+        return last
+
+    # --- Thread Principal ---
+    def submit(self, job):
+        """Envia um trabalho. Com a fila cheia, espera o trabalho mais antigo terminar."""
+        self.jobs.put((time.perf_counter(), job))
+        self.in_flight += 1
+
+    def collect(self, block=False):
+        """
+        Retorna o resultado mais recente já pronto (descartando os intermediários) ou None.
+        Espera por um resultado se 'block' for True ou se a fila de trabalhos estiver cheia.
+        """
+        latest = None
+        while self.in_flight:
+            must_wait = latest is None and (block or self.in_flight >= self.depth)
+            try:
+                if must_wait:
+                    wait_start = time.perf_counter()
+                    submitted, result, error = self.results.get()
+                    self.wait_ms += (time.perf_counter() - wait_start) * 1000
+                else:
+                    submitted, result, error = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.in_flight -= 1
+            if error is not None:
+                raise error
+            self.latencies.append((time.perf_counter() - submitted) * 1000)
+            self.completed += 1
+            latest = result
+        return latest
+
+    # --- Thread de Trabalho ---
+    def _work(self):
+        while True:
+            item = self.jobs.get()
+            if item is None:
+                return
+            submitted, job = item
+            start = time.perf_counter()
+            try:
+                result, error = self.produce(job), None
+            except Exception as exc:  # Repassada para a thread principal em collect()
+                result, error = None, exc
+            self.busy_ms += (time.perf_counter() - start) * 1000
+            self.results.put((submitted, result, error))
+
+    # --- Relatório ---
+    def describe(self):
+        """Linha da sobreposição de desempenho: vazão, latência p95, ocupação da thread de trabalho e espera média."""
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        rate = self.completed / elapsed if elapsed else 0.0
+        busy = self.busy_ms / (elapsed * 1000) if elapsed else 0.0
+        latencies = sorted(self.latencies)
+        p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+        waited = self.wait_ms / self.completed if self.completed else 0.0
+        return f"Pipeline: {rate:.0f} quadros/s  latência p95 {p95:.1f} ms  simulação {busy:.0%}  espera {waited:.2f} ms"
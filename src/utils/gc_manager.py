@@ -0,0 +1,104 @@
+import gc
+import time
+
+class GCManager:
+    """
+    Controla quando o coletor de lixo cíclico do Python roda, para que ele não
+    interrompa um quadro de jogo em um momento qualquer.
+
+    - Após carregar os assets, os objetos de longa duração são congelados (gc.freeze)
+      e deixam de ser percorridos a cada coleta.
+    - Durante a partida a coleta automática fica desligada; coletas rápidas da geração
+      mais jovem são feitas só quando sobra tempo no quadro.
+    - Coletas completas acontecem nas transições de tela (pausa, game over, menu).
+    - Opcionalmente, grava a duração de cada pausa do GC ao lado do tempo de cada quadro.
+    """
+    SPARE_MS = 4.0             # Folga mínima no quadro para uma coleta da geração 0
+    GEN1_EVERY = 10            # Uma coleta da geração 1 a cada N coletas da geração 0
+    FORCE_FACTOR = 20          # Coleta mesmo sem folga se a geração 0 passar de N x o limiar
+
+    def __init__(self, enabled=True, log_path=None):
+        self.enabled = enabled
+        self.in_gameplay = False
+        self.young_collections = 0
+        self.threshold = gc.get_threshold()[0]
+
+        # --- Medição das pausas ---
+        self.pause_start = None
+        self.frame_gc_ms = 0.0        # Tempo gasto pelo GC no quadro atual
+        self.frame_generations = []   # Gerações coletadas no quadro atual
+        self.max_pause_ms = 0.0
+        self.total_pause_ms = 0.0
+        self.frame_count = 0
+        self.log_file = None
+        if log_path:
+            self.log_file = open(log_path, 'w')
+            self.log_file.write("frame,dt_ms,work_ms,gc_ms,generations,in_gameplay\n")
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        """Callback do módulo gc: mede a duração de cada coleta (automática ou manual)."""
+        if phase == "start":
+            self.pause_start = time.perf_counter()
+        elif self.pause_start is not None:
+            duration = (time.perf_counter() - self.pause_start) * 1000
+            self.pause_start = None
+            self.frame_gc_ms += duration
+            self.frame_generations.append(info["generation"])
+            self.total_pause_ms += duration
+            self.max_pause_ms = max(self.max_pause_ms, duration)
+
+    def freeze_long_lived(self):
+        """Coleta tudo e congela os objetos atuais (assets, módulos) para fora das próximas coletas."""
+        if not self.enabled:
+            return
+        gc.collect()
+        gc.freeze()
+
+    def enter_gameplay(self):
+        """Desliga a coleta automática enquanto a partida estiver rodando."""
+        if not self.enabled:
+            return
+        self.in_gameplay = True
+        self.frame_gc_ms = 0.0  # Descarta pausas medidas fora da partida
+        self.frame_generations = []
+        gc.disable()
+
+    def exit_gameplay(self):
+        """Ao sair da partida (transição de tela), faz uma coleta completa e religa a coleta automática."""
+        if not self.enabled or not self.in_gameplay:
+            return
+        self.in_gameplay = False
+        gc.collect()
+        gc.enable()
+
+    def end_frame(self, dt, work_ms, frame_budget_ms):
+        """
+        Chamado no fim de cada quadro de jogo, com o delta time e o tempo gasto no quadro.
+        Usa a folga até o próximo quadro para coletar as gerações jovens.
+        """
+        if self.enabled and self.in_gameplay:
+            young = gc.get_count()[0]
+            spare = frame_budget_ms - work_ms
+            if young > self.threshold and (spare >= self.SPARE_MS or young > self.threshold * self.FORCE_FACTOR):
+                self.young_collections += 1
+                gc.collect(1 if self.young_collections % self.GEN1_EVERY == 0 else 0)
+
+        self.frame_count += 1
+        if self.log_file:
+            generations = " ".join(map(str, self.frame_generations))
+            self.log_file.write(f"{self.frame_count},{dt:.2f},{work_ms:.2f},{self.frame_gc_ms:.3f},{generations},{int(self.in_gameplay)}\n")
+        self.frame_gc_ms = 0.0
+        self.frame_generations = []
+
+    def close(self):
+        """Religa a coleta automática, remove o callback e fecha o log."""
+        if self.enabled:
+            self.in_gameplay = False
+            gc.enable()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+            print(f"GC: {self.total_pause_ms:.1f} ms em pausas, a maior com {self.max_pause_ms:.2f} ms ({self.frame_count} quadros de jogo)")
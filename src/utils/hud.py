@@ -19,7 +19,7 @@ class HUD:
         # Variável para animar o alerta de UFO.
         self.pulse_angle = 0
 
-    def draw(self, screen, score, lives, ufo_warning):
+    def draw(self, screen, score, lives, ufo_warning, effects=()):
         """
         Desenha todos os elementos do HUD na tela.
         
@@ -28,6 +28,7 @@ class HUD:
             score (int): A pontuação atual do jogador.
             lives (int): O número de vidas restantes.
             ufo_warning (bool): True se um alerta de UFO deve ser exibido.
+            effects (list): Pares (nome, segundos restantes) dos power-ups temporários ativos.
         """
         
         # --- Desenha a Pontuação ---
@@ -41,6 +42,11 @@ class HUD:
             y_pos = 45 
             screen.blit(self.heart_image, (x_pos, y_pos))
         
+        # --- Desenha os Power-ups Ativos ---
+        # Abaixo das vidas, cada um com o tempo restante.
+        for i, (label, seconds) in enumerate(effects):
+            self.text_renderer.draw(screen, f"{label} {seconds:.0f}s", 18, (255, 215, 0), 20, 85 + i * 24, align="topleft")
+        
         # --- Desenha o Alerta de UFO (se necessário) ---
         if ufo_warning:
             # Animação de pulso para o texto de alerta.
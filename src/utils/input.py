@@ -0,0 +1,72 @@
+import pygame
+from collections import namedtuple
+
+# Bits usados para codificar os botões de um quadro de entrada de forma compacta.
+LEFT = 1
+RIGHT = 2
+THRUST = 4
+SHOOT = 8
+
+class InputFrame(namedtuple("InputFrame", ["dt", "left", "right", "thrust", "shoot"])):
+    """
+    Entrada do jogador em um único tick da simulação, junto com o delta time usado.
+    É imutável, o que permite gravá-la e reproduzi-la sem efeitos colaterais.
+    """
+    __slots__ = ()
+
+    def __new__(cls, dt=0, left=False, right=False, thrust=False, shoot=False):
+        return super().__new__(cls, dt, left, right, thrust, shoot)
+
+    def to_bits(self):
+        """Codifica os botões pressionados em um único inteiro."""
+        return (LEFT if self.left else 0) | (RIGHT if self.right else 0) | (THRUST if self.thrust else 0) | (SHOOT if self.shoot else 0)
+
+    @classmethod
+    def from_bits(cls, dt, bits):
+        """Reconstrói um quadro a partir do delta time e dos bits de botões."""
+        return cls(dt, bool(bits & LEFT), bool(bits & RIGHT), bool(bits & THRUST), bool(bits & SHOOT))
+
+class InputSource:
+    """
+    Interface base para as fontes de entrada da nave.
+    A tela de jogo pede um quadro por tick via poll(); fontes que não têm
+    mais dados (ex: um replay que terminou) retornam None.
+    """
+    def queue_shot(self):
+        """Registra um pedido de tiro vindo de um evento (ignorado por padrão)."""
+
+    def sample(self):
+        """
+        Lê os dispositivos na thread principal, uma vez por quadro, antes da simulação
+        (que pode rodar em outra thread; ignorado por padrão).
+        """
+
+    def poll(self, dt):
+        """Retorna o InputFrame do tick atual."""
+        raise NotImplementedError
+
+class KeyboardInput(InputSource):
+    """Lê o teclado: setas para mover e tiros enfileirados pelos eventos KEYDOWN."""
+    def __init__(self):
+        self.shot_requested = False
+        self.keys = None  # Estado do teclado lido no último sample()
+
+    def queue_shot(self):
+        self.shot_requested = True
+
+    def sample(self):
+        self.keys = pygame.key.get_pressed()
+
+    def poll(self, dt):
+        keys = self.keys if self.keys is not None else pygame.key.get_pressed()
+        frame = InputFrame(dt, keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_UP], self.shot_requested)
+        self.shot_requested = False
+        return frame
+
+class ReplayInput(InputSource):
+    """Reproduz os quadros de um replay gravado, ignorando o delta time real."""
+    def __init__(self, frames):
+        self.frames = iter(frames)
+
+    def poll(self, dt):
+        return next(self.frames, None)
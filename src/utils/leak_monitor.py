@@ -0,0 +1,148 @@
+import csv
+import tracemalloc
+import pygame
+from src.utils import sprite_cache
+from src.utils.sprite_cache import rotation_cache
+
+# Alocações ignoradas na medição de memória: as do próprio monitor (que guarda todas as
+# amostras) e as do cache de rotação, que é limitado e acompanhado à parte ('cached_surfaces').
+_IGNORED_ALLOCATIONS = [
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, sprite_cache.__file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+class LeakMonitor:
+    """
+    Monitor para testes de longa duração ("soak"): amostra periodicamente o tamanho dos
+    grupos de sprites, a contagem de entidades por tipo, a memória alocada (tracemalloc)
+    e a quantidade de superfícies em uso, e aponta as séries que só crescem.
+
+    Um kill() esquecido não gera erro: a entidade apenas continua nos grupos para sempre.
+    Como o número de entidades sobe e desce durante o jogo, o que indica vazamento é o
+    "piso" da série subir de forma contínua, e é isso que detect_growth() verifica.
+    """
+    def __init__(self, interval, top_allocations=10, warmup=0.1):
+        self.interval = interval  # Intervalo entre amostras (na unidade de tempo usada pelo chamador)
+        # Fração inicial das amostras ignorada na detecção: caches (como o de rotação)
+        # crescem legitimamente até se estabilizarem.
+        self.warmup = warmup
+        self.top_allocations = top_allocations
+        self.samples = []
+        self.next_sample_time = 0
+
+        # O tracemalloc deixa tudo mais lento; só é ligado quando o monitor é usado.
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.first_snapshot = None
+        self.last_snapshot = None
+
+    def maybe_sample(self, state, now):
+        """Registra uma amostra se o intervalo já tiver passado. Retorna True se amostrou."""
+        if now < self.next_sample_time:
+            return False
+        self.next_sample_time = now + self.interval
+        self.sample(state, now)
+        return True
+
+    def sample(self, state, now):
+        """Registra uma amostra do estado da sessão no instante 'now'."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_ALLOCATIONS)
+        if self.first_snapshot is None:
+            self.first_snapshot = snapshot
+        self.last_snapshot = snapshot
+        row = {"time": now, "memory_kb": sum(stat.size for stat in snapshot.statistics('filename')) / 1024}
+
+        # Tamanho de cada grupo de sprites da sessão.
+        groups = {name: group for name, group in vars(state).items() if isinstance(group, pygame.sprite.AbstractGroup)}
+        for name, group in groups.items():
+            row[f"group:{name}"] = len(group)
+
+        # Entidades por tipo (em qualquer grupo) e "órfãs": presentes em algum grupo,
+        # mas fora de 'all_sprites', então nunca são atualizadas nem removidas.
+        all_sprites = state.all_sprites
+        entities = set()
+        for group in groups.values():
+            entities.update(group.sprites())
+        for sprite in entities:
+            key = f"type:{type(sprite).__name__}"
+            row[key] = row.get(key, 0) + 1
+            if sprite not in all_sprites:
+                key = f"orphan:{type(sprite).__name__}"
+                row[key] = row.get(key, 0) + 1
+
+        # Superfícies em uso: imagens distintas dos sprites e as guardadas no cache de rotação.
+        row["surfaces"] = len({id(sprite.image) for sprite in entities})
+        row["cached_surfaces"] = len(rotation_cache.entries)
+
+        self.samples.append(row)
+
+    def series(self):
+        """Retorna {nome da métrica: lista de valores}, com 0 onde a métrica não aparecia."""
+        names = []
+        for row in self.samples:
+            names.extend(name for name in row if name not in names)
+        return {name: [row.get(name, 0) for row in self.samples] for name in names if name != "time"}
+
+    @staticmethod
+    def is_growing(values, windows=4, min_growth=1):
+        """
+        Indica crescimento contínuo: a série é dividida em 'windows' janelas e o mínimo de
+        cada janela precisa ser maior que o da anterior, somando pelo menos 'min_growth'.
+        """
+        if len(values) < windows * 2:
+            return False
+        size = len(values) // windows
+        floors = [min(values[i * size:(i + 1) * size]) for i in range(windows)]
+        rising = all(later > earlier for earlier, later in zip(floors, floors[1:]))
+        return rising and floors[-1] - floors[0] >= min_growth
+
+    def detect_growth(self):
+        """Retorna [(métrica, primeiro valor, último valor)] das séries que crescem continuamente."""
+        suspects = []
+        for name, values in self.series().items():
+            if name == "cached_surfaces":
+                continue  # Limitado por construção (imagens x ângulos); não é vazamento.
+            values = values[int(len(values) * self.warmup):]
+            # Memória oscila naturalmente; exige um crescimento mínimo de 256 KiB.
+            min_growth = 256 if name == "memory_kb" else 1
+            if self.is_growing(values, min_growth=min_growth):
+                suspects.append((name, values[0], values[-1]))
+        return suspects
+
+    def write_csv(self, path):
+        """Grava a série temporal completa em CSV (uma linha por amostra)."""
+        series = self.series()
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["time", *series])
+            for i, row in enumerate(self.samples):
+                writer.writerow([row["time"], *(values[i] for values in series.values())])
+
+    def report(self):
+        """Gera o relatório de vazamentos em texto."""
+        lines = [f"Amostras: {len(self.samples)}"]
+        if self.samples:
+            lines.append(f"Período: {self.samples[0]['time']:.0f} a {self.samples[-1]['time']:.0f}")
+
+        suspects = self.detect_growth()
+        if suspects:
+            lines.append("Crescimento contínuo detectado:")
+            for name, first, last in suspects:
+                lines.append(f"  {name}: {first:.0f} -> {last:.0f}")
+        else:
+            lines.append("Nenhum crescimento contínuo detectado.")
+        if self.samples:
+            lines.append(f"Cache de rotação: {self.samples[-1]['cached_surfaces']} superfícies")
+
+        # Locais do código que mais acumularam memória desde a primeira amostra.
+        if self.first_snapshot is not None and self.last_snapshot is not self.first_snapshot:
+            lines.append(f"Maiores aumentos de alocação (top {self.top_allocations}):")
+            for stat in self.last_snapshot.compare_to(self.first_snapshot, 'lineno')[:self.top_allocations]:
+                lines.append(f"  {stat.size_diff / 1024:+.1f} KiB  {stat.traceback}")
+        return "\n".join(lines)
+
+    def write_report(self, path):
+        """Grava o relatório de vazamentos em um arquivo de texto."""
+        with open(path, 'w') as f:
+            f.write(self.report() + "\n")
@@ -0,0 +1,39 @@
+from collections import deque
+
+class PerfOverlay:
+    """
+    Sobreposição de desempenho da tela de jogo (alternada com F3): FPS, tempo de
+    trabalho do quadro e quantidade de entidades por grupo.
+    """
+    def __init__(self, assets, visible=False):
+        self.text_renderer = assets['text_renderer']
+        self.visible = visible
+        self.work_times = deque(maxlen=120)  # Últimos ~2 segundos de quadros
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def record(self, work_ms):
+        """Registra o tempo gasto (atualização + desenho) no último quadro."""
+        self.work_times.append(work_ms)
+
+    def draw(self, screen, fps, state, extra_lines=()):
+        """Desenha as estatísticas no canto superior direito da tela."""
+        if not self.visible:
+            return
+
+        work = sorted(self.work_times)
+        average = sum(work) / len(work) if work else 0.0
+        p95 = work[int(len(work) * 0.95)] if work else 0.0
+        lines = [
+            f"FPS: {fps:.1f}",
+            f"Quadro: {average:.1f} ms (p95 {p95:.1f} ms)",
+            f"Entidades: {len(state.all_sprites)}",
+            f"Ast {len(state.asteroids)}  Balas {len(state.bullets)}  Inim {len(state.enemy_bullets)}",
+            f"UFOs {len(state.ufos)}  Partículas {len(state.particles)}",
+            *extra_lines,
+        ]
+
+        x = screen.get_width() - 20
+        for i, line in enumerate(lines):
+            self.text_renderer.draw(screen, line, 16, (120, 255, 120), x, 15 + i * 22, align="topright")
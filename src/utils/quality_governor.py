@@ -0,0 +1,90 @@
+from collections import deque
+from src import settings
+
+class QualityGovernor:
+    """
+    Ajusta a qualidade visual ao orçamento de tempo de cada quadro.
+
+    Observa um percentil (QUALITY_PERCENTILE) do tempo de trabalho dos últimos quadros e
+    muda de nível, um passo por vez, entre os presets de QUALITY_LEVELS (do mais bonito ao
+    mais leve): quantidade de partículas, partículas do propulsor, camadas de estrelas,
+    quadros das explosões e sombra dos textos.
+
+    Para não oscilar entre dois níveis (histerese):
+    - Desce quando o percentil passa de QUALITY_DOWNGRADE x o orçamento do quadro.
+    - Sobe só quando fica abaixo de QUALITY_UPGRADE x o orçamento por QUALITY_UPGRADE_WINDOWS
+      janelas seguidas.
+    - Depois de cada mudança a janela é descartada: o novo nível é medido do zero antes
+      de qualquer outra decisão.
+
+    Só afeta efeitos cosméticos; a simulação (e os replays) não mudam com o nível.
+    """
+    def __init__(self, text_renderer=None, adaptive=settings.QUALITY_GOVERNOR):
+        self.text_renderer = text_renderer  # Recebe o ajuste da sombra dos textos, se houver
+        self.adaptive = adaptive
+        self.level = 0
+        self.frame_times = deque(maxlen=settings.QUALITY_WINDOW)
+        self.percentile_ms = 0.0  # Último percentil medido (para a sobreposição de desempenho)
+        self.good_windows = 0
+        self._explosion_frames = {}
+        self._apply()
+
+    @property
+    def preset(self):
+        return settings.QUALITY_LEVELS[self.level]
+
+    def record(self, work_ms, frame_budget_ms):
+        """Registra o tempo de trabalho de um quadro e, a cada janela completa, reavalia o nível."""
+        if not self.adaptive:
+            return
+        self.frame_times.append(work_ms)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        ordered = sorted(self.frame_times)
+        self.percentile_ms = ordered[min(len(ordered) - 1, int(len(ordered) * settings.QUALITY_PERCENTILE))]
+        self.frame_times.clear()
+
+        if self.percentile_ms > frame_budget_ms * settings.QUALITY_DOWNGRADE:
+            self.good_windows = 0
+            self.set_level(self.level + 1)
+        elif self.percentile_ms < frame_budget_ms * settings.QUALITY_UPGRADE:
+            self.good_windows += 1
+            if self.good_windows >= settings.QUALITY_UPGRADE_WINDOWS:
+                self.good_windows = 0
+                self.set_level(self.level - 1)
+        else:
+            self.good_windows = 0
+
+    def set_level(self, level):
+        """Muda para o nível informado (limitado aos presets existentes)."""
+        level = max(0, min(len(settings.QUALITY_LEVELS) - 1, level))
+        if level != self.level:
+            self.level = level
+            self.frame_times.clear()
+            self._apply()
+
+    def _apply(self):
+        if self.text_renderer:
+            self.text_renderer.shadows = self.preset["text_shadow"]
+
+    # --- Consultas dos efeitos ---
+    def particles(self, count):
+        """Quantidade de partículas a criar no lugar de 'count' (arredondada, 0 no nível mínimo)."""
+        return int(count * self.preset["particles"] + 0.5)
+
+    def explosion_frames(self, frames):
+        """Quadros da animação de explosão no nível atual (vazio = sem explosão)."""
+        step = self.preset["explosion_step"]
+        if not step:
+            return []
+        key = (id(frames), step)
+        if key not in self._explosion_frames:
+            self._explosion_frames[key] = frames[::step]
+        return self._explosion_frames[key]
+
+    def describe(self):
+        """Linha da sobreposição de desempenho."""
+        mode = "" if self.adaptive else " (fixa)"
+        percentile = int(settings.QUALITY_PERCENTILE * 100)
+        return f"Qualidade: {self.preset['label']}{mode}  p{percentile} {self.percentile_ms:.1f} ms"
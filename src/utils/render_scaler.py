@@ -0,0 +1,88 @@
+from collections import deque
+import pygame
+from src import settings
+
+class RenderScaler:
+    """
+    Desenha o mundo do jogo em uma resolução interna menor que a da janela e o amplia
+    de uma vez no fim do quadro. Com escala 0.5, por exemplo, o fundo, os sprites e os
+    fantasmas das bordas preenchem 640x360 pixels em vez de 1280x720 (um quarto do
+    trabalho de preenchimento), e a ampliação é um único 'transform.scale' (vizinho mais
+    próximo: em 0.5 cada pixel vira exatamente um bloco 2x2).
+
+    A interface (HUD, textos, sobreposições) é desenhada depois, direto na janela, e
+    continua nítida. As coordenadas do jogo não mudam: só o desenho é convertido.
+
+    - world(): a superfície onde o mundo deve ser desenhado neste quadro (a própria
+      janela na escala 1).
+    - blit(): desenha uma imagem em coordenadas do jogo. As versões reduzidas das imagens
+      ficam em cache (a maioria vem do cache de rotações e se repete); o cache é esvaziado
+      quando passa de RENDER_SCALE_CACHE_SIZE, pois imagens efêmeras (partículas do
+      propulsor) também passam por ele.
+    - present(): amplia a superfície interna para a janela.
+    """
+    def __init__(self, screen, scale=settings.RENDER_SCALE):
+        self.screen = screen
+        self.scale = None
+        self.surface = None
+        self.cache = {}  # id(imagem) -> (imagem, versão reduzida)
+        self.draw_times = deque(maxlen=120)  # Tempo de desenho do mundo nos últimos quadros (ms)
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        """Muda a escala da resolução interna (1 = resolução da janela; limitada a RENDER_SCALE_MIN-1)."""
+        scale = min(1.0, max(settings.RENDER_SCALE_MIN, scale))
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self.cache.clear()
+        self.draw_times.clear()
+        if scale == 1:
+            self.surface = None
+        else:
+            width, height = self.screen.get_size()
+            self.surface = pygame.Surface((max(1, round(width * scale)), max(1, round(height * scale))), 0, self.screen)
+
+    @property
+    def size(self):
+        return (self.surface or self.screen).get_size()
+
+    def world(self):
+        return self.surface or self.screen
+
+    def blit(self, image, x, y):
+        """Desenha 'image' com o canto superior esquerdo em (x, y), coordenadas do jogo."""
+        if self.surface is None:
+            self.screen.blit(image, (x, y))
+            return
+        scale = self.scale
+        self.surface.blit(self._scaled(image), (round(x * scale), round(y * scale)))
+
+    def _scaled(self, image):
+        entry = self.cache.get(id(image))
+        # A imagem guardada junto garante que o id() não foi reutilizado por outra superfície.
+        if entry is None or entry[0] is not image:
+            if len(self.cache) >= settings.RENDER_SCALE_CACHE_SIZE:
+                self.cache.clear()
+            width, height = image.get_size()
+            scaled = pygame.transform.scale(image, (max(1, round(width * self.scale)), max(1, round(height * self.scale))))
+            # A transparência da superfície inteira (ex: partículas que somem) não muda depois
+            # de a imagem ser desenhada (ver RenderSnapshot): basta copiá-la uma vez.
+            scaled.set_alpha(image.get_alpha())
+            entry = self.cache[id(image)] = (image, scaled)
+        return entry[1]
+
+    def present(self):
+        """Amplia o mundo desenhado na resolução interna para a janela."""
+        if self.surface is not None:
+            pygame.transform.scale(self.surface, self.screen.get_size(), self.screen)
+
+    def record(self, draw_ms):
+        self.draw_times.append(draw_ms)
+
+    def describe(self):
+        """Resolução interna e o p95 do tempo de desenho do mundo (sobreposição e benchmark)."""
+        width, height = self.size
+        times = sorted(self.draw_times)
+        p95 = times[int(len(times) * 0.95)] if times else 0.0
+        return f"Resolução interna: {width}x{height} ({self.scale:.0%})  desenho p95 {p95:.1f} ms"
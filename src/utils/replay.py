@@ -0,0 +1,241 @@
+import bisect
+import json
+import os
+import struct
+import zlib
+from src import settings
+from src.utils.input import InputFrame
+
+# --- Formato do Arquivo de Replay ---
+# [MAGIC][versão: u8][tamanho do cabeçalho: u32][cabeçalho JSON]
+# Em seguida, uma sequência de blocos [tipo: u8][tamanho: u32][conteúdo]:
+#   KEYFRAME: [tick: u32][snapshot JSON comprimido com zlib]
+#   INPUTS:   quadros de entrada desde o keyframe anterior, como "runs" de quadros idênticos:
+#             [repetições: varint][botões: u8][variação do dt em relação ao run anterior: varint zigzag]
+#   INDEX:    [quantidade: u32] + (tick: u32, offset: u64) para cada keyframe
+# O arquivo termina com [offset do índice: u64][INDEX_MAGIC].
+# Os blocos são gravados à medida que a partida acontece, então um arquivo ainda sem
+# índice (partida em andamento ou interrompida) pode ser lido varrendo os blocos.
+MAGIC = b"ASTR"
+INDEX_MAGIC = b"ASTX"
+VERSION = 6  # 6: power-ups; 5: relógio da sessão nos keyframes; 4: spawns posicionados pelo SpawnPlacer (outros sorteios); 3: a tela virou um toro (ver WrapSystem)
+
+CHUNK_KEYFRAME = ord('K')
+CHUNK_INPUTS = ord('I')
+CHUNK_INDEX = ord('X')
+
+_CHUNK_HEADER = struct.Struct('<BI')
+_FOOTER = struct.Struct('<Q4s')
+_INDEX_ENTRY = struct.Struct('<IQ')
+
+def _write_varint(buffer, value):
+    """Codifica um inteiro não negativo em 7 bits por byte (LEB128)."""
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            buffer.append(byte | 0x80)
+        else:
+            buffer.append(byte)
+            return
+
+def _read_varint(data, offset):
+    """Decodifica um varint a partir de 'offset'. Retorna (valor, novo offset)."""
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+def _zigzag(value):
+    """Mapeia inteiros com sinal para não negativos (0, -1, 1, -2... -> 0, 1, 2, 3...)."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+def _decode_inputs(payload):
+    """Expande os runs de um bloco de entradas em quadros individuais."""
+    frames = []
+    offset = dt = 0
+    while offset < len(payload):
+        count, offset = _read_varint(payload, offset)
+        bits = payload[offset]
+        delta, offset = _read_varint(payload, offset + 1)
+        dt += _unzigzag(delta)
+        frames.extend([InputFrame.from_bits(dt, bits)] * count)
+    return frames
+
+class ReplayWriter:
+    """
+    Grava uma partida: a semente, a dificuldade (e os parâmetros alterados), os quadros de entrada codificados por
+    deltas e, a cada RNG_EPOCH_TICKS, um snapshot completo da simulação (keyframe).
+    Deve receber cada quadro via record() imediatamente antes de simulation.step().
+    """
+    def __init__(self, path, simulation, difficulty_key, overrides=None):
+        self.simulation = simulation
+        self.file = open(path, 'wb')
+        header = json.dumps({
+            "seed": simulation.state.seed,
+            "difficulty": difficulty_key,
+            "overrides": overrides or {},
+            "keyframe_interval": settings.RNG_EPOCH_TICKS,
+        }).encode('utf-8')
+        self.file.write(MAGIC + struct.pack('<BI', VERSION, len(header)) + header)
+
+        self.keyframes = []  # Pares (tick, offset) para o índice
+        self.inputs = bytearray()  # Runs do segmento atual, ainda não gravados
+        self.run_key = None
+        self.run_length = 0
+        self.last_dt = 0
+
+    def record(self, frame):
+        """Adiciona um quadro, gravando antes um keyframe se um novo segmento começar."""
+        tick = self.simulation.tick
+        if tick % settings.RNG_EPOCH_TICKS == 0:
+            self._write_keyframe(tick)
+
+        key = (frame.to_bits(), frame.dt)
+        if key == self.run_key:
+            self.run_length += 1
+            return
+        self._end_run()
+        self.run_key = key
+        self.run_length = 1
+
+    def _end_run(self):
+        """Codifica o run pendente no buffer do segmento."""
+        if not self.run_length:
+            return
+        bits, dt = self.run_key
+        _write_varint(self.inputs, self.run_length)
+        self.inputs.append(bits)
+        _write_varint(self.inputs, _zigzag(dt - self.last_dt))
+        self.last_dt = dt
+        self.run_length = 0
+
+    def _flush_inputs(self):
+        """Grava o bloco de entradas do segmento atual e reinicia a codificação por deltas."""
+        self._end_run()
+        if self.inputs:
+            self._write_chunk(CHUNK_INPUTS, bytes(self.inputs))
+        self.inputs.clear()
+        self.run_key = None
+        self.last_dt = 0
+
+    def _write_keyframe(self, tick):
+        self._flush_inputs()
+        snapshot = json.dumps(self.simulation.snapshot(), separators=(',', ':')).encode('utf-8')
+        self.keyframes.append((tick, self.file.tell()))
+        self._write_chunk(CHUNK_KEYFRAME, struct.pack('<I', tick) + zlib.compress(snapshot))
+        self.file.flush()  # Torna o segmento anterior legível enquanto a partida continua
+
+    def _write_chunk(self, chunk_type, payload):
+        self.file.write(_CHUNK_HEADER.pack(chunk_type, len(payload)) + payload)
+
+    def close(self):
+        """Grava o último segmento e o índice de keyframes, e fecha o arquivo."""
+        if self.file.closed:
+            return
+        self._flush_inputs()
+        index_offset = self.file.tell()
+        entries = b''.join(_INDEX_ENTRY.pack(tick, offset) for tick, offset in self.keyframes)
+        self._write_chunk(CHUNK_INDEX, struct.pack('<I', len(self.keyframes)) + entries)
+        self.file.write(_FOOTER.pack(index_offset, INDEX_MAGIC))
+        self.file.close()
+
+class ReplayReader:
+    """
+    Lê um arquivo de replay. Os quadros podem ser percorridos em sequência via frames(),
+    e seek() posiciona uma simulação em qualquer tick a partir do keyframe mais próximo.
+    """
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        if self.file.read(4) != MAGIC:
+            raise ValueError(f"Arquivo de replay inválido: {path}")
+        version, header_size = struct.unpack('<BI', self.file.read(5))
+        if version != VERSION:
+            raise ValueError(f"Versão de replay não suportada: {version}")
+        header = json.loads(self.file.read(header_size).decode('utf-8'))
+        self.seed = header["seed"]
+        self.difficulty_key = header["difficulty"]
+        self.overrides = header.get("overrides", {})  # Ausente em replays antigos
+        self.keyframe_interval = header["keyframe_interval"]
+        self.data_offset = self.file.tell()
+
+        if self.keyframe_interval != settings.RNG_EPOCH_TICKS:
+            raise ValueError("Replay gravado com um intervalo de keyframes incompatível")
+
+        self.keyframes = self._load_index()
+        self.keyframe_ticks = [tick for tick, _ in self.keyframes]
+
+    def _load_index(self):
+        """Lê o índice do final do arquivo; sem ele, reconstrói varrendo os blocos."""
+        self.file.seek(0, os.SEEK_END)
+        size = self.file.tell()
+        if size - self.data_offset >= _FOOTER.size:
+            self.file.seek(size - _FOOTER.size)
+            index_offset, magic = _FOOTER.unpack(self.file.read(_FOOTER.size))
+            if magic == INDEX_MAGIC:
+                chunk_type, payload = self._read_chunk_at(index_offset)
+                count = struct.unpack_from('<I', payload)[0]
+                return [_INDEX_ENTRY.unpack_from(payload, 4 + i * _INDEX_ENTRY.size) for i in range(count)]
+
+        return [(struct.unpack_from('<I', payload)[0], offset)
+                for offset, chunk_type, payload in self._iter_chunks(self.data_offset)
+                if chunk_type == CHUNK_KEYFRAME]
+
+    def _read_chunk_at(self, offset):
+        """Lê um bloco completo. Retorna (tipo, conteúdo) ou (None, None) se estiver incompleto."""
+        self.file.seek(offset)
+        header = self.file.read(_CHUNK_HEADER.size)
+        if len(header) < _CHUNK_HEADER.size:
+            return None, None
+        chunk_type, length = _CHUNK_HEADER.unpack(header)
+        payload = self.file.read(length)
+        if len(payload) < length:
+            return None, None  # Bloco ainda sendo gravado
+        return chunk_type, payload
+
+    def _iter_chunks(self, offset):
+        """Percorre os blocos a partir de 'offset', parando no índice ou no fim dos dados."""
+        while True:
+            chunk_type, payload = self._read_chunk_at(offset)
+            if chunk_type is None or chunk_type == CHUNK_INDEX:
+                return
+            yield offset, chunk_type, payload
+            offset += _CHUNK_HEADER.size + len(payload)
+
+    def frames(self, offset=None):
+        """Gera todos os quadros de entrada a partir de um offset (padrão: início dos dados)."""
+        for _, chunk_type, payload in self._iter_chunks(self.data_offset if offset is None else offset):
+            if chunk_type == CHUNK_INPUTS:
+                yield from _decode_inputs(payload)
+
+    def seek(self, simulation, tick):
+        """
+        Posiciona a simulação no tick pedido: restaura o keyframe anterior mais próximo
+        e simula apenas os quadros restantes do segmento.
+        Retorna um iterador com os quadros a partir desse tick.
+        """
+        i = bisect.bisect_right(self.keyframe_ticks, tick) - 1
+        if i < 0:
+            raise ValueError("O replay não possui keyframes")
+        keyframe_tick, offset = self.keyframes[i]
+
+        _, payload = self._read_chunk_at(offset)
+        simulation.restore(json.loads(zlib.decompress(payload[4:]).decode('utf-8')))
+
+        frames = self.frames(offset)
+        for _ in range(tick - keyframe_tick):
+            frame = next(frames, None)
+            if frame is None:
+                break
+            simulation.step(frame)
+        return frames
+
+    def close(self):
+        self.file.close()
@@ -0,0 +1,102 @@
+import heapq
+import math
+
+class SessionClock:
+    """
+    O relógio de uma sessão de jogo: o tempo de jogo (em ms) que os sistemas consultam,
+    em vez do relógio global do Pygame, que continua correndo em pausas e menus.
+
+    Tem dois papéis:
+    - Tempo de jogo: 'now' avança exatamente o dt de cada tick da simulação (advance), e
+      eventos agendados (timers) disparam no tick em que vencem, nem antes nem depois, em
+      ordem de vencimento. Os timers têm nome e os tratadores são registrados uma vez com
+      on(); assim o estado do relógio é serializável (ver snapshot).
+    - Ritmo: frame_steps() converte o tempo real de um quadro nos passos de simulação a
+      executar, aplicando a pausa e a escala de tempo (câmera lenta ou avanço rápido).
+      A escala só muda quantos (e quão longos) ticks rodam por quadro; nunca aumenta o dt
+      de um tick além do dt real, de modo que a simulação se comporta igual em qualquer
+      velocidade.
+    """
+    def __init__(self):
+        self.now = 0             # Tempo de jogo decorrido na sessão (ms)
+        self.scale = 1.0         # Velocidade do jogo em relação ao tempo real
+        self.paused = False
+        self.fixed_step = False  # Replays: cada passo é um tick gravado (com o dt da gravação)
+        self._timers = []        # Heap de (vencimento, sequência, nome)
+        self._sequence = 0       # Desempata timers com o mesmo vencimento (ordem de agendamento)
+        self._handlers = {}
+        self._carry = 0.0        # Fração de ms (ou de tick) acumulada entre quadros
+
+    # --- Timers ---
+    def on(self, name, handler):
+        """Registra a função chamada quando um timer 'name' vence. Recebe o instante do vencimento."""
+        self._handlers[name] = handler
+
+    def schedule(self, name, delay):
+        """Agenda o timer 'name' para daqui a 'delay' ms de jogo."""
+        self.schedule_at(name, self.now + delay)
+
+    def schedule_at(self, name, due):
+        """
+        Agenda o timer 'name' para o instante 'due'. Timers periódicos devem se reagendar a
+        partir do vencimento anterior (e não de 'now'), para não acumular atraso.
+        """
+        heapq.heappush(self._timers, (due, self._sequence, name))
+        self._sequence += 1
+
+    def cancel(self, name):
+        """Remove os timers pendentes com o nome informado."""
+        self._timers = [timer for timer in self._timers if timer[2] != name]
+        heapq.heapify(self._timers)
+
+    def advance(self, dt):
+        """Avança o tempo de jogo em 'dt' ms e dispara, em ordem, os timers vencidos."""
+        self.now += dt
+        while self._timers and self._timers[0][0] <= self.now:
+            due, _, name = heapq.heappop(self._timers)
+            self._handlers[name](due)
+
+    # --- Ritmo ---
+    def set_scale(self, scale):
+        """Muda a velocidade do jogo (ex: 0.5 = câmera lenta, 4 = avanço rápido)."""
+        self.scale = scale
+        self._carry = 0.0
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+
+    def frame_steps(self, real_dt):
+        """
+        Lista dos dts (ms inteiros, como os gravados nos replays) dos ticks a simular em um
+        quadro que durou 'real_dt' ms. Pode ser vazia (pausa ou câmera lenta).
+        """
+        if self.paused or real_dt <= 0:
+            return []
+        if self.fixed_step:
+            # O dt vem da gravação; a escala decide quantos ticks gravados cabem no quadro.
+            self._carry += self.scale
+            count = int(self._carry)
+            self._carry -= count
+            return [real_dt] * count
+
+        # O que sobra do arredondamento fica para o próximo quadro (o tempo não deriva).
+        total = real_dt * self.scale + self._carry
+        whole = int(total)
+        self._carry = total - whole
+        if whole <= 0:
+            return []
+        # No avanço rápido, o tempo é dividido em vários ticks, cada um no máximo do tamanho do real.
+        count = min(whole, max(1, math.ceil(self.scale)))
+        base, extra = divmod(whole, count)
+        return [base + 1 if i < extra else base for i in range(count)]
+
+    # --- Snapshots ---
+    def snapshot(self):
+        """Tempo de jogo e timers pendentes (os tratadores são registrados de novo pelos sistemas)."""
+        return {"now": self.now, "timers": [list(timer) for timer in sorted(self._timers)], "sequence": self._sequence}
+
+    def restore(self, data):
+        self.now = data["now"]
+        self._timers = [tuple(timer) for timer in data["timers"]]
+        heapq.heapify(self._timers)
+        self._sequence = data["sequence"]
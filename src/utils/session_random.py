@@ -0,0 +1,31 @@
+import random
+
+class SessionRandom:
+    """
+    Agrupa os geradores de números aleatórios de uma sessão de jogo.
+    Cada sistema sorteia de seu próprio fluxo (stream), todos derivados de uma única
+    semente, o que torna a partida reproduzível. Os fluxos cosméticos (partículas,
+    tremor de tela, sons) são separados dos de jogabilidade, de modo que desativar
+    efeitos visuais não altera a simulação.
+
+    Os fluxos são ressemeados no início de cada "época" (um número fixo de ticks).
+    Assim, o estado aleatório em qualquer início de época depende só da semente e
+    do índice da época, e um snapshot da partida não precisa armazená-lo.
+    """
+    # Fluxos que influenciam a simulação (posições, timers, spawns).
+    GAMEPLAY_STREAMS = ("asteroids", "spawn", "ufo", "powerups")
+    # Fluxos puramente visuais/sonoros.
+    COSMETIC_STREAMS = ("particles", "shake", "sfx")
+
+    def __init__(self, seed=None):
+        # Sem semente explícita, sorteia uma a partir da entropia do sistema.
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+        for name in self.GAMEPLAY_STREAMS + self.COSMETIC_STREAMS:
+            setattr(self, name, random.Random())
+        self.start_epoch(0)
+
+    def start_epoch(self, epoch):
+        """Ressemeia todos os fluxos (no próprio objeto, preservando referências) para a época informada."""
+        # Semear com uma string é determinístico entre execuções (não depende do hash do Python).
+        for name in self.GAMEPLAY_STREAMS + self.COSMETIC_STREAMS:
+            getattr(self, name).seed(f"{self.seed}:{name}:{epoch}")
@@ -0,0 +1,160 @@
+import math
+import numpy as np
+from src import settings
+from src.utils.broadphase import wrap_delta
+
+class SpatialIndex:
+    """
+    Consultas de vizinhança ("qual o alvo mais próximo?") sobre os asteroides e UFOs vivos,
+    com distâncias no toro da tela. Usado pela nave de apoio e pelo piloto automático, e
+    disponível para qualquer entidade que mire sozinha.
+
+    Os asteroides ficam em uma grade uniforme de células (listas de slots do AsteroidField).
+    A grade é mantida de forma incremental: antes de uma consulta, se o campo mudou desde a
+    anterior (ver AsteroidField.generation), as células são recalculadas em lote e só os
+    slots que trocaram de célula (ou nasceram, ou morreram) são movidos. Os UFOs são poucos
+    e entram sempre, por varredura.
+
+    - nearest(): os k mais próximos. Percorre anéis de células em volta da origem, do mais
+      próximo para o mais distante, e para quando nenhum anel restante pode ter alguém mais
+      perto que o k-ésimo já encontrado.
+    - within(): todos a menos de um raio, visitando só as células que o raio alcança.
+
+    Os resultados são tuplas (distância, sprite, (dx, dy)), com (dx, dy) o deslocamento da
+    origem até o alvo pelo caminho mais curto, em ordem crescente de distância.
+    """
+    def __init__(self, asteroid_field, ufos, cell_size=settings.SPATIAL_CELL):
+        self.field = asteroid_field
+        self.ufos = ufos
+        self.nx = max(1, int(settings.SCREEN_WIDTH // cell_size))
+        self.ny = max(1, int(settings.SCREEN_HEIGHT // cell_size))
+        self.cell_w = settings.SCREEN_WIDTH / self.nx
+        self.cell_h = settings.SCREEN_HEIGHT / self.ny
+        self.cells = [set() for _ in range(self.nx * self.ny)]
+        self.cell_of = np.full(0, -1, dtype=np.int64)  # Célula atual de cada slot (-1 = fora do índice)
+        self.generation = None  # Geração do campo na última atualização
+        self.rings = self._build_rings()
+
+    # --- Manutenção ---
+    def refresh(self):
+        """Atualiza as células dos asteroides que mudaram desde a última consulta."""
+        field = self.field
+        if field.generation == self.generation:
+            return
+        self.generation = field.generation
+        n = field.count
+        if len(self.cell_of) < n:
+            self.cell_of = np.concatenate([self.cell_of, np.full(field.capacity - len(self.cell_of), -1, dtype=np.int64)])
+
+        pos = field.pos[:n]
+        cx = (np.mod(pos[:, 0], settings.SCREEN_WIDTH) // self.cell_w).astype(np.int64) % self.nx
+        cy = (np.mod(pos[:, 1], settings.SCREEN_HEIGHT) // self.cell_h).astype(np.int64) % self.ny
+        new_cells = np.where(field.alive[:n], cx * self.ny + cy, -1)
+
+        old_cells = self.cell_of[:n]
+        moved = np.flatnonzero(new_cells != old_cells)
+        for slot, old, new in zip(moved.tolist(), old_cells[moved].tolist(), new_cells[moved].tolist()):
+            if old >= 0:
+                self.cells[old].discard(slot)
+            if new >= 0:
+                self.cells[new].add(slot)
+        old_cells[moved] = new_cells[moved]
+
+    def _build_rings(self):
+        """
+        Deslocamentos de célula agrupados em anéis (distância de Chebyshev no toro). Cada
+        célula aparece uma única vez, mesmo quando a grade é pequena e os anéis dão a volta.
+        """
+        rings = {}
+        for dx in range(self.nx):
+            for dy in range(self.ny):
+                ring = max(min(dx, self.nx - dx), min(dy, self.ny - dy))
+                rings.setdefault(ring, []).append((dx, dy))
+        return [np.array(rings[ring]) for ring in sorted(rings)]
+
+    # --- Consultas ---
+    def nearest(self, position, k=1, max_distance=math.inf, include_ufos=True):
+        """Os 'k' alvos mais próximos de 'position' (até 'max_distance')."""
+        self.refresh()
+        origin = np.array((position[0], position[1]), dtype=float)
+        cx, cy = self._cell(origin)
+        step = min(self.cell_w, self.cell_h)
+
+        slots, distances, deltas = [], np.empty(0), np.empty((0, 2))
+        for ring, offsets in enumerate(self.rings):
+            # Tudo além deste anel está a pelo menos (ring - 1) células de distância.
+            bound = max(ring - 1, 0) * step
+            if bound > max_distance or (len(slots) >= k and distances[k - 1] <= bound):
+                break
+            found = self._slots_in(cx, cy, offsets)
+            if not found:
+                continue
+            ring_deltas, ring_distances = self._measure(origin, found)
+            slots += found
+            distances = np.concatenate([distances, ring_distances])
+            deltas = np.concatenate([deltas, ring_deltas])
+            # Mantém só os k melhores até aqui, em ordem.
+            order = np.argsort(distances, kind='stable')[:k]
+            slots = [slots[i] for i in order.tolist()]
+            distances, deltas = distances[order], deltas[order]
+
+        results = self._results(slots, distances, deltas, max_distance)
+        if include_ufos:
+            results = sorted(results + self._ufos_within(origin, max_distance), key=lambda item: item[0])
+        return results[:k]
+
+    def within(self, position, radius, include_ufos=True):
+        """Todos os alvos a menos de 'radius' de 'position'."""
+        self.refresh()
+        origin = np.array((position[0], position[1]), dtype=float)
+        cx, cy = self._cell(origin)
+        reach = math.ceil(radius / min(self.cell_w, self.cell_h)) + 1  # Anéis que o raio alcança
+
+        found = []
+        for offsets in self.rings[:reach + 1]:
+            found += self._slots_in(cx, cy, offsets)
+        results = []
+        if found:
+            deltas, distances = self._measure(origin, found)
+            order = np.argsort(distances, kind='stable')
+            results = self._results([found[i] for i in order.tolist()], distances[order], deltas[order], radius)
+        if include_ufos:
+            results = sorted(results + self._ufos_within(origin, radius), key=lambda item: item[0])
+        return results
+
+    def _cell(self, origin):
+        cx = int(origin[0] % settings.SCREEN_WIDTH // self.cell_w) % self.nx
+        cy = int(origin[1] % settings.SCREEN_HEIGHT // self.cell_h) % self.ny
+        return cx, cy
+
+    def _slots_in(self, cx, cy, offsets):
+        """Slots dos asteroides nas células do anel em volta de (cx, cy)."""
+        keys = ((cx + offsets[:, 0]) % self.nx) * self.ny + (cy + offsets[:, 1]) % self.ny
+        found = []
+        for key in keys.tolist():
+            found += self.cells[key]
+        return found
+
+    def _measure(self, origin, slots):
+        """Deslocamentos (caminho mais curto no toro) e distâncias da origem até os slots."""
+        delta = self.field.pos[slots] - origin
+        delta[:, 0] = wrap_delta(delta[:, 0], settings.SCREEN_WIDTH)
+        delta[:, 1] = wrap_delta(delta[:, 1], settings.SCREEN_HEIGHT)
+        return delta, np.hypot(delta[:, 0], delta[:, 1])
+
+    def _results(self, slots, distances, deltas, max_distance):
+        sprites = self.field.sprites
+        return [(distance, sprites[slot], (dx, dy))
+                for slot, distance, (dx, dy) in zip(slots, distances.tolist(), deltas.tolist())
+                if distance <= max_distance]
+
+    def _ufos_within(self, origin, max_distance):
+        """UFOs vivos a até 'max_distance' (varredura: nunca há mais que alguns)."""
+        results = []
+        for ufo in self.ufos:
+            dx = float(wrap_delta(ufo.position.x - origin[0], settings.SCREEN_WIDTH))
+            dy = float(wrap_delta(ufo.position.y - origin[1], settings.SCREEN_HEIGHT))
+            distance = math.hypot(dx, dy)
+            if distance <= max_distance:
+                results.append((distance, ufo, (dx, dy)))
+        return results
@@ -0,0 +1,45 @@
+import pygame
+from src import settings
+
+class RotationCache:
+    """
+    Cache de imagens redimensionadas/rotacionadas e de suas máscaras de colisão.
+    Rotacionar uma superfície e recriar a máscara a cada frame é caro; com o ângulo
+    arredondado para múltiplos de ROTATION_CACHE_STEP, cada combinação é calculada uma
+    única vez e compartilhada, somente para leitura, por todas as entidades e sessões.
+    """
+    def __init__(self, step=settings.ROTATION_CACHE_STEP):
+        self.step = step
+        self.entries = {}
+        # Mantém as imagens de origem vivas, para que seus id() nunca sejam reutilizados.
+        self.sources = {}
+
+    def _pin(self, image):
+        key = id(image)
+        self.sources.setdefault(key, image)
+        return key
+
+    def scaled(self, image, size):
+        """Retorna a imagem redimensionada para 'size' (largura, altura)."""
+        key = ('scaled', self._pin(image), size)
+        surface = self.entries.get(key)
+        if surface is None:
+            surface = self.entries[key] = pygame.transform.scale(image, size)
+        return surface
+
+    def rotated(self, image, angle):
+        """Retorna (imagem rotacionada, máscara) para o ângulo arredondado ao passo do cache."""
+        quantized = int(round(angle / self.step)) * self.step % 360
+        key = ('rotated', self._pin(image), quantized)
+        entry = self.entries.get(key)
+        if entry is None:
+            rotated = pygame.transform.rotate(image, quantized)
+            entry = self.entries[key] = (rotated, pygame.mask.from_surface(rotated))
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+        self.sources.clear()
+
+# Instância única, compartilhada por todas as sessões do processo.
+rotation_cache = RotationCache()
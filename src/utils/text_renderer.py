@@ -10,6 +10,7 @@ class TextRenderer:
     def __init__(self, font_path):
         self.fonts = {}  # Dicionário para armazenar fontes já carregadas (cache).
         self.font_path = font_path
+        self.shadows = True  # Desligada nos níveis de qualidade mais baixos (ver QualityGovernor)
 
     def _get_font(self, size):
         """
@@ -31,11 +32,9 @@ class TextRenderer:
         # 1. Obter a fonte e renderizar as superfícies de texto e sombra.
         font = self._get_font(size)
         text_surface = font.render(text, True, color)
-        shadow_surface = font.render(text, True, (20, 20, 20))  # Cor escura para a sombra
         
-        # 2. Obter os retângulos para posicionamento.
+        # 2. Obter o retângulo para posicionamento.
         text_rect = text_surface.get_rect()
-        shadow_rect = shadow_surface.get_rect()
         
         # 3. Ajustar a posição do retângulo do texto principal com base no alinhamento.
         if align == "center":
@@ -47,11 +46,10 @@ class TextRenderer:
         elif align == "left":
             text_rect.midleft = (x, y)  # Alinha o centro vertical com o 'y' fornecido.
         
-        # 4. Posicionar a sombra com um pequeno deslocamento em relação ao texto principal.
-        shadow_rect.topleft = (text_rect.left + 3, text_rect.top + 3)
-
-        # 5. Desenhar a sombra primeiro, depois o texto por cima.
-        screen.blit(shadow_surface, shadow_rect)
+        # 4. Desenhar a sombra (se ativa) com um pequeno deslocamento, depois o texto por cima.
+        if self.shadows:
+            shadow_surface = font.render(text, True, (20, 20, 20))  # Cor escura para a sombra
+            screen.blit(shadow_surface, (text_rect.left + 3, text_rect.top + 3))
         screen.blit(text_surface, text_rect)
         
         return text_rect
\ No newline at end of file
@@ -0,0 +1,33 @@
+import numpy as np
+from src import settings
+from src.entities.asteroid_field import AsteroidField
+
+RADIUS = settings.ASTEROID_SIZES[2]
+
+def _field(*asteroids):
+    """Campo com um asteroide por (posição, velocidade), todos de tamanho médio."""
+    field = AsteroidField()
+    slots = [field.acquire(None, position, velocity, 0, 0, RADIUS) for position, velocity in asteroids]
+    return field, slots
+
+def test_entering_asteroid_does_not_collide_across_the_seam():
+    # Um entra pela borda esquerda (ainda fora da tela); o outro está na borda direita.
+    # Pelo toro estariam a 10 px, mas o que entra ainda não segue o toro.
+    field, (entering, edge) = _field(((-20, 360), (1, 0)), ((settings.SCREEN_WIDTH - 10, 360), (-1, 0)))
+    assert field.entering[entering] and not field.entering[edge]
+
+    slots, _ = field.collide()
+
+    assert len(slots) == 0
+    assert np.array_equal(field.pos[entering], (-20, 360))
+    assert np.array_equal(field.pos[edge], (settings.SCREEN_WIDTH - 10, 360))
+    assert np.array_equal(field.vel[entering], (1, 0))
+
+def test_asteroids_on_screen_collide_across_the_seam():
+    # Os mesmos 10 px pelo toro, agora com os dois dentro da tela: o contato atravessa a borda.
+    field, (left, right) = _field(((5, 360), (-1, 0)), ((settings.SCREEN_WIDTH - 5, 360), (1, 0)))
+
+    slots, _ = field.collide()
+
+    assert sorted(slots.tolist()) == [left, right]
+    assert field.vel[left][0] > 0 and field.vel[right][0] < 0